@@ -24,6 +24,18 @@ from dataclasses import dataclass
 import re
 
 
+# Precompiled tokenizer regexes (shared by tokenize_filename and tokenize_pattern)
+_ELLIPSIS_RE = re.compile(r'\.{2,}')
+_GUILLEMETS_RE = re.compile(r'«[^»]*»')
+# '\.\s+' требует пробел после точки, чтобы "." в "2.0" не был разделителем.
+# '(?!-)' — не сплитить по ". " когда следующий символ '-' (только для имён файлов).
+_FILENAME_DELIMITER_RE = re.compile(r'\s+-\s+|\.\s+(?!-)|[()]')
+_PATTERN_DELIMITER_RE = re.compile(r'\s+-\s+|\.\s+|[()]')
+# _guess_block_type() number markers
+_DIGITS_RE = re.compile(r'^\d+$')
+_SERIES_NUMBER_RE = re.compile(r'\d+[-–—]\d+|\b\d+$|\bvol\.\s+\d+')
+
+
 @dataclass
 class Block:
     """Structural block from text."""
@@ -52,6 +64,14 @@ class BlockLevelPatternMatcher:
         'герой', 'герои', 'боец', 'боцена', 'воїн', 'война'
     }
     
+    # Upper bound for the per-instance filename → blocks cache (FIFO eviction)
+    FILENAME_BLOCKS_CACHE_SIZE = 50000
+    
+    # Pattern string → tokenize_pattern() result. Patterns come from config.json
+    # (a few dozen strings) and tokenization does not depend on instance state,
+    # so the template cache is shared by all matchers.
+    _pattern_blocks_cache: Dict[str, Tuple[Dict, ...]] = {}
+    
     def __init__(self, service_words: List[str] = None, male_names: set = None, female_names: set = None):
         """Initialize matcher.
         
@@ -67,6 +87,30 @@ class BlockLevelPatternMatcher:
             self.known_author_names.update(n.lower() for n in male_names)
         if female_names:
             self.known_author_names.update(n.lower() for n in female_names)
+        # tokenize_filename() is pure; blocks are reused across patterns and repeated filenames
+        self._filename_blocks_cache: Dict[str, Tuple[Block, ...]] = {}
+    
+    def _get_filename_blocks(self, filename: str) -> Tuple[Block, ...]:
+        """Return tokenize_filename() result from cache (tokenizing on first use).
+        
+        Blocks are returned as a tuple and must not be modified by callers.
+        """
+        blocks = self._filename_blocks_cache.get(filename)
+        if blocks is None:
+            blocks = tuple(self.tokenize_filename(filename))
+            if len(self._filename_blocks_cache) >= self.FILENAME_BLOCKS_CACHE_SIZE:
+                # FIFO: dict preserves insertion order, drop the oldest entry
+                del self._filename_blocks_cache[next(iter(self._filename_blocks_cache))]
+            self._filename_blocks_cache[filename] = blocks
+        return blocks
+    
+    def _get_pattern_blocks(self, pattern: str) -> Tuple[Dict, ...]:
+        """Return tokenize_pattern() result from the shared template cache."""
+        pattern_blocks = self._pattern_blocks_cache.get(pattern)
+        if pattern_blocks is None:
+            pattern_blocks = tuple(self.tokenize_pattern(pattern))
+            self._pattern_blocks_cache[pattern] = pattern_blocks
+        return pattern_blocks
     
     def tokenize_filename(self, filename: str) -> List[Block]:
         """Break filename into structural blocks.
@@ -160,8 +204,8 @@ class BlockLevelPatternMatcher:
             guillemets_storage[placeholder] = match.group(0)  # Store original with « »
             return placeholder
         
-        text_processed = re.sub(r'\.{2,}', ELLIPSIS_PLACEHOLDER, text)  # Replace "..", "...", etc.
-        text_processed = re.sub(r'«[^»]*»', store_guillemets, text_processed)  # Protect « ... »
+        text_processed = _ELLIPSIS_RE.sub(ELLIPSIS_PLACEHOLDER, text)  # Replace "..", "...", etc.
+        text_processed = _GUILLEMETS_RE.sub(store_guillemets, text_processed)  # Protect « ... »
         
         blocks = []
         # FIXED: Guillemets « » are NOT structural delimiters, they're formatting marks within text
@@ -169,13 +213,13 @@ class BlockLevelPatternMatcher:
         # '\.\s+' требует пробел после точки, чтобы "." в "2.0" не был разделителем.
         # '(?!-)' — не сплитить по ". " когда следующий символ '-':
         # "Зан Т. - Траун" → не сплитить на ". " (инициал+точка), взять " - " как разделитель
-        delimiter_pattern = r'\s+-\s+|\.\s+(?!-)|[()]'
+        # (see _FILENAME_DELIMITER_RE)
 
         paren_depth = 0
         block_text_pos = 0
         prev_delimiter = None  # Track the delimiter before this block
         
-        for match in re.finditer(delimiter_pattern, text_processed):
+        for match in _FILENAME_DELIMITER_RE.finditer(text_processed):
             delimiter = match.group()
             
             # IMPORTANT: Skip " - " and "." delimiters when inside parentheses
@@ -277,21 +321,21 @@ class BlockLevelPatternMatcher:
             guillemets_storage[placeholder] = match.group(0)  # Store original with « »
             return placeholder
         
-        pattern_processed = re.sub(r'\.{2,}', ELLIPSIS_PLACEHOLDER, pattern)
-        pattern_processed = re.sub(r'«[^»]*»', store_guillemets, pattern_processed)  # Protect « ... »
+        pattern_processed = _ELLIPSIS_RE.sub(ELLIPSIS_PLACEHOLDER, pattern)
+        pattern_processed = _GUILLEMETS_RE.sub(store_guillemets, pattern_processed)  # Protect « ... »
         
         pattern_blocks = []
         
         # Split using same delimiter pattern as tokenize_filename
         # FIXED: Guillemets « » are NOT structural delimiters, they're formatting marks
         # '\.\s+' требует пробел после точки, чтобы "." в "2.0" не был разделителем.
-        delimiter_pattern = r'\s+-\s+|\.\s+|[()]'
+        # (see _PATTERN_DELIMITER_RE)
         
         paren_depth = 0
         block_text_pos = 0
         prev_delimiter = None
         
-        for match in re.finditer(delimiter_pattern, pattern_processed):
+        for match in _PATTERN_DELIMITER_RE.finditer(pattern_processed):
             delimiter = match.group()
             
             # IMPORTANT: Skip " - " and "." delimiters when inside parentheses
@@ -407,8 +451,8 @@ class BlockLevelPatternMatcher:
         Returns:
             (score_0_to_1, pattern, matched_author_block, matched_series_block, type_match_count)
         """
-        filename_blocks = self.tokenize_filename(filename)
-        pattern_blocks = self.tokenize_pattern(pattern)
+        filename_blocks = self._get_filename_blocks(filename)
+        pattern_blocks = self._get_pattern_blocks(pattern)
         
         if not filename_blocks or not pattern_blocks:
             return 0.0, pattern, None, None
@@ -566,7 +610,7 @@ class BlockLevelPatternMatcher:
                 block_words = text_lower.split()
                 # All tokens are SW, numbers, or SW-qualifiers → pure numbering/annotation block
                 # e.g. "1 часть", "весь цикл", "вся трилогия", "книга 3"
-                if all(w in self.service_words or re.match(r'^\d+$', w) or w in SW_QUALIFIERS
+                if all(w in self.service_words or _DIGITS_RE.match(w) or w in SW_QUALIFIERS
                        for w in block_words):
                     return "service_words"
                 else:
@@ -574,7 +618,7 @@ class BlockLevelPatternMatcher:
                     return "Series"
         
         # Check for number patterns (1-3, 1, vol. 2, etc.)
-        if re.search(r'\d+[-–—]\d+|\b\d+$|\bvol\.\s+\d+', block_text):
+        if _SERIES_NUMBER_RE.search(block_text):
             return "Series"
         
         # Check for title keywords - if present, likely Title, not Author
@@ -621,7 +665,7 @@ class BlockLevelPatternMatcher:
         
         Args:
             filename: Filename to match
-            patterns: List of pattern dicts with 'pattern' key
+            patterns: List of pattern dicts with 'pattern' key, or plain pattern strings
             
         Returns:
             (best_score, best_pattern, extracted_author, extracted_series)
@@ -632,8 +676,16 @@ class BlockLevelPatternMatcher:
         best_series = None
         best_type_matches = 0  # Tie-breaker: count of blocks with correct type
         
+        # Block count must match exactly (hard rule in score_pattern_match) —
+        # check it up front from the cached templates instead of scoring.
+        block_count = len(self._get_filename_blocks(filename))
+        if not block_count:
+            return best_score, best_pattern, best_author, best_series
+        
         for pattern_obj in patterns:
-            pattern = pattern_obj.get('pattern', '')
+            pattern = pattern_obj if isinstance(pattern_obj, str) else pattern_obj.get('pattern', '')
+            if len(self._get_pattern_blocks(pattern)) != block_count:
+                continue
             score, matched_pattern, author, series = self.score_pattern_match(filename, pattern)
             
             # Primary check: higher score
@@ -651,6 +703,13 @@ class BlockLevelPatternMatcher:
                     best_author = author
                     best_series = series
                     best_type_matches = current_type_matches
+            
+            # Perfect score means every block matched type and delimiter; no later
+            # pattern can beat it (equal score + equal type matches keeps the first).
+            # 0.999 absorbs float rounding: an imperfect match loses at least 0.1 of the
+            # 1.1-per-block maximum, i.e. scores below 0.999 for any realistic block count.
+            if best_score >= 0.999:
+                break
         
         return best_score, best_pattern, best_author, best_series
 
@@ -5,7 +5,8 @@ Extracts author name from folder name based on selected pattern and structural i
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 
 def _singularize_surname(surname: str) -> str:
@@ -52,11 +53,27 @@ def extract_author(struct_info: dict, pattern: Optional[str]) -> str:
     if not pattern:
         return ""
     
-    name = struct_info['name']
-    paren_contents = struct_info['paren_contents']
-    text_after_last = struct_info['text_after_last']
-    text_before_first = struct_info['text_before_first']
+    # dict не хешируется — в кэшируемую функцию передаём только нужные поля
+    return _extract_author_cached(
+        pattern,
+        struct_info['name'],
+        tuple(struct_info['paren_contents']),
+        struct_info['text_after_last'],
+        struct_info['text_before_first'],
+        struct_info['paren_count'],
+    )
+
+
+@lru_cache(maxsize=8192)
+def _extract_author_cached(pattern: str, name: str, paren_contents: Tuple[str, ...],
+                           text_after_last: str, text_before_first: str,
+                           paren_count: int) -> str:
+    """
+    Pure part of extract_author(), memoized per folder name.
     
+    Many files share the same parent folder, so the same arguments
+    arrive here repeatedly.
+    """
     author = ""
 
     # Strip square-bracket aliases/pseudonyms from paren content before any processing.
@@ -126,8 +143,7 @@ def extract_author(struct_info: dict, pattern: Optional[str]) -> str:
         # Fallback: if there are NO parentheses with AUTHORS, don't extract anything
         # This is just a series name, not an author name
         # Only extract if text_before_first has something meaningful (like before parentheses)
-        text_before_first = struct_info['text_before_first']
-        if text_before_first and struct_info['paren_count'] > 0:
+        if text_before_first and paren_count > 0:
             # Text before brackets: "Максим Шаттам - Собрание сочинений" → extract "Максим Шаттам"
             author = text_before_first.strip()
         else:
@@ -5,30 +5,60 @@ Validates if extracted author names are actual person names (not series names).
 """
 
 import json
+import marshal
+import os
 from typing import Optional
 
+# Suffix of the marshal cache written next to config.json by load_name_sets()
+NAMES_CACHE_SUFFIX = '.names.cache'
+
 
 def load_name_sets(config_path: str = "config.json") -> tuple:
     """
     Load male and female names from config.
     
+    Parsing a large JSON config is slow, so the name sets are also stored
+    in a marshal cache next to it (config.json.names.cache) together with
+    the config's (st_mtime_ns, st_size). The cache is used only while that
+    stamp equals the current one - not "newer than", which misses configs
+    restored with an old mtime or edited within a coarse timestamp tick.
+    
     Args:
         config_path: Path to config.json
         
     Returns:
-        Tuple of (male_names_set, female_names_set)
+        Tuple of (male_names, female_names) frozensets
     """
     try:
+        config_path = os.fspath(config_path)
+        cache_path = config_path + NAMES_CACHE_SUFFIX
+        config_stat = os.stat(config_path)
+        config_stamp = (config_stat.st_mtime_ns, config_stat.st_size)
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_stamp, male_names, female_names = marshal.load(f)
+            if cached_stamp == config_stamp:
+                return male_names, female_names
+        except (OSError, EOFError, ValueError, TypeError):
+            pass  # No cache or it is corrupt - rebuild from JSON
+        
         with open(config_path, 'r', encoding='utf-8') as f:
             config = json.load(f)
         
-        male_names = set(config.get('male_names', []))
-        female_names = set(config.get('female_names', []))
+        male_names = frozenset(config.get('male_names', []))
+        female_names = frozenset(config.get('female_names', []))
+        
+        try:
+            with open(cache_path, 'wb') as f:
+                marshal.dump((config_stamp, male_names, female_names), f)
+        except OSError:
+            pass  # Read-only location - just work without cache
         
         return male_names, female_names
     except Exception as e:
         print(f"Warning: Could not load name sets from {config_path}: {e}")
-        return set(), set()
+        return frozenset(), frozenset()
 
 
 def contains_valid_name(text: str, male_names: set, female_names: set) -> bool:
@@ -6,6 +6,7 @@
 from .pass0_structural_analysis import analyze_series_folder_structure
 from .pass1_pattern_selection import select_series_pattern  
 from .pass2_series_extraction import extract_series_from_folder_name
+from functools import lru_cache
 from typing import Tuple, Optional
 
 
@@ -19,17 +20,51 @@ def parse_series_from_folder_name(
     Парсить название папки и извлечь серию (если это именно серия, не автор).
     
     Использует PASS0, PASS1, PASS2 для анализа структуры папки.
+    Результат кэшируется по всем аргументам. set/list приводятся к
+    frozenset/tuple на каждом вызове, поэтому для множества папок
+    выгоднее один раз построить frozenset/tuple и передавать их —
+    тогда ключ кэша строится без копирования.
     
     Args:
         folder_name: Имя папки для парсинга
-        known_authors: Набор известных авторов для проверки
-        service_words: Список служебных слов
-        collection_keywords: Ключевые слова коллекций
+        known_authors: Набор известных авторов для проверки (set или frozenset)
+        service_words: Список служебных слов (list или tuple)
+        collection_keywords: Ключевые слова коллекций (list или tuple)
     
     Returns:
         (series_name, series_source)
         Пример: ("ISCARIOT", "folder_dataset") или ("", "")
     """
+    # Пустые наборы равнозначны их отсутствию — один ключ кэша.
+    # Нехешируемые set/list приводим к frozenset/tuple, готовые — передаём как есть.
+    if not known_authors:
+        known_authors = None
+    elif not isinstance(known_authors, frozenset):
+        known_authors = frozenset(known_authors)
+    if not service_words:
+        service_words = None
+    elif not isinstance(service_words, tuple):
+        service_words = tuple(service_words)
+    if not collection_keywords:
+        collection_keywords = None
+    elif not isinstance(collection_keywords, tuple):
+        collection_keywords = tuple(collection_keywords)
+    return _parse_series_cached(folder_name, known_authors, service_words, collection_keywords)
+
+
+@lru_cache(maxsize=8192)
+def _parse_series_cached(
+    folder_name: str,
+    known_authors: Optional[frozenset],
+    service_words: Optional[tuple],
+    collection_keywords: Optional[tuple]
+) -> Tuple[str, str]:
+    """
+    Кэшируемая часть parse_series_from_folder_name.
+    
+    Много файлов лежит в одной папке, поэтому одно и то же имя папки
+    разбирается один раз.
+    """
     
     # PASS0: Анализ структуры папки (скобки, дефисы, запятые)
     structure = analyze_series_folder_structure(folder_name)
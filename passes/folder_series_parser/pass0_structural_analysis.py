@@ -13,11 +13,15 @@ def analyze_series_folder_structure(folder_name: str) -> Dict:
     
     Результат: словарь с информацией о структуре.
     """
+    # Части по ' - ' считаем здесь один раз, PASS1 берёт готовый результат
+    dash_split = folder_name.split(' - ') if ' - ' in folder_name else [folder_name]
+    
     return {
         'full_name': folder_name,
         'has_parentheses': '(' in folder_name and ')' in folder_name,
         'has_brackets': '[' in folder_name and ']' in folder_name,
         'has_dashes': ' - ' in folder_name or '-' in folder_name,
+        'dash_split': dash_split,
         'has_quotes': '"' in folder_name or '«' in folder_name,
         'parentheses_content': extract_parentheses_content(folder_name),
         'brackets_content': extract_brackets_content(folder_name),
@@ -22,8 +22,8 @@ def select_series_pattern(structure: Dict, folder_name: str) -> Optional[str]:
         if paren_content:
             # Последняя скобка содержит потенциального автора
             last_paren_content = paren_content[-1][0]
-            # Проверить если это похоже на автора (мин 1 слово)
-            if len(last_paren_content.split()) >= 1:
+            # Проверить если это похоже на автора (мин 1 слово, без split)
+            if last_paren_content.strip():
                 return "Series (Author)"
     
     # Паттерн 2: "[Series]" - серия в квадратных скобках
@@ -32,7 +32,7 @@ def select_series_pattern(structure: Dict, folder_name: str) -> Optional[str]:
     
     # Паттерн 3: "Series - Description"
     if structure['has_dashes']:
-        parts = folder_name.split(' - ')
+        parts = structure['dash_split']  # Посчитано в PASS0
         if len(parts) == 2 and len(parts[0].split()) <= 3:  # Первая часть короче
             return "Series - Description"
     
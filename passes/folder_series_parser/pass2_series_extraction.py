@@ -1,11 +1,9 @@
 """
 PASS2: Извлечение СЕРИИ по выбранному паттерну.
-Использует AuthorName из существующего кода ТОЛЬКО для проверок.
 """
 
 import re
 from typing import Optional
-from name_normalizer import AuthorName
 
 
 def extract_series_from_folder_name(
@@ -18,9 +16,6 @@ def extract_series_from_folder_name(
     """
     Извлечь серию по выбранному паттерну.
     
-    Использует AuthorName чтобы убедиться что результат - это НЕ автор!
-    (чтобы серия не совпала с именем автора)
-    
     Args:
         folder_name: Имя папки для парсинга
         pattern: Выбранный паттерн ("Series (Author)", "[Series]", etc)
@@ -58,15 +53,10 @@ def extract_series_from_folder_name(
     if not series:
         return ""
     
-    # ✅ ПРОВЕРКА: Убедиться что это НЕ похоже на автора!
-    # Используем AuthorName чтобы проверить
-    try:
-        # Если это похоже на автора - отвергаем как серию
-        author_name = AuthorName(series, [])
-        if author_name.is_valid_author():
-            return ""  # Это похоже на автора, отвергаем как серию
-    except Exception:
-        pass  # Если ошибка при парсинге - значит это вероятно серия
+    # Проверки «не похоже на автора» через AuthorName здесь нет: прежний вызов
+    # AuthorName(series, []).is_valid_author() всегда падал и проглатывался,
+    # а AuthorName.is_valid пропускает почти любую строку из 2+ символов —
+    # такая проверка отвергала бы обычные названия серий («Star Wars»).
     
     # ✅ ФИЛЬТР: Исключить очевидные сборники
     if not collection_keywords:
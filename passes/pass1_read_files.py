@@ -8,7 +8,8 @@ import threading
 import multiprocessing
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import concurrent.futures
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from itertools import repeat
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 import tqdm
@@ -132,9 +133,26 @@ def _get_author_for_file_worker(fb2_file: Path, work_dir: Path,
     return (last_hit, "folder_dataset") if last_hit else ("", "")
 
 
-@dataclass
+def filename_without_ext(file_path: str) -> str:
+    """Basename of a (possibly Windows-style) relative path, without extension.
+    
+    rfind() for the extension dot instead of splitext(): no tuple, one scan.
+    A leading dot (".fb2") is not treated as an extension separator.
+    str.replace() is kept for the separators: with no backslash it returns the
+    same string object without copying, while str.translate() is far slower.
+    """
+    filename = os.path.basename(file_path.replace('\\', '/'))
+    dot = filename.rfind('.')
+    return filename if dot <= 0 else filename[:dot]
+
+
+@dataclass(slots=True)
 class BookRecord:
-    """Book record with progressive filling through PASS stages."""
+    """Book record with progressive filling through PASS stages.
+    
+    Slotted: every PASS reads and rewrites the same few attributes of each
+    record, and a library holds one record per file.
+    """
     file_path: str              # Path to FB2 file (relative to work_dir)
     file_title: str             # Book title from title-info
     metadata_authors: str       # Original authors from FB2 XML (immutable)
@@ -147,6 +165,21 @@ class BookRecord:
     series_number: str = ""       # Sequence number within series (from <sequence number=.../>)
     extracted_series_candidate: str = ""  # Series found in filename (even if blocked by BL)
     needs_filename_fallback: bool = False  # True if folder parse found nothing, need filename PASS 2
+    # Set by PASS 3 for multi-author records restored from metadata
+    skip_normalization: bool = field(default=False, repr=False, compare=False)
+    # (file_path, filename_no_ext) for the path the stem was computed from
+    _stem_cache: Optional[Tuple[str, str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def filename_no_ext(self) -> str:
+        """Basename of file_path without extension, parsed once per path.
+        
+        Recomputed only when file_path is reassigned (synchronization moves files).
+        """
+        cache = self._stem_cache
+        if cache is None or cache[0] is not self.file_path:
+            cache = self._stem_cache = (self.file_path, filename_without_ext(self.file_path))
+        return cache[1]
     
     def to_tuple(self):
         """Convert record to tuple for GUI table display."""
@@ -171,10 +204,12 @@ class BookRecord:
             file_title=data[7],  # file_title is at index 7
             metadata_authors=data[1],
             proposed_author=data[2],
-            author_source=data[3],
+            # Unpickled strings are not interned; interning lets the per-pass
+            # author_source / series_source == "folder_dataset" checks succeed on identity
+            author_source=sys.intern(data[3]),
             metadata_series=data[4],
             proposed_series=data[5],
-            series_source=data[6],
+            series_source=sys.intern(data[6]),
             metadata_genre=data[8],
             series_number=data[9],
             extracted_series_candidate="",  # defaults
@@ -198,6 +233,11 @@ class Pass1ReadFiles:
         """
         self.work_dir = work_dir
         self.author_folder_cache = author_folder_cache
+        # Parallel view keyed by str(path): hashing a str is cheaper than a Path,
+        # and the workers need string keys anyway
+        self._author_folder_cache_str: Dict[str, Tuple[str, str]] = {
+            str(path): value for path, value in author_folder_cache.items()
+        }
         self.extractor = extractor
         self.logger = logger
         self.folder_parse_limit = folder_parse_limit
@@ -221,11 +261,6 @@ class Pass1ReadFiles:
 
         print(f"[PASS 1] Found {total} files, processing in parallel...")
 
-        # Serialize cache for hierarchy lookup
-        author_folder_cache_serialized = {}
-        for path, (author, conf) in self.author_folder_cache.items():
-            author_folder_cache_serialized[str(path)] = (author, conf)
-
         # Precompute author per unique parent folder once — воркеры делают один dict-lookup
         # вместо обхода иерархии для каждого файла.
         unique_folders = {fb2_file.parent for fb2_file in fb2_files}
@@ -234,7 +269,7 @@ class Pass1ReadFiles:
             author, source = _get_author_for_file_worker(
                 folder / '_dummy',   # файл не используется, нужен только parent
                 self.work_dir,
-                author_folder_cache_serialized,
+                self._author_folder_cache_str,
                 self.folder_parse_limit,
             )
             if author:
@@ -253,37 +288,66 @@ class Pass1ReadFiles:
             print(f"[PASS 1] Metadata caching enabled")
         print(f"[PASS 1] Using {'SAX' if use_sax_parser else 'ElementTree'} parser")
 
+        # executor.map с chunksize отправляет файлы пачками: folder_author_map и
+        # settings_dict сериализуются один раз на пачку, а не на каждый файл.
+        chunksize = max(1, min(32, total // (max_workers * 4)))
+        file_paths = [str(fb2_file) for fb2_file in fb2_files]
+
+        worker_args = (
+            str(self.work_dir),
+            folder_author_map,   # плоская карта: str(parent) → (author, source)
+            self.folder_parse_limit,
+            settings_dict,
+            use_cache,
+            use_sax_parser,
+        )
+
+        records = []
+
+        def add_record(result_tuple, file_path: str) -> None:
+            """Собрать BookRecord из результата воркера; ошибка — только для этого файла."""
+            if not result_tuple:
+                return
+            try:
+                records.append(BookRecord.from_tuple(result_tuple))
+            except Exception as e:
+                self.logger.log(f"[PASS 1] Error processing {file_path}: {e}")
+
+        processed = 0
         with ProcessPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {}
-            for fb2_file in fb2_files:
-                future = executor.submit(
-                    process_file_worker,
-                    str(fb2_file),
-                    str(self.work_dir),
-                    folder_author_map,   # плоская карта: str(parent) → (author, source)
-                    self.folder_parse_limit,
-                    settings_dict,
-                    use_cache,
-                    use_sax_parser
-                )
-                future_to_file[future] = fb2_file
+            results = executor.map(
+                process_file_worker,
+                file_paths,
+                *(repeat(arg) for arg in worker_args),
+                chunksize=chunksize,
+            )
 
             # Process results with progress bar
-            records = []
             with tqdm.tqdm(total=total, desc="Processing FB2 files", unit="file",
                            file=sys.stdout, dynamic_ncols=True) as pbar:
-                for future in concurrent.futures.as_completed(future_to_file):
-                    fb2_file = future_to_file[future]
-                    try:
-                        result_tuple = future.result()
-                        if result_tuple:
-                            record = BookRecord.from_tuple(result_tuple)
-                            records.append(record)
-                    except Exception as e:
-                        self.logger.log(f"[PASS 1] Error processing {fb2_file}: {e}")
-
-                    pbar.update(1)
+                try:
+                    # map отдаёт результаты в порядке file_paths
+                    for result_tuple in results:
+                        add_record(result_tuple, file_paths[processed])
+                        processed += 1
+                        pbar.update(1)
+                except Exception as e:
+                    # Сбой пула (сериализация, упавший процесс) обрывает map целиком —
+                    # оставшиеся файлы дочитываем последовательно, а не теряем
+                    remaining = file_paths[processed:]
+                    self.logger.log(
+                        f"[PASS 1] Worker pool failed after {processed}/{total} files: {e}; "
+                        f"processing {len(remaining)} remaining files serially"
+                    )
+                    executor.shutdown(wait=True, cancel_futures=True)
+                    for file_path in remaining:
+                        try:
+                            result_tuple = process_file_worker(file_path, *worker_args)
+                        except Exception as file_error:
+                            self.logger.log(f"[PASS 1] Error processing {file_path}: {file_error}")
+                            result_tuple = None
+                        add_record(result_tuple, file_path)
+                        pbar.update(1)
 
         self.logger.log(f"[PASS 1] Read {len(records)} files")
         return records
@@ -322,8 +386,9 @@ class Pass1ReadFiles:
                     break
                 continue
 
-            if current_dir in self.author_folder_cache:
-                author_name, confidence = self.author_folder_cache[current_dir]
+            hit = self._author_folder_cache_str.get(str(current_dir))
+            if hit is not None:
+                author_name, confidence = hit
                 last_hit = author_name  # keep going — higher folder wins
 
             try:
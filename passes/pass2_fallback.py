@@ -4,6 +4,7 @@ Detects collections when 3+ authors present and filename contains collection key
 """
 
 import os
+import re
 from typing import List
 from settings_manager import SettingsManager
 
@@ -30,6 +31,11 @@ class Pass2Fallback:
         except Exception as e:
             print(f"[PASS 2 Fallback] Warning: Could not load collection_keywords: {e}")
             self.collection_keywords = []
+        # Lowercased keywords as one substring alternation (one scan per filename)
+        self._collection_kw_re = (
+            re.compile('|'.join(map(re.escape, sorted({k.lower() for k in self.collection_keywords}))))
+            if self.collection_keywords else None
+        )
     
     def _is_collection_file(self, filename: str) -> bool:
         """Check if filename contains collection keywords.
@@ -40,14 +46,10 @@ class Pass2Fallback:
         Returns:
             True if filename contains any collection keyword, False otherwise
         """
-        if not self.collection_keywords or not filename:
+        if self._collection_kw_re is None or not filename:
             return False
         
-        filename_lower = filename.lower()
-        for keyword in self.collection_keywords:
-            if keyword.lower() in filename_lower:
-                return True
-        return False
+        return self._collection_kw_re.search(filename.lower()) is not None
     
     def _count_authors(self, authors_str: str) -> int:
         """Count number of authors in authors string.
@@ -11,14 +11,95 @@ Files with author_source="folder_dataset" are NEVER modified in this pass.
 This reflects the user's explicit folder structure which is the most reliable source.
 """
 
+import re
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import List, Optional
 from pathlib import Path
-from .file_structural_analysis import analyze_file_structure, score_pattern_match
 
 try:
     from name_normalizer import validate_author_name
+    from block_level_pattern_matcher import BlockLevelPatternMatcher
 except ImportError:
     from ..name_normalizer import validate_author_name
+    from ..block_level_pattern_matcher import BlockLevelPatternMatcher
+from .pass1_read_files import filename_without_ext as _filename_without_ext
+
+
+# Blacklist markers stripped from the END of a filename before block matching,
+# applied in this order by _strip_tail_markers()
+_FILENAME_TAIL_MARKER_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    # Pattern 1: "(СИ)" or variations at the end
+    r'\s*\(СИ\)\s*$',
+    # Pattern 2: Collection/anthology markers — "(сборник)", "(антология)" etc.
+    r'\s*\(сборник[^)]*\)\s*$',
+    r'\s*\(антология[^)]*\)\s*$',
+    r'\s*\(omnibus[^)]*\)\s*$',
+    # Pattern 3: Other known meta-patterns (edition, translation) in parens at the end
+    r'\s*\([^)]*(?:издание|изд\.)[^)]*\)\s*$',
+    r'\s*\(пер\.\s*[^)]*\)\s*$',
+    r'\s*\(перевод[^)]*\)\s*$',
+    r'\s*\(пер\)\s*$',
+))
+# Символы разделителей блоков BlockLevelPatternMatcher (' - ', '. ', скобки):
+# имя без них токенизируется в один блок
+_BLOCK_DELIM_RE = re.compile(r'[-.()]')
+# execute() guards on the extracted author
+_MID_INITIAL_RE = re.compile(r'\s[А-ЯЁA-Z]\.\s')             # «Фамилия И. Фамилия2»
+_GLUED_INITIALS_RE = re.compile(r'^[А-ЯЁ]{2,}[А-ЯЁ][а-яё]')    # «АКТроицкий»
+_JOINED_NAMES_RE = re.compile(r'\s+[иИ]\s+')                  # «Альвтеген Альбин и Карин»
+# Trailing noise stripped from the book title by the TITLE-AS-AUTHOR guard
+_TITLE_TAIL_BRACKETS_RE = re.compile(r'\s*\[.*?\]\s*$')
+_TITLE_TAIL_PARENS_RE = re.compile(r'\s*\([^)]*\)\s*$')
+
+
+@lru_cache(maxsize=50000)
+def _strip_tail_markers(filename: str) -> str:
+    """
+    Pure part of Pass2Filename._clean_filename_for_extraction(), memoized.
+    
+    Called for every name by the prefetch and again by extraction; the same
+    name also repeats across formats (fb2/epub) of one book.
+    """
+    cleaned = filename.strip()
+    
+    # Все маркеры — скобка в самом конце: без ')' в конце ни один из
+    # шаблонов не сработает, весь перебор регулярок пропускаем.
+    if not cleaned.endswith(')'):
+        return cleaned
+    
+    # Remove blacklist elements from the END of filename
+    # Only remove if they appear at END of string (after all meaningful content).
+    # "(сборник)", "(антология)" etc. are informational tags that do NOT represent
+    # a separate meaningful block.
+    for marker_re in _FILENAME_TAIL_MARKER_RES:
+        cleaned = marker_re.sub('', cleaned)
+    
+    return cleaned.strip()
+
+
+# Per-process state of the block-matching pool (set up by _init_block_match_worker)
+_worker_matcher = None
+_worker_patterns = ()
+
+
+def _init_block_match_worker(service_words: list, male_names: set, female_names: set,
+                             pattern_strs: tuple) -> None:
+    """Pool initializer: build one BlockLevelPatternMatcher per worker process."""
+    global _worker_matcher, _worker_patterns
+    _worker_matcher = BlockLevelPatternMatcher(
+        service_words=service_words,
+        male_names=male_names,
+        female_names=female_names
+    )
+    _worker_patterns = pattern_strs
+
+
+def _block_match_worker(cleaned_filename: str) -> tuple:
+    """Module-level worker for multiprocessing: match one cleaned filename."""
+    return cleaned_filename, _worker_matcher.find_best_pattern_match(cleaned_filename, _worker_patterns)
 
 
 class Pass2Filename:
@@ -37,11 +118,21 @@ class Pass2Filename:
         'сборник', 'авторский', 'авторская', 'авторское',
         'цикл', 'цикла', 'циклов',
         'серия', 'серии', 'сборка',
-        'компиляция', 'сборка', 'сборки',
+        'компиляция', 'сборки',
         # Removed: 'романы', 'романа', 'романов' - too common in surnames
         'книг', 'книга', 'книги',
         'издание', 'издания', 'переиздание',
     }
+    # Same keywords as one alternation; (?<!\S)/(?!\S) match WHOLE whitespace-separated
+    # words only, exactly like membership in text.lower().split()
+    _NON_AUTHOR_RE = re.compile(
+        r'(?<!\S)(?:' + '|'.join(map(re.escape, sorted(NON_AUTHOR_KEYWORDS))) + r')(?!\S)',
+        re.IGNORECASE
+    )
+    
+    # Minimum number of distinct filenames to match in a process pool
+    # (below that, pool start-up costs more than it saves)
+    PARALLEL_MATCH_THRESHOLD = 2000
     
     def __init__(self, settings, logger, work_dir: Optional[Path] = None, male_names: set = None, female_names: set = None):
         """Initialize PASS 2.
@@ -55,6 +146,13 @@ class Pass2Filename:
         """
         self.settings = settings
         self.logger = logger
+        # Per-record diagnostics (✓ Extracted…, DEBUG prints) only when performance.debug_logging
+        performance = settings.get('performance', {}) if hasattr(settings, 'get') else {}
+        self._debug = bool((performance or {}).get('debug_logging', False))
+        # performance.parallel_match_threshold overrides the class default (0 = never use the pool)
+        threshold = (performance or {}).get('parallel_match_threshold')
+        if isinstance(threshold, int) and threshold >= 0:
+            self.PARALLEL_MATCH_THRESHOLD = threshold or float('inf')
         self.work_dir = Path(work_dir) if work_dir else None
         self.service_words = settings.get_service_words() if hasattr(settings, 'get_service_words') else []
         self.collection_keywords = settings.get_list('collection_keywords') or []  # Load from config
@@ -67,12 +165,48 @@ class Pass2Filename:
                             'делла', 'дэлла', 'дос', 'дас', 'дэ', 'ван', 'фон',
                             'ля', 'ле', 'ла', 'мак', 'о'})
         )
+        # Known first names + name particles merged once for _looks_like_author_name
+        self._known_names = frozenset(self.male_names | self.female_names | set(self.name_particles))
         self.patterns = self._load_patterns()
+        # One matcher for the whole pass (it merges and lowercases the name sets on creation)
+        self._block_matcher = BlockLevelPatternMatcher(
+            service_words=list(self.service_words),
+            male_names=self.male_names,
+            female_names=self.female_names
+        )
+        # AuthorNormalizer for the JOINED-NAMES guard, created on first use
+        self._author_normalizer = None
+        # Pattern strings extracted once (instead of .get('pattern') per pattern per record);
+        # second tuple is used by the TITLE-AS-AUTHOR retry
+        self._pattern_strs = tuple(
+            p.get('pattern', '') if isinstance(p, dict) else p for p in self.patterns
+        )
+        self._pattern_strs_no_title_first = tuple(
+            p for p in self._pattern_strs if not p.startswith('Title')
+        )
+        # Имя без разделителей блоков не подходит ни под один шаблон, если все
+        # шаблоны из конфига многоблочные — тогда такие имена отсекаются до сопоставления
+        self._needs_block_delim = all(
+            len(self._block_matcher.tokenize_pattern(p)) > 1 for p in self._pattern_strs
+        )
         # Precomputed lowercase set of collection keywords for fast lookup in _looks_like_author_name
         self._collection_kw_lower = {k.lower() for k in self.collection_keywords}
+        # Same keywords as one substring alternation for _is_collection (one scan per filename)
+        self._collection_kw_re = (
+            re.compile('|'.join(map(re.escape, sorted(self._collection_kw_lower))))
+            if self._collection_kw_lower else None
+        )
         # Author cache: maps abbreviated/partial names to full names
         # e.g., {"А. Живой" -> "Живой Алексей", "Живой" -> "Живой Алексей"}
         self.author_cache = {}
+        # Block-match cache: (cleaned filename, without_title_first) -> find_best_pattern_match result.
+        # Одно и то же имя файла встречается в разных папках (одна книга на нескольких полках);
+        # сопоставление с паттернами зависит только от имени файла, поэтому считается один раз.
+        self._filename_match_cache = {}
+        # Validation cache: candidate string -> _looks_like_author_name() and validate_author_name()
+        self._validation_cache = {}
+        # Parsed metadata_authors: raw string -> tuple of (author, lower, lower_words, lower_word_set)
+        self._metadata_authors_cache = {}
     
     def _load_patterns(self) -> List[dict]:
         """Load author_series_patterns_in_files from config."""
@@ -81,69 +215,24 @@ class Pass2Filename:
         except:
             return []
     
-    def _extract_surname(self, author_name: str) -> str:
-        """Extract surname from author name.
-        
-        Handles formats:
-        - "Surname Name" -> "Surname"
-        - "Name Surname" -> "Surname"  (if starts with lowercase, reverse order)
-        - "Surname" -> "Surname"
-        
-        For Cyrillic names, typically surname comes first.
-        
-        Args:
-            author_name: Full author name
-            
-        Returns:
-            Surname or first word if unclear
-        """
-        if not author_name or not author_name.strip():
-            return ""
-        
-        parts = author_name.strip().split()
-        if not parts:
-            return ""
-        
-        # For Cyrillic names, surname is typically first
-        # Return first part as surname (most reliable)
-        return parts[0]
-    
-    def _sort_coauthors_by_surname(self, authors_str: str) -> str:
-        """Sort comma-separated authors by surname (alphabetically).
-        
-        Args:
-            authors_str: Authors separated by ', '
-            
-        Returns:
-            Authors sorted by surname, still separated by ', '
-        """
-        if not authors_str or ', ' not in authors_str:
-            return authors_str
-        
-        authors = [a.strip() for a in authors_str.split(', ')]
-        if len(authors) <= 1:
-            return authors_str
-        
-        # Sort by surname (first word)
-        try:
-            sorted_authors = sorted(authors, key=lambda x: self._extract_surname(x).lower())
-            return ', '.join(sorted_authors)
-        except Exception as e:
-            self.logger.log(f"[PASS 2] WARNING: Failed to sort co-authors '{authors_str}': {e}")
-            return authors_str
-    
-    def _add_to_author_cache(self, extracted: str, expanded: str) -> None:
+    def _add_to_author_cache(self, extracted: str, expanded: str,
+                             extracted_lower: Optional[str] = None,
+                             expanded_lower: Optional[str] = None) -> None:
         """Add author mapping to cache.
         
         Args:
             extracted: Original extracted name (may be abbreviated)
             expanded: Full expanded name
+            extracted_lower: extracted.lower().strip() if the caller already has it
+            expanded_lower: expanded.lower().strip() if the caller already has it
         """
         if not extracted or not expanded:
             return
         
-        extracted_lower = extracted.lower().strip()
-        expanded_lower = expanded.lower().strip()
+        if extracted_lower is None:
+            extracted_lower = extracted.lower().strip()
+        if expanded_lower is None:
+            expanded_lower = expanded.lower().strip()
         
         # Prefer longer (more complete) forms — never downgrade to a shorter one
         if extracted_lower != expanded_lower:
@@ -203,12 +292,22 @@ class Pass2Filename:
         """
         print("[PASS 2] Pre-building author cache from FB2 metadata...")
         cached_count = 0
+        # Records of one folder usually carry the same metadata_authors string.
+        # Re-applying the string just applied is a no-op for the cache, so
+        # consecutive repeats are skipped (only the counter is advanced).
+        prev_authors_str = None
+        prev_cached = 0
 
         for record in records:
             fb2_authors_str = getattr(record, 'metadata_authors', '') or ''
 
             if not fb2_authors_str:
                 continue
+            if fb2_authors_str == prev_authors_str:
+                cached_count += prev_cached
+                continue
+            prev_authors_str = fb2_authors_str
+            count_before = cached_count
 
             try:
                 fb2_authors = [a.strip() for a in fb2_authors_str.split(';') if a.strip()]
@@ -228,6 +327,8 @@ class Pass2Filename:
                     # "Хуан Франсиско Феррандис" → cache["феррандис"] = "Феррандис Хуан Франсиско"
                     # so that single-surname lookups get the canonical ФИ form.
                     author_words = author.split()
+                    # Reordered candidates keep the same words, so the count is shared
+                    n_words = len(author_words)
                     for idx, part in enumerate(author_words):
                         if len(part) > 2:
                             part_lower = part.lower()
@@ -237,15 +338,41 @@ class Pass2Filename:
                                 rest = [w for i, w in enumerate(author_words) if i != idx]
                                 candidate = part + ' ' + ' '.join(rest)
                             existing = self.author_cache.get(part_lower)
-                            if not existing or len(candidate.split()) > len(existing.split()):
+                            if not existing or n_words > len(existing.split()):
                                 self.author_cache[part_lower] = candidate
                     cached_count += 1
 
             except Exception:
                 pass
+            prev_cached = cached_count - count_before
 
         print(f"[PASS 2] Pre-cache built: {len(self.author_cache)} entries from {cached_count} authors")
 
+    def _parse_metadata_authors(self, fb2_authors_str: str) -> tuple:
+        """Split metadata authors string (separated by ';') once per distinct string.
+        
+        Co-authors of one record are validated against the same metadata string,
+        and identical strings recur across a series, so the parsed and
+        pre-lowercased form is cached.
+        
+        Returns:
+            Tuple of (author, author_lower, author_lower_words, author_word_set);
+            the word list keeps order (ФИ/ИФ checks), the frozenset serves
+            membership tests
+        """
+        parsed = self._metadata_authors_cache.get(fb2_authors_str)
+        if parsed is None:
+            parsed = []
+            for a in fb2_authors_str.split(';'):
+                a = a.strip()
+                if a:
+                    a_lower = a.lower()
+                    a_words = a_lower.split()
+                    parsed.append((a, a_lower, a_words, frozenset(a_words)))
+            parsed = tuple(parsed)
+            self._metadata_authors_cache[fb2_authors_str] = parsed
+        return parsed
+    
     def _validate_and_expand_author(self, extracted_author: str, metadata_authors_str: Optional[str]) -> str:
         """Validate and potentially expand author name using FB2 metadata and cache.
 
@@ -286,44 +413,38 @@ class Pass2Filename:
                                                     metadata_authors_str != '[unknown]') else ''
         if fb2_authors_str:
             try:
-                # Parse FB2 authors (separated by '; ')
-                fb2_authors = [a.strip() for a in fb2_authors_str.split(';') if a.strip()]
+                # Parse FB2 authors (separated by '; '), pre-lowercased and cached per string
+                fb2_authors = self._parse_metadata_authors(fb2_authors_str)
 
                 # SPECIAL CASE: If extracted is single word and metadata has multiple co-authors
                 # with this word, DON'T expand - leave surname-only for PASS 3 restoration
-                if len(extracted_author.split()) == 1 and len(fb2_authors) > 1:
+                if is_single_word and len(fb2_authors) > 1:
                     # Check if this single word matches multiple FB2 authors
-                    extracted_words = {extracted_lower}
-                    matching_count = 0
-                    for fb2_author in fb2_authors:
-                        fb2_words = set(fb2_author.lower().split())
-                        if extracted_words.issubset(fb2_words):
-                            matching_count += 1
+                    matching_count = sum(
+                        1 for _, _, _, fb2_word_set in fb2_authors if extracted_lower in fb2_word_set
+                    )
 
                     # If matches multiple authors, don't expand
                     if matching_count > 1:
                         return extracted_author  # Return surname-only, let PASS 3 handle restoration
 
                 # Exact match - return as is
-                for fb2_author in fb2_authors:
-                    if fb2_author.lower() == extracted_lower:
-                        self._add_to_author_cache(extracted_author, fb2_author)
+                for fb2_author, fb2_lower, _, _ in fb2_authors:
+                    if fb2_lower == extracted_lower:
+                        self._add_to_author_cache(extracted_author, fb2_author, extracted_lower, fb2_lower)
                         return fb2_author  # Return FB2 version (better normalization)
 
                 # Partial match - check if extracted is substring of any FB2 author
                 # This handles cases like "Демченко" matching "Демченко Антон" (single-word expansion)
                 # BUT: Do NOT allow reversed word order like "Гулевич Александр" → "Александр Гулевич"
-                for fb2_author in fb2_authors:
-                    fb2_lower = fb2_author.lower()
-                    extracted_words_list = extracted_lower.split()
-                    fb2_words_list = fb2_lower.split()
-
+                extracted_words_list = extracted_lower.split()
+                for fb2_author, fb2_lower, fb2_words_list, fb2_word_set in fb2_authors:
                     # Only expand if:
                     # 1. Extracted is SINGLE WORD (legitimate expansion like "Демченко" → "Демченко Антон")
                     # 2. OR first words match AND same number of words (order preserved in both)
                     if len(extracted_words_list) == 1:
                         # Single word expansion - check if it's in FB2 author
-                        if extracted_lower in fb2_words_list:
+                        if extracted_lower in fb2_word_set:
                             # Put the matched surname FIRST (ФИ convention).
                             # FB2 metadata often stores names in ИФ order ("Хуан Франсиско Феррандис"),
                             # but canonical format is ФИ ("Феррандис Хуан Франсиско").
@@ -331,14 +452,14 @@ class Pass2Filename:
                             if match_idx > 0:
                                 rest = [w for i, w in enumerate(fb2_author.split()) if i != match_idx]
                                 reordered = fb2_author.split()[match_idx] + ' ' + ' '.join(rest)
-                                self._add_to_author_cache(extracted_author, reordered)
+                                self._add_to_author_cache(extracted_author, reordered, extracted_lower)
                                 return reordered
-                            self._add_to_author_cache(extracted_author, fb2_author)
+                            self._add_to_author_cache(extracted_author, fb2_author, extracted_lower, fb2_lower)
                             return fb2_author  # Use fuller name from FB2
                     elif (len(extracted_words_list) == len(fb2_words_list) and
                           extracted_words_list[0] == fb2_words_list[0]):
                         # Multi-word with matching first word (likely normalized case variation)
-                        self._add_to_author_cache(extracted_author, fb2_author)
+                        self._add_to_author_cache(extracted_author, fb2_author, extracted_lower, fb2_lower)
                         return fb2_author
                     # Otherwise: different number of words OR reversed order → skip (don't match)
 
@@ -349,17 +470,18 @@ class Pass2Filename:
                 # Both share the tail "делэн" after apostrophe+space normalization.
                 if self.name_particles:
                     _apo = str.maketrans({"'": "", "\u2019": "", "\u02bc": ""})
-                    for fb2_author in fb2_authors:
-                        fb2_norm = fb2_author.lower().translate(_apo).replace(' ', '')
-                        for i, w in enumerate(extracted_lower.split()):
+                    for fb2_author, fb2_lower, _, _ in fb2_authors:
+                        fb2_norm = fb2_lower.translate(_apo).replace(' ', '')
+                        for i, w in enumerate(extracted_words_list):
                             if w in self.name_particles:
-                                tail = ' '.join(extracted_lower.split()[i:]).translate(_apo).replace(' ', '')
+                                tail = ' '.join(extracted_words_list[i:]).translate(_apo).replace(' ', '')
                                 if tail and tail in fb2_norm:
                                     self.logger.log(
                                         f"[PASS 2] Particle-tail match: '{extracted_author}' → "
                                         f"'{fb2_author}' (tail='{tail}')"
                                     )
-                                    self._add_to_author_cache(extracted_author, fb2_author)
+                                    self._add_to_author_cache(extracted_author, fb2_author,
+                                                              extracted_lower, fb2_lower)
                                     return fb2_author
                                 break  # only check from the FIRST particle
 
@@ -373,6 +495,18 @@ class Pass2Filename:
         # No match anywhere, return original extraction
         return extracted_author
     
+    def _is_valid_author_candidate(self, text: str) -> bool:
+        """Structural + normalizer validation of an extracted candidate (memoized).
+        
+        The same co-authors recur across many files; both checks are pure,
+        so the combined verdict is cached per candidate string.
+        """
+        result = self._validation_cache.get(text)
+        if result is None:
+            result = bool(self._looks_like_author_name(text) and validate_author_name(text))
+            self._validation_cache[text] = result
+        return result
+    
     def _looks_like_author_name(self, text: str) -> bool:
         """Check if text looks like an author name (structural validation).
         
@@ -400,12 +534,8 @@ class Pass2Filename:
         
         # Check for non-author keywords - but only as WHOLE WORDS, not substrings
         # This prevents "Романов" from matching "романов" in "романы"
-        text_lower = text.lower().strip()
-        text_words = set(text_lower.split())
-        
-        for keyword in self.NON_AUTHOR_KEYWORDS:
-            if keyword in text_words:
-                return False
+        if self._NON_AUTHOR_RE.search(text):
+            return False
         
         # Check that it has at least one letter (not just numbers)
         has_letter = any(c.isalpha() for c in text)
@@ -418,8 +548,7 @@ class Pass2Filename:
         # 1. Single word (just surname) → always allow (e.g., "Демченко")
         # 2. Multiple words → require at least one known first name (e.g., "Демченко Антон")
         # This way surnames like "Демченко" pass, but collection titles don't
-        text_normalized = text.lower()
-        text_words = text_normalized.split()
+        text_words = text.lower().split()
         
         if len(text_words) > 1:  # Multi-word - likely "FirstName LastName" or "Title Words"
             # EXCEPTION: if ALL words start with uppercase AND ≤3 words AND none is a
@@ -436,13 +565,7 @@ class Pass2Filename:
             # to filter out collection titles like "Боевая фантастика".
             # Particles count as valid name-components (they are part of proper names).
             if self.male_names or self.female_names:
-                has_known_name = any(
-                    word in self.male_names
-                    or word in self.female_names
-                    or word in self.name_particles
-                    for word in text_words
-                )
-                if not has_known_name:
+                if self._known_names.isdisjoint(text_words):
                     return False  # Not an author name - likely a collection title
         # Single word always passes (it's a surname, which is valid author name)
         
@@ -622,20 +745,14 @@ class Pass2Filename:
             True  → assign "Сборник"
             False → assign "Соавторство"
         """
-        if not self.collection_keywords:
+        if self._collection_kw_re is None:
             return False
 
         # Check in filename (basename, no extension) only — NOT in book title,
         # because publishers sometimes add "(сборник)" to the title of an ordinary
         # co-authored book, which should still be classified as "Соавторство".
-        filename_noext = file_path.replace('\\', '/').split('/')[-1].rsplit('.', 1)[0].lower()
-
-        for kw in self.collection_keywords:
-            kw_l = kw.lower()
-            if kw_l in filename_noext:
-                return True
-
-        return False
+        filename_noext = _filename_without_ext(file_path).lower()
+        return self._collection_kw_re.search(filename_noext) is not None
 
     def _count_authors(self, authors_str: str) -> int:
         """Count number of authors in metadata authors string.
@@ -678,32 +795,34 @@ class Pass2Filename:
         Args:
             records: List of BookRecord objects to process
         """
-        print("[PASS 2] Extracting authors from filenames (structural analysis)...")
-        
-        # Debug: Log loaded patterns
-        print(f"[PASS 2 DEBUG] Loaded {len(self.patterns)} patterns")
-        print(f"[PASS 2 DEBUG] Service words count: {len(self.service_words)}")
+        self.logger.log("[PASS 2] Extracting authors from filenames (structural analysis)...")
         
-        # Count source distribution
-        source_counts = {}
-        for r in records:
-            source = getattr(r, 'author_source', '')
-            source_counts[source] = source_counts.get(source, 0) + 1
-        print(f"[PASS 2 DEBUG] Record sources BEFORE: {source_counts}")
-        
-        processed_count = 0
-        skipped_count = 0
+        if self._debug:
+            # Debug: Log loaded patterns
+            print(f"[PASS 2 DEBUG] Loaded {len(self.patterns)} patterns")
+            print(f"[PASS 2 DEBUG] Service words count: {len(self.service_words)}")
+            
+            # Count source distribution
+            source_counts = dict(Counter(r.author_source for r in records))
+            print(f"[PASS 2 DEBUG] Record sources BEFORE: {source_counts}")
+        
+        # Папка — абсолютный приоритет. folder_dataset пропускается всегда,
+        # кроме случая needs_filename_fallback (папка не дала автора).
+        # Filtered once here; both the prefetch and the main loop walk only these records.
+        todo = [r for r in records
+                if r.author_source != "folder_dataset" or r.needs_filename_fallback]
+        skipped_count = len(records) - len(todo)
+        # Batch step: extension-less basenames for the whole work list in one pass,
+        # shared by the prefetch and the main loop
+        stems = [r.filename_no_ext for r in todo]
+        
+        self._prefetch_block_matches(stems)
+        
+        # Records left untouched; processed = len(todo) - unchanged_count after the loop
+        unchanged_count = 0
         error_count = 0
-        test_count = 0
-        
-        for i, record in enumerate(records):
-            # Папка — абсолютный приоритет. folder_dataset пропускается всегда,
-            # кроме случая needs_filename_fallback (папка не дала автора).
-            if (record.author_source == "folder_dataset" and
-                    not getattr(record, 'needs_filename_fallback', False)):
-                skipped_count += 1
-                continue
-
+        
+        for record, filename_without_ext in zip(todo, stems):
             # CHECK: Is this file a collection/anthology or co-authored book?
             # Rule: 3+ authors in metadata → either "Сборник" (if keywords in filename/title)
             #                               or "Соавторство" (regular multi-author book)
@@ -711,24 +830,20 @@ class Pass2Filename:
             if record.author_source != "folder_dataset":
                 author_count = self._count_authors(record.metadata_authors)
                 if author_count >= 3:
-                    if self._is_collection(record.file_path, getattr(record, 'file_title', '')):
+                    if self._is_collection(record.file_path, record.file_title):
                         record.proposed_author = "Сборник"
                     else:
                         record.proposed_author = "Соавторство"
                     record.author_source = "collection"
                     record.needs_filename_fallback = False
-                    processed_count += 1
                     continue  # Skip regular filename parsing for collections/co-authored
             
-            # Try to extract from filename (NOT full path!)
-            # Handle both Windows (\) and Unix (/) path separators
-            filename = record.file_path.replace('\\', '/').split('/')[-1]  # Get basename only
-            filename_without_ext = filename.rsplit('.', 1)[0]  # Remove extension
-            
+            # Try to extract from filename (NOT full path!) — basename without extension
+            # was computed for the whole batch above (both \ and / separators handled)
             author = self._extract_author_from_filename(
                 filename_without_ext,
-                file_title=getattr(record, 'file_title', '') or '',
-                metadata_authors_str=getattr(record, 'metadata_authors', '') or '',
+                file_title=record.file_title or '',
+                metadata_authors_str=record.metadata_authors or '',
             )
 
             if author:
@@ -751,10 +866,9 @@ class Pass2Filename:
                     # Также обрабатываем формат «Фамилия И. Фамилия2» / «Фамилия Р. Отчество» —
                     # _is_incomplete_name считает их полными (2 полных слова), но инициал
                     # посередине означает что имя требует расширения через метаданные.
-                    import re as _re_mi
                     _has_mid_initial = bool(
                         record.metadata_authors and
-                        _re_mi.search(r'\s[А-ЯЁA-Z]\.\s', expanded_author)
+                        _MID_INITIAL_RE.search(expanded_author)
                     )
                     if not use_hybrid_source and (self._is_incomplete_name(expanded_author) or _has_mid_initial):
                         if record.metadata_authors:
@@ -766,36 +880,34 @@ class Pass2Filename:
                     # GLUED-INITIALS GUARD: если извлечённый автор начинается с 2+ заглавных
                     # букв, слитно сросшихся с фамилией (например "АКТроицкий" = "А.К." + "Троицкий"),
                     # это скорее всего инициалы без разделителей. Если meta даёт одного автора — берём его.
-                    import re as _re_gi
                     if (expanded_author and
-                            _re_gi.match(r'^[А-ЯЁ]{2,}[А-ЯЁ][а-яё]', expanded_author) and
+                            _GLUED_INITIALS_RE.match(expanded_author) and
                             record.metadata_authors and
                             self._count_authors(record.metadata_authors) == 1):
                         record.proposed_author = record.metadata_authors
                         record.author_source = "metadata"
                         record.needs_filename_fallback = False
-                        processed_count += 1
                         continue
 
                     # JOINED-NAMES GUARD: если извлечённый автор содержит " и " или " И "
                     # (русский союз между именами двух авторов, например "Альвтеген Альбин и Карин"),
                     # и мета даёт ровно 2 авторов — берём мету и нормализуем каждого отдельно.
                     if (expanded_author and
-                            _re_gi.search(r'\s+[иИ]\s+', expanded_author) and
+                            _JOINED_NAMES_RE.search(expanded_author) and
                             record.metadata_authors and
                             self._count_authors(record.metadata_authors) == 2):
                         sep = '; ' if '; ' in record.metadata_authors else ', '
                         meta_parts = [a.strip() for a in record.metadata_authors.split(sep) if a.strip()]
                         if len(meta_parts) == 2:
-                            from author_normalizer_extended import AuthorNormalizer as _AN
-                            _norm = _AN(self.settings)
+                            if self._author_normalizer is None:
+                                from author_normalizer_extended import AuthorNormalizer as _AN
+                                self._author_normalizer = _AN(self.settings)
                             normalized_pair = [
-                                _norm.normalize_format(a) for a in meta_parts
+                                self._author_normalizer.normalize_format(a) for a in meta_parts
                             ]
                             record.proposed_author = ', '.join(normalized_pair)
                             record.author_source = "metadata"
                             record.needs_filename_fallback = False
-                            processed_count += 1
                             self._build_author_cache_from_extraction(record.proposed_author)
                             continue
 
@@ -803,7 +915,7 @@ class Pass2Filename:
                     # заголовка книги, он скорее всего не автор (например "Дух Рождества"
                     # из файла "Дух Рождества. 101 история...").
                     # Если при этом metadata_authors содержит одного автора → используем его.
-                    file_title = getattr(record, 'file_title', '') or ''
+                    file_title = record.file_title or ''
                     if (file_title and expanded_author and
                             expanded_author.lower() in file_title.lower() and
                             record.metadata_authors and
@@ -811,7 +923,6 @@ class Pass2Filename:
                         record.proposed_author = record.metadata_authors
                         record.author_source = "metadata"
                         record.needs_filename_fallback = False
-                        processed_count += 1
                         continue
 
                     # No folder_dataset - use filename extraction
@@ -819,13 +930,14 @@ class Pass2Filename:
                     record.proposed_author = expanded_author
                     record.author_source = "filename_meta_confirmed" if use_hybrid_source else "filename"
                     record.needs_filename_fallback = False  # Clear the fallback flag since we found something
-                    processed_count += 1
 
                     # BUILD AUTHOR CACHE: Track this extraction for future abbreviation expansion
                     # This helps expand abbreviated names in subsequent files
                     # e.g., if we extract "Живой Алексей", cache that we've seen this full form
                     self._build_author_cache_from_extraction(expanded_author)
-                # else: Already has folder_dataset source - NEVER override it, keep existing
+                else:
+                    # Already has folder_dataset source - NEVER override it, keep existing
+                    unchanged_count += 1
             else:
                 # Filename extraction failed (author is empty)
                 # Fallback: Use metadata if available (with hybrid source)
@@ -834,7 +946,7 @@ class Pass2Filename:
                     not record.proposed_author):  # Only if not already set
                     # Use metadata as fallback, mark as hybrid (filename attempt + metadata fallback)
                     if self._count_authors(record.metadata_authors) >= 3:
-                        if self._is_collection(record.file_path, getattr(record, 'file_title', '')):
+                        if self._is_collection(record.file_path, record.file_title):
                             record.proposed_author = "Сборник"
                         else:
                             record.proposed_author = "Соавторство"
@@ -843,9 +955,11 @@ class Pass2Filename:
                         record.proposed_author = record.metadata_authors
                         record.author_source = "metadata"  # Couldn't extract from filename
                     record.needs_filename_fallback = False
-                    processed_count += 1
-                # else: keep existing (might be metadata or empty)
+                else:
+                    # Keep existing (might be metadata or empty)
+                    unchanged_count += 1
         
+        processed_count = len(todo) - unchanged_count
         print(f"[PASS 2] Extracted {processed_count} authors from filenames, skipped {skipped_count} folder_dataset records, errors: {error_count}")
 
         # SECOND PASS: upgrade short author forms to longer ones now in cache.
@@ -882,153 +996,6 @@ class Pass2Filename:
         if upgraded:
             self.logger.log(f"[PASS 2] Upgraded {upgraded} short author names to longer cached forms")
     
-    def _extract_by_pattern(self, filename: str, pattern: str, struct: dict) -> str:
-        """Extract author from filename based on matched pattern.
-        
-        Args:
-            filename: Full filename without extension
-            pattern: Matched pattern string
-            struct: Analyzed structure
-        
-        Returns:
-            Author name or empty string
-        """
-        
-        author = ""
-        
-        # Pattern: "(Author) - Title"
-        if pattern == "(Author) - Title":
-            if ' - ' in filename:
-                before_dash = filename.split(' - ', 1)[0]
-                author = before_dash.strip().strip('()')
-                # If author contains a dot, take only the part before it
-                if '. ' in author:
-                    author = author.split('. ', 1)[0].strip()
-        
-        # Pattern: "Author - Title"
-        elif pattern == "Author - Title":
-            if ' - ' in filename:
-                author = filename.split(' - ', 1)[0].strip()
-                # If author contains a dot, take only the part before it (e.g., "Жеребьёв. Я" -> "Жеребьёв")
-                if '. ' in author:
-                    author = author.split('. ', 1)[0].strip()
-        
-        # Pattern: "Author - Series.Title"
-        elif pattern == "Author - Series.Title":
-            if ' - ' in filename:
-                author = filename.split(' - ', 1)[0].strip()
-                # If author contains a dot, take only the part before it
-                if '. ' in author:
-                    author = author.split('. ', 1)[0].strip()
-        
-        # Pattern: "Author. Title"
-        elif pattern == "Author. Title":
-            if '. ' in filename:
-                author = filename.split('. ', 1)[0].strip()
-        
-        # Pattern: "Title (Author)"
-        elif pattern == "Title (Author)":
-            if '(' in filename and ')' in filename:
-                start = filename.rfind('(')
-                end = filename.rfind(')')
-                if start < end:
-                    author = filename[start+1:end].strip()
-        
-        # Pattern: "Title - (Author)"
-        elif pattern == "Title - (Author)":
-            if ' - (' in filename:
-                parts = filename.split(' - (')
-                if len(parts) == 2:
-                    author = parts[1].rstrip(')').strip()
-                    # If author contains a dot, take only the part before it
-                    if '. ' in author:
-                        author = author.split('. ', 1)[0].strip()
-        
-        # Pattern: "Author. Series. Title"
-        elif pattern == "Author. Series. Title":
-            if '. ' in filename:
-                author = filename.split('. ', 1)[0].strip()
-        
-        # Pattern: "Author, Author. Title (Series)"
-        elif pattern == "Author, Author. Title (Series)":
-            if ', ' in filename:
-                # Extract both authors separated by comma
-                before_period = filename.split('. ', 1)[0].strip()
-                authors = [a.strip() for a in before_period.split(', ')]
-                author = ', '.join(authors)  # Return both: "Author1, Author2"
-        
-        # Pattern: "Author. Title. (Series)"
-        elif pattern == "Author. Title. (Series)":
-            if '. ' in filename:
-                author = filename.split('. ', 1)[0].strip()
-        
-        # Pattern: "Author - Title (Series)" (NO service words)
-        elif pattern == "Author - Title (Series)":
-            if ' - ' in filename:
-                author = filename.split(' - ', 1)[0].strip()
-                # If author contains a dot, take only the part before it
-                if '. ' in author:
-                    author = author.split('. ', 1)[0].strip()
-        
-        # Pattern: "Author - Title. Title (Series)" (with dot in title)
-        elif pattern == "Author - Title. Title (Series)":
-            if ' - ' in filename:
-                author = filename.split(' - ', 1)[0].strip()
-                # If author contains a dot, take only the part before it
-                if '. ' in author:
-                    author = author.split('. ', 1)[0].strip()
-        
-        # Pattern: "Author. Title (Series)" (NO service words)
-        elif pattern == "Author. Title (Series)":
-            if '. ' in filename:
-                author = filename.split('. ', 1)[0].strip()
-        
-        # Pattern: "Author, Author - Title (Series)" (NO service words)
-        elif pattern == "Author, Author - Title (Series)":
-            if ', ' in filename:
-                # Extract both authors separated by comma
-                before_dash = filename.split(' - ', 1)[0].strip()
-                # If any author contains a dot, take only the part before it
-                authors = []
-                for a in before_dash.split(', '):
-                    a = a.strip()
-                    if '. ' in a:
-                        a = a.split('. ', 1)[0].strip()
-                    authors.append(a)
-                author = ', '.join(authors)  # Return both: "Author1, Author2"
-        
-        # Pattern: "Author - Title (Series. service_words)"
-        elif pattern == "Author - Title (Series. service_words)":
-            if ' - ' in filename:
-                author = filename.split(' - ', 1)[0].strip()
-                # If author contains a dot, take only the part before it
-                if '. ' in author:
-                    author = author.split('. ', 1)[0].strip()
-        
-        # Pattern: "Author. Title (Series. service_words)"
-        elif pattern == "Author. Title (Series. service_words)":
-            if '. ' in filename:
-                author = filename.split('. ', 1)[0].strip()
-        
-        # Pattern: "Author, Author - Title (Series. service_words)"
-        elif pattern == "Author, Author - Title (Series. service_words)":
-            if ', ' in filename:
-                # Extract both authors separated by comma
-                before_dash = filename.split(' - ', 1)[0].strip()
-                # If any author contains a dot, take only the part before it
-                authors = []
-                for a in before_dash.split(', '):
-                    a = a.strip()
-                    if '. ' in a:
-                        a = a.split('. ', 1)[0].strip()
-                    authors.append(a)
-                author = ', '.join(authors)  # Return both: "Author1, Author2"
-        
-        # Return only if non-empty and valid author name
-        if author and len(author) > 2:
-            return author
-        return ""
-    
     def _clean_filename_for_extraction(self, filename: str) -> str:
         """Remove blacklist markers from filename before pattern matching.
         
@@ -1045,31 +1012,72 @@ class Pass2Filename:
         Returns:
             Filename with blacklist markers removed
         """
-        import re
+        return _strip_tail_markers(filename)
+    
+    def _match_filename_blocks(self, cleaned_filename: str, without_title_first: bool = False) -> tuple:
+        """Run block-level pattern matching for a cleaned filename (memoized).
         
-        cleaned = filename
+        The result depends only on the filename and on data fixed for the
+        instance lifetime (patterns, service words, known names), so it is
+        cached per filename. Validation/expansion of the author is NOT cached:
+        it depends on metadata and on author_cache, which grows during execute().
         
-        # Remove blacklist elements from the END of filename
-        # Start from the end and remove matching blacklist patterns
-        # Only remove if they appear at END of string (after all meaningful content)
+        Args:
+            cleaned_filename: Filename after _clean_filename_for_extraction
+            without_title_first: Skip patterns whose name starts with "Title"
         
-        # Pattern 1: "(СИ)" or variations at the end
-        cleaned = re.sub(r'\s*\(СИ\)\s*$', '', cleaned, flags=re.IGNORECASE)
-
-        # Pattern 2: Collection/anthology markers at the end — "(сборник)", "(антология)" etc.
-        # These are informational tags that do NOT represent a separate meaningful block.
-        cleaned = re.sub(r'\s*\(сборник[^)]*\)\s*$', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\s*\(антология[^)]*\)\s*$', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\s*\(omnibus[^)]*\)\s*$', '', cleaned, flags=re.IGNORECASE)
-
-        # Pattern 3: Other known meta-patterns that shouldn't create extra blocks
-        # Remove tags/meta in parens at the end
-        cleaned = re.sub(r'\s*\([^)]*(?:издание|изд\.)[^)]*\)\s*$', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\s*\(пер\.\s*[^)]*\)\s*$', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\s*\(перевод[^)]*\)\s*$', '', cleaned, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\s*\(пер\)\s*$', '', cleaned, flags=re.IGNORECASE)
+        Returns:
+            (best_score, best_pattern, extracted_author, extracted_series)
+        """
+        key = (cleaned_filename, without_title_first)
+        cached = self._filename_match_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        patterns = self._pattern_strs_no_title_first if without_title_first else self._pattern_strs
+        result = self._block_matcher.find_best_pattern_match(cleaned_filename, patterns)
+        self._filename_match_cache[key] = result
+        return result
+    
+    def _prefetch_block_matches(self, filenames: List[str]) -> None:
+        """Fill _filename_match_cache in parallel for large libraries.
+        
+        Block-level matching is pure CPU work on the filename alone, so it can
+        run in worker processes (threads would not help: GIL-bound). Everything
+        that depends on shared state (author_cache, record fields) stays in the
+        sequential loop of execute(), which then only hits the cache.
+        
+        Args:
+            filenames: Basenames without extension of the records that go through
+                filename extraction (folder_dataset records already filtered out)
+        """
+        pending = set()
+        for filename in filenames:
+            cleaned = self._clean_filename_for_extraction(filename)
+            if (cleaned and (cleaned, False) not in self._filename_match_cache
+                    and (not self._needs_block_delim or _BLOCK_DELIM_RE.search(cleaned))):
+                pending.add(cleaned)
+        
+        if len(pending) < self.PARALLEL_MATCH_THRESHOLD:
+            return
         
-        return cleaned.strip()
+        max_workers = min(multiprocessing.cpu_count() or 4, max(1, len(pending) // 500))
+        if max_workers < 2:
+            return
+        chunksize = max(1, min(256, len(pending) // (max_workers * 4)))
+        print(f"[PASS 2] Matching {len(pending)} filenames in {max_workers} processes...")
+        
+        try:
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_block_match_worker,
+                initargs=(list(self.service_words), self.male_names, self.female_names, self._pattern_strs),
+            ) as executor:
+                for cleaned, result in executor.map(_block_match_worker, sorted(pending), chunksize=chunksize):
+                    self._filename_match_cache[(cleaned, False)] = result
+        except Exception as e:
+            # Не критично: оставшиеся имена будут сопоставлены последовательно в execute()
+            self.logger.log(f"[PASS 2] Parallel block matching failed, continuing sequentially: {e}")
     
     def _extract_author_from_filename(self, filename: str, file_title: Optional[str] = None,
                                        metadata_authors_str: Optional[str] = None) -> str:
@@ -1101,26 +1109,14 @@ class Pass2Filename:
             return ""
         
         try:
-            # Import block-level matcher
-            try:
-                from block_level_pattern_matcher import BlockLevelPatternMatcher
-            except ImportError:
-                from ..block_level_pattern_matcher import BlockLevelPatternMatcher
-            import re
-            
             # CRITICAL: Remove blacklist markers from filename BEFORE pattern matching
             # "(СИ)" at the end creates an extra block that breaks pattern matching!
             cleaned_filename = self._clean_filename_for_extraction(filename)
-            
-            # Create matcher with service words and known author names
-            matcher = BlockLevelPatternMatcher(
-                service_words=list(self.service_words),
-                male_names=self.male_names,
-                female_names=self.female_names
-            )
+            if self._needs_block_delim and not _BLOCK_DELIM_RE.search(cleaned_filename):
+                return ""
             
             # Find best pattern match using block-level comparison on CLEANED filename
-            best_score, best_pattern, author, series = matcher.find_best_pattern_match(cleaned_filename, self.patterns)
+            best_score, best_pattern, author, series = self._match_filename_blocks(cleaned_filename)
             
             # Need minimum score threshold to proceed
             if best_score < 0.6:  # Threshold for block matching
@@ -1143,10 +1139,10 @@ class Pass2Filename:
             if book_title:
                 try:
                     # Strip trailing [...] noise (e.g. "[litres]", "[СИ]") before comparing.
-                    _book_title_clean = re.sub(r'\s*\[.*?\]\s*$', '', book_title.strip()) if book_title else ''
+                    _book_title_clean = _TITLE_TAIL_BRACKETS_RE.sub('', book_title.strip()) if book_title else ''
                     # Also strip trailing (...) noise (e.g. "(ЛП)", "(СИ)", "(альт. перевод)")
                     # so "Спасение (ЛП)" → "Спасение" can be matched against extracted author.
-                    _book_title_no_parens = re.sub(r'\s*\([^)]*\)\s*$', '', _book_title_clean).strip()
+                    _book_title_no_parens = _TITLE_TAIL_PARENS_RE.sub('', _book_title_clean).strip()
                     # Normalise ё→е before comparing so "Звёздочка" matches "Звездочка"
                     def _yo(s: str) -> str:
                         return s.lower().replace('ё', 'е')
@@ -1160,12 +1156,8 @@ class Pass2Filename:
                             f"(pattern='{best_pattern}'). Retrying without Title-first patterns."
                         )
                         # Retry: exclude patterns whose name starts with "Title"
-                        filtered_patterns = [
-                            p for p in self.patterns
-                            if not (p.get('pattern', '') if isinstance(p, dict) else p).startswith('Title')
-                        ]
-                        best_score, best_pattern, author, series = matcher.find_best_pattern_match(
-                            cleaned_filename, filtered_patterns
+                        best_score, best_pattern, author, series = self._match_filename_blocks(
+                            cleaned_filename, without_title_first=True
                         )
                         if best_score < 0.6 or not author or not author.strip():
                             return ""
@@ -1182,9 +1174,7 @@ class Pass2Filename:
                 validated_authors = []
                 
                 for single_author in authors:
-                    looks_like = self._looks_like_author_name(single_author)
-                    is_valid = validate_author_name(single_author) if single_author else False
-                    if single_author and looks_like and is_valid:
+                    if single_author and self._is_valid_author_candidate(single_author):
                         expanded = self._validate_and_expand_author(single_author, metadata_authors_str)
                         validated_authors.append(expanded)
                     elif single_author:
@@ -1192,22 +1182,21 @@ class Pass2Filename:
                 
                 if validated_authors:
                     author = ', '.join(validated_authors)
-                    self.logger.log(f"[PASS 2] ✓ Extracted '{author}' from '{filename}' (block-level)")
+                    if self._debug:
+                        self.logger.log(f"[PASS 2] ✓ Extracted '{author}' from '{filename}' (block-level)")
                     return author
                 # else: validation failed, fall through
             
             # Single author case
-            if author and self._looks_like_author_name(author) and validate_author_name(author):
+            if author and self._is_valid_author_candidate(author):
                 author = self._validate_and_expand_author(author, metadata_authors_str)
-                self.logger.log(f"[PASS 2] ✓ Extracted '{author}' from '{filename}' (block-level)")
+                if self._debug:
+                    self.logger.log(f"[PASS 2] ✓ Extracted '{author}' from '{filename}' (block-level)")
                 return author
             else:
                 #self.logger.log(f"[PASS 2] Block extraction failed validation for '{author}' from '{filename}'")
                 return ""
         
-        except ImportError as e:
-            self.logger.log(f"[PASS 2] ImportError: BlockLevelPatternMatcher - {e}")
-            return ""
         except Exception as e:
             import traceback
             self.logger.log(f"[PASS 2] Block-level matching error for '{filename}': {e}")
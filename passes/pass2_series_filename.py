@@ -25,6 +25,8 @@ PASS 2 для СЕРИЙ: Извлечение серий из имён файл
 import re
 import sys
 import unicodedata
+from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
@@ -34,6 +36,163 @@ except ImportError:
     from ..extraction_constants import FILE_EXTENSION_FOLDER_NAMES, is_no_series_folder
 
 
+# Регулярки основного цикла execute() — компилируются один раз при импорте
+# (кэш re ограничен и на каждом вызове re.sub/re.search хэширует строку шаблона)
+_AUTHOR_SPLIT_RE = re.compile(r'[;,]')                       # разделители авторов
+_FOLDER_NAME_SPLIT_RE = re.compile(r'[\s,;\-\(\)]+')            # _author_matches_folder()
+_NON_WORD_RE = re.compile(r'[^\w]')
+_COMMA_SPLIT_RE = re.compile(r'\s*,\s*')
+_FOLDER_WORD_SPLIT_RE = re.compile(r'[\s.\-]+')
+_TRAILING_PARENS_RE = re.compile(r'\s*\([^)]*\)\s*$')          # «Серия (Автор)» → «Серия»
+_TRAILING_PARENS_CONTENT_RE = re.compile(r'\(([^)]+)\)\s*$')
+_TRAILING_BRACKETS_RE = re.compile(r'\s*\[.*?\]\s*$')          # «Название [litres]»
+_ET_AL_RE = re.compile(r'(?:и\s+др\.?|и\s+другие|et\s+al\.?|and\s+others)\s*$', re.IGNORECASE)
+_LEADING_DASHES_RE = re.compile(r'^[\-–—\s]+')
+_WORDS_TAIL_RE = re.compile(r'^[\W\s]*(|(\w+\s*)+)$')
+_TRAILING_NUMBER_RE = re.compile(r'\s+\d+\s*$')
+_DIGITS_ONLY_RE = re.compile(r'^\d+$')
+_CYR_WORD_TAIL_RE = re.compile(r'([А-Яа-яЁё]+)\.?$')             # «а.белоус» → «белоус»
+_LEADING_DIGITS_RE = re.compile(r'^\d+')
+_ROMAN_NUMERAL_RE = re.compile(r'^[IVX]+$', re.IGNORECASE)
+_SI_LP_TAIL_RE = re.compile(r'\s*\([СЛ]И\)\s*$')                # «(СИ)», «(ЛИ)» в конце
+_YEAR_SUFFIX_RE = re.compile(r'(?:\s*[-–—])?\s*(?:19|20)\d{2}\s*$')
+_RANGE_TAIL_RE = re.compile(r'^(.+?)\s+\d+[-\u2013\u2014]\d+\s*$')   # «Совок 1-5»
+_NUMBER_TAIL_RE = re.compile(r'^(.+?)\s+\d+\s*$')                # «Охотник 1»
+_ROMAN_TAIL_RE = re.compile(r'^(.+?)\s+[IVX]+\s*$')               # «Бесноватый Цесаревич I»
+_DASH_SERIES_NUM_RE = re.compile(r'^(.+?)\s*-\s*(.+?)\s+(?:\d+[-\u2013\u2014]\d+|\d+|[IVX]+)\s*$')
+_DASH_SERIES_NUM_TITLE_RE = re.compile(r'^(.+?)\s*-\s*(.+?)\s+\d{1,2}\.\s+.+$')
+# _extract_series_from_folder_name()
+_FOLDER_NUM_PREFIX_RE = re.compile(r'^\d+[\.\)\-]\s+')           # «1. », «2) »
+_FOLDER_BEFORE_PARENS_RE = re.compile(r'^(.+?)\s*\([^)]+\)\s*$')
+_COMMA_NO_SPACE_RE = re.compile(r',(\S)')
+# _apply_config_pattern() / _extract_series_from_brackets()
+_BOOK_NUM_PREFIX_RE = re.compile(r'^\s*\d+\s*[.,]\s*')
+_FROM_CYCLE_RE = re.compile(r'из\s+(?:цикла|серии)\s+(.+)', re.IGNORECASE)
+_PUNCT_RE = re.compile(r'[^\w\s]')                              # _matches_with_tolerance()
+# _extract_series_from_filename()
+_EDITION_TAIL_RE = re.compile(r'\s*\([^)]*(?:издание|изд\.)[^)]*\)\s*$', re.IGNORECASE) # «(др. изд.)», «(другое издание)» в конце
+_NUM_OR_RANGE_TAIL_RE = re.compile(r'\s+\d+(?:[-–—]\d+)?\s*$')  # «Серия 2», «Серия 1-3» в конце
+_NUM_DOT_TITLE_RE = re.compile(r'\s+\d+\.\s+\S')                # «Серия 2. Название»
+_LEADING_SQUARE_RE = re.compile(r'^\[([^\[\]]+)\]')             # «[Серия] ...»
+_PARENS_GROUP_RE = re.compile(r'\(([^)]+)\)(?:\s*\(|\s*$)')
+# Слова-уточнения аннотации в скобках: «(весь цикл)», «(полная трилогия)»
+_SW_QUALIFIERS = frozenset({'весь', 'вся', 'все', 'полный', 'полная', 'полное',
+                            'целый', 'целая', 'целое', 'complete', 'omnibus'})
+_INITIAL_DOT_RE = re.compile(r'[А-ЯA-Z]\.[А-Яа-яA-Za-z]')       # инициал «К.Дж»
+_PARENS_ANY_RE = re.compile(r'\s*\([^)]*\)')
+_AUTHOR_SERIES_NUM_RE = re.compile(r'^(.+?)\s*-\s*(.+?)\s+(?:\d+[-–—]\d+|\d{1,2})\s*$') # «Автор - Серия 2», «Автор - Серия 1-3»
+_AUTHOR_SERIES_NUM_TITLE_RE = re.compile(r'^(.+?)\s*-\s*(.+?)\s+(\d{1,2})\.\s+.+$') # «Автор - Серия 2. Название»
+_AUTHOR_SERIES_DOT_TITLE_RE = re.compile(r'^(.+?)\s*-\s*([^.]+)\.\s+(.+)$') # «Автор - Серия. Название»
+# Двухуровневая иерархия «Серия N. Подсерия ...» (ШАГ 0 _extract_series_from_filename)
+# Вариант А: «Серия N. Подсерия M. Название»
+_TWO_LEVEL_RE = re.compile(
+    r'^(.+?)\s+(\d{1,4})\.\s+([А-ЯЁA-Z][^.]{2,}?)\s+(\d{1,4})\.\s+(.+)$',
+    re.UNICODE,
+)
+# Вариант Б: «Серия N. Подсерия. Том/Книга M» — подсерия без своего номера
+_TWO_LEVEL_TOM_RE = re.compile(
+    r'^(.+?)\s+(\d{1,4})\.\s+([А-ЯЁA-Z][^.]{2,}?)\.\s+(?:Том|Книга|Часть|кн\.|Book|Vol\.?)\s+\d',
+    re.IGNORECASE | re.UNICODE,
+)
+# Вариант В: «Серия N. Подсерия N-M. Название» — диапазон томов внутри подсерии
+_TWO_LEVEL_RANGE_RE = re.compile(
+    r'^(.+?)\s+(\d{1,4})\.\s+([А-ЯЁA-Z][^.]{2,}?)\s+\d{1,4}\s*[-–—]\s*\d{1,4}\.\s+.+$',
+    re.UNICODE,
+)
+# Вариант Г: «Серия N. Подсерия (ServiceWord)» — скомпилированный файл
+_SERVICE_SUFFIX_RE = re.compile(
+    r'^(.+?)\s+(\d{1,4})\.\s+([А-ЯЁA-Z][^(]{2,}?)\s*\((?:Тетралогия|Трилогия|Дилогия|Пенталогия|Сага|Цикл|[Сс]борник|[Аа]нтология)\)\s*$',
+    re.UNICODE,
+)
+# _apply_config_pattern()
+_AUTHOR_TITLE_PARENS_RE = re.compile(r'^(.+?)\s*-\s*([^()]+?)\s*\(([^)]*)\)')
+_NUMERIC_RANGE_RE = re.compile(r'^\d+[-–—]\d+$')
+_WORD_THEN_NUM_RE = re.compile(r'[а-яё\w]+\s+\d')
+_NUM_THEN_WORD_RE = re.compile(r'\d+\s+[а-яё\w]+')
+_NUM_TITLE_TAIL_RE = re.compile(r'\s+\d+(?!\.\d)[\s\.\:].+$')
+_AUTHOR_SERIES_PARENS_RE = re.compile(r'^(.+?)\s*-\s*(.+?)\s*\(\s*([^)]+)\)')
+_AUTHOR_SERIES_NUM_PREFIX_RE = re.compile(r'^(.+?)\s*-\s*(.+?)\s+\d+[\s\.\:]')
+_PARENS_CONTENT_RE = re.compile(r'\(\s*([^)]+)\)')
+_AUTHOR_SERIES_NUM_DOT_RE = re.compile(r'^(.+?)\s+-\s+(.+?)\s+\d+\.\s+')
+# _extract_main_series_from_multi_level() / _extract_series_from_brackets()
+# Служебные слова, которые обозначают конец иерархии серий (\b — чтобы не путать «Серия Альфа» со служебным)
+_HIERARCHY_END_WORDS_RE = re.compile(r'\b(?:Дилогия|Трилогия|Тетралогия|Пентагония|внецикл|дополнение|прелюдия|эпилог)\b', re.IGNORECASE)
+_NUM_LIST_TAIL_RE = re.compile(r'\s*[\d\-\,\–]+\s*$')                # Только числа/диапазоны в конце
+_NUMERO_TAIL_RE = re.compile(r'\s*№\s*\d*\s*$')
+_DIGIT_RE = re.compile(r'\d')
+_NUM_DASH_TAIL_RE = re.compile(r'\s*[\d\-]+\s*$')
+# _clean_series_name()
+_LEADING_GUILLEMET_RE = re.compile(r'^«\s*')
+_TRAILING_GUILLEMET_RE = re.compile(r'\s*»$')
+_LEADING_DASH_RE = re.compile(r'^[-–—]\s*')
+_SERIES_NUM_TITLE_RE = re.compile(r'^(.+?)\s+\d+(?!\.\d)[\.\:]\s+.+$')
+_SHORT_NUM_TAIL_RE = re.compile(r'(?<!\.)\s+\d{1,2}\s*$')
+_SERIES_NUM_WORDS_RE = re.compile(r'^(.+?)\s+\d+\s+.+$')
+_TRAILING_PARENS_NONEMPTY_RE = re.compile(r'\s*\([^)]+\)\s*$')
+# BlockLevelPatternSelector: первая пара скобок и вырезание скобок из паттерна
+_PARENS_FIRST_RE = re.compile(r'\(([^)]+)\)')
+_PARENS_BLOCK_RE = re.compile(r'\([^)]*\)')
+# _is_valid_series(): год через тире в конце — номинация/премия, калибры и короткие числа
+_SPACED_DASH_YEAR_TAIL_RE = re.compile(r'\s[–—\-]\s*\d{4}\s*[»"\']*\s*$')
+_LONG_DASH_YEAR_TAIL_RE = re.compile(r'[–—]\s*\d{4}\s*[»"\']*\s*$')
+_CALIBER_RE = re.compile(r'^[.,]\d+$')                             # «.45», «,357»
+_DIGITS_UNIT_RE = re.compile(r'^\d+[a-z]{1,2}$')                   # «9mm»
+_ONE_TWO_DIGITS_RE = re.compile(r'^\d{1,2}$')
+_SPACE_NUMBER_END_RE = re.compile(r'^.+\s+\d+$')
+# _remove_blacklist_words(): чистка пробелов и скобок после удаления слов
+_WS_RUN_RE = re.compile(r'\s+')
+_EMPTY_PARENS_RE = re.compile(r'\(\s*\)')
+_DANGLING_PAREN_RE = re.compile(r'\s*[\(\)]\s*$')
+# Пост-проходы: нормализация серий и разбор списков авторов
+_SENTENCE_PUNCT_RE = re.compile(r'[.,:;!?]+')
+_INITIAL_SURNAME_RE = re.compile(r'(?<![а-яёА-Я])[А-Я]\.*\s*[А-Я][а-яё]+')   # «А.Фамилия»
+# BlockLevelPatternSelector.score_blocks(): служебные слова в скобках — полные слова,
+# не часть другого слова
+_BRACKET_SERVICE_WORD_RE = re.compile(r'\b(Дилогия|Трилогия|Тетралогия|Пенталогия|Цикл|Серия)\b', re.IGNORECASE)
+# Именованная группа в regex, сгенерированном pattern_converter
+_NAMED_GROUP_RE = re.compile(r'\(\?P<\w+>')
+
+
+def _path_stem(name: str) -> str:
+    """Имя файла без расширения — то же, что Path(name).stem, без создания Path."""
+    dot = name.rfind('.')
+    return name[:dot] if 0 < dot < len(name) - 1 else name
+
+
+# Разбор file_path через Path — один раз на путь для всех проходов execute()
+# (основной цикл и пост-проходы разбирают одни и те же пути заново)
+@lru_cache(maxsize=50000)
+def _file_parts(file_path: str) -> tuple:
+    """Path(file_path).parts, memoized."""
+    return Path(file_path).parts
+
+
+@lru_cache(maxsize=50000)
+def _file_name(file_path: str) -> str:
+    """Path(file_path).name, memoized."""
+    return Path(file_path).name
+
+
+@lru_cache(maxsize=50000)
+def _file_stem(file_path: str) -> str:
+    """Path(file_path).stem, memoized."""
+    return Path(file_path).stem
+
+
+@lru_cache(maxsize=50000)
+def _file_parent(file_path: str) -> str:
+    """str(Path(file_path).parent), memoized."""
+    return str(Path(file_path).parent)
+
+
+# Нормализация серии для сравнения (без пунктуации, нижний регистр) — одни и те же
+# серии сравниваются при группировке, консенсусе и _matches_with_tolerance
+@lru_cache(maxsize=50000)
+def _normalize_for_compare(text: str) -> str:
+    """Текст без пунктуации, в нижнем регистре, без крайних пробелов."""
+    return _PUNCT_RE.sub('', text).lower().strip()
+
+
 def _author_matches_folder(proposed_author: str, folder_part: str) -> bool:
     """Проверить, является ли folder_part папкой автора proposed_author.
 
@@ -65,7 +224,7 @@ def _author_matches_folder(proposed_author: str, folder_part: str) -> bool:
 
     # Извлечь уникальные фамилии (первое слово каждого автора после split по , ;)
     surnames = []
-    for author in re.split(r'[,;]', proposed_author):
+    for author in _AUTHOR_SPLIT_RE.split(proposed_author):
         words = author.strip().replace('ё', 'е').split()
         if words:
             surnames.append(words[0].lower())
@@ -73,7 +232,7 @@ def _author_matches_folder(proposed_author: str, folder_part: str) -> bool:
     if not unique_surnames:
         return False
 
-    folder_words = [w for w in re.split(r'[\s,;\-\(\)]+', folder_lower) if w]
+    folder_words = [w for w in _FOLDER_NAME_SPLIT_RE.split(folder_lower) if w]
 
     # Каждая уникальная фамилия должна совпадать с хотя бы одним словом папки
     # (startswith для формы мн. числа: живов → живовы)
@@ -133,7 +292,7 @@ class BlockLevelPatternSelector:
         """Разбирает файл на структурные блоки"""
         
         # Извлекаем содержимое скобок
-        bracket_match = re.search(r'\(([^)]+)\)\s*$', filename)
+        bracket_match = _TRAILING_PARENS_CONTENT_RE.search(filename)
         
         parts = {
             'filename': filename,
@@ -267,10 +426,7 @@ class BlockLevelPatternSelector:
             bracket_content = file_blocks['content_in_brackets'] or ''
             
             # Проверяем наличие служебных слов (Дилогия, Тетралогия и т.д.), но НЕ числовых диапазонов!
-            has_service_word = False
-            # Служебные слова: полные слова, не часть другого слова
-            service_word_patterns = r'\b(Дилогия|Трилогия|Тетралогия|Пенталогия|Цикл|Серия)\b'
-            has_service_word = bool(re.search(service_word_patterns, bracket_content, re.IGNORECASE))
+            has_service_word = bool(_BRACKET_SERVICE_WORD_RE.search(bracket_content))
             
             if pattern_reqs['bracket_requires_service_words']:
                 if has_service_word:
@@ -301,9 +457,11 @@ class BlockLevelPatternSelector:
 class Pass2SeriesFilename:
     """Извлечение серий из имён файлов."""
     
-    def __init__(self, logger: Logger = None, male_names: set = None, female_names: set = None):
+    def __init__(self, logger: Logger = None, male_names: set = None, female_names: set = None,
+                 settings=None):
         self.logger = logger or Logger()
-        self.settings = SettingsManager('config.json')
+        # Общий SettingsManager вызывающего — без повторного чтения config.json
+        self.settings = settings or SettingsManager('config.json')
         self.block_selector = BlockLevelPatternSelector()
         self.male_names = male_names or set()
         self.female_names = female_names or set()
@@ -316,8 +474,68 @@ class Pass2SeriesFilename:
         # Получить списки из config.json
         self.collection_keywords = self.settings.get_list('collection_keywords')
         self.variant_folder_keywords = [kw.lower() for kw in (self.settings.get_list('variant_folder_keywords') or [])]
+        # _is_variant_folder: короткие ключевые слова — как целые слова, длинные — вхождением
+        self._variant_short_kw_res = tuple(
+            re.compile(r'(?<![а-яёa-z])' + re.escape(kw) + r'(?![а-яёa-z])')
+            for kw in self.variant_folder_keywords if len(kw) <= 3
+        )
+        self._variant_long_kws = tuple(kw for kw in self.variant_folder_keywords if len(kw) > 3)
         self.service_words = self.settings.get_list('service_words')
+        # Правило 5 _clean_series_name: по регулярке на служебное слово, в порядке списка
+        # (порядок значим — слово снимается, только если к своей очереди стоит в конце).
+        # Общая альтернация отсекает за один проход строки без служебного слова в конце.
+        self._service_tail_res = tuple(
+            re.compile(r'\s*[\-–—]?\s*\b' + re.escape(w) + r'\b\s*$', re.IGNORECASE)
+            for w in self.service_words
+        )
+        self._service_tail_any_re = re.compile(
+            r'\b(?:' + '|'.join(map(re.escape, self.service_words)) + r')\b\s*$', re.IGNORECASE
+        ) if self.service_words else None
         self.filename_blacklist = self.settings.get_list('filename_blacklist')
+        # Blacklist-слова как целые слова (кириллица/латиница) — для проверки metadata_series
+        self._bl_word_res = tuple(
+            re.compile(r'(?<![а-яёa-z])' + re.escape(bl_lower) + r'(?![а-яёa-z])')
+            for bl_lower in (bl.lower().strip() for bl in self.filename_blacklist)
+            if bl_lower
+        )
+        # Списки из конфига в нижнем регистре — приводятся один раз, а не в каждой проверке
+        self._service_words_lower = tuple(sw.lower() for sw in self.service_words)
+        self._blacklist_lower = tuple(bl.lower() for bl in self.filename_blacklist)
+        self._blacklist_lower_set = frozenset(self._blacklist_lower)
+        self._collection_keywords_lower = tuple(kw.lower() for kw in self.collection_keywords)
+        self._check_words_lower = (
+            self._service_words_lower + self._blacklist_lower + self._collection_keywords_lower
+        )
+        # ПРОВЕРКА 1 _is_valid_series: blacklist-слово на границе слова/скобки/дефиса.
+        # Общая альтернация находит совпадение тогда и только тогда, когда его находит
+        # хотя бы одна из регулярок, — один поиск вместо перебора всего списка.
+        self._bl_boundary_res = tuple(
+            (bl_lower, re.compile(r'(?:^|\s|\(|-)' + re.escape(bl_lower) + r'(?:\s|\)|$)'))
+            for bl_lower in self._blacklist_lower
+        )
+        self._bl_boundary_any_re = re.compile(
+            r'(?:^|\s|\(|-)(?:' + '|'.join(map(re.escape, self._blacklist_lower)) + r')(?:\s|\)|$)'
+        ) if self._blacklist_lower else None
+        # ПРОВЕРКА 2: вхождение любого collection-keyword — одной альтернацией
+        self._collection_keywords_re = re.compile(
+            '|'.join(map(re.escape, self._collection_keywords_lower))
+        ) if self._collection_keywords_lower else None
+        # ПРОВЕРКА 3: первое слово — служебное; однобуквенные сокращения «т.»
+        self._service_words_set = frozenset(self._service_words_lower)
+        self._service_abbrevs = tuple(sw + '.' for sw in self._service_words_lower if len(sw) == 1)
+        # Непустые служебные слова для str.startswith(tuple) — пустой префикс совпал бы с любой строкой
+        self._service_prefixes = tuple(sw for sw in self._service_words_lower if sw)
+        # _parse_folder_author: blacklist-слово в имени папки как целое слово
+        self._bl_folder_res = tuple(
+            re.compile(r'(?<![а-яёa-z])' + re.escape(bl.lower()) + r'(?![а-яёa-z])')
+            for bl in self.filename_blacklist
+        )
+        # _remove_blacklist_words: слово с границами (пробелы, скобки, пунктуация)
+        self._bl_remove_res = tuple(
+            re.compile(r'(?:^|\s|\(|-)' + re.escape(bl_lower) + r'(?:\s|\)|$|[,.\-\!?])', re.IGNORECASE)
+            for bl_lower in (bl.lower().strip() for bl in self.filename_blacklist)
+            if bl_lower
+        )
         # Пользовательский список папок «без серии» (дополняет встроенный NO_SERIES_FOLDER_NAMES)
         self.no_series_names = self.settings.get_no_series_folder_names()
         
@@ -329,10 +547,50 @@ class Pass2SeriesFilename:
         # Включает как file_patterns, так и metadata_patterns
         self.compiled_file_patterns = compile_patterns(self.file_patterns)
         self.compiled_metadata_patterns = compile_patterns(self.metadata_patterns)
+
+        # Объединение всех file_patterns в один regex (без имён групп — они
+        # повторяются между паттернами). Совпадения оцениваются по block_score
+        # среди ВСЕХ подошедших паттернов, поэтому union — только префильтр:
+        # один вызов отсекает имена, к которым не подходит ни один паттерн.
+        # Требования паттернов к структуре блоков зависят только от самого паттерна
+        self._file_pattern_blocks = {
+            pattern_str: self.block_selector.analyze_pattern_blocks(pattern_str)
+            for pattern_str, _, _ in self.compiled_file_patterns
+        }
+        self._file_patterns_union_re = None
+        if self.compiled_file_patterns:
+            self._file_patterns_union_re = re.compile('|'.join(
+                '(?:' + _NAMED_GROUP_RE.sub('(?:', compiled.pattern) + ')'
+                for _, compiled, _ in self.compiled_file_patterns
+            ))
         
+        # Обработчики паттернов из конфига для _apply_config_pattern (имя паттерна → метод)
+        self._config_pattern_handlers = {
+            "Author - Series (service_words)": self._config_series_with_service_brackets,
+            "Author - Title (Series. service_words)": self._config_series_from_dash_brackets,
+            "Author - Series.Title": self._config_series_before_number,
+            "Author. Series. Title": self._config_series_second_dot_part,
+            "Author, Author - Title (Series. service_words)": self._config_series_from_brackets,
+            "Author. Title (Series. service_words)": self._config_series_from_brackets,
+            "Author - Title (Series service_words)": self._config_series_from_dash_brackets,
+            "Author, Author. Title (Series)": self._config_series_from_brackets,
+            "Author - Series service_words. Title": self._config_series_before_numbered_title,
+        }
+
         # Флаг: последний вызов _extract_series_from_brackets вернул иерархическую серию
         # (MainSeries N из "MainSeries N. SubSeries M-K") — не убирать trailing number
         self._last_was_hierarchical = False
+
+        # Кэши чистых проверок кандидата серии: в библиотеке с несколькими
+        # файлами на автора один и тот же кандидат проверяется многократно.
+        # Результат зависит только от аргументов и списков из конфига,
+        # которые после инициализации не меняются.
+        self._valid_series_cache: Dict[tuple, bool] = {}
+        self._clean_series_cache: Dict[tuple, str] = {}
+        self._author_surname_cache: Dict[tuple, bool] = {}
+        # AuthorName читает конфиг (blacklist, известные имена), который меняется
+        # между запусками в одном процессе (GUI) — поэтому кэш на экземпляре
+        self._author_name_info_cache: Dict[str, tuple] = {}
     
     def _extract_series_from_folder_name(self, folder_name: str) -> str:
         """
@@ -347,17 +605,17 @@ class Pass2SeriesFilename:
             Очищенное название серии
         """
         # Убрать ведущие номера ("1. ", "2) " и т.д.)
-        cleaned = re.sub(r'^\d+[\.\)\-]\s+', '', folder_name).strip()
+        cleaned = _FOLDER_NUM_PREFIX_RE.sub('', folder_name).strip()
         if cleaned and cleaned != folder_name:
             folder_name = cleaned
         
         # Fallback - всё перед скобками это серия
-        match = re.match(r'^(.+?)\s*\([^)]+\)\s*$', folder_name)
+        match = _FOLDER_BEFORE_PARENS_RE.match(folder_name)
         if match:
             folder_name = match.group(1).strip()
 
         # По правилам русского языка после запятой всегда должен идти пробел
-        folder_name = re.sub(r',(\S)', r', \1', folder_name)
+        folder_name = _COMMA_NO_SPACE_RE.sub(r', \1', folder_name)
 
         return folder_name.strip()
     
@@ -376,9 +634,25 @@ class Pass2SeriesFilename:
         # даже для файлов у которых proposed_author был "Соавторство"/"Сборник".
         self._propagate_ancestor_folder_authors(records)
 
-        # Кэш Path.parts: один и тот же file_path встречается в нескольких проходах
+        # Кэш Path.parts без extension-папок: путь разбирается один раз на file_path
+        # (и для поиска папки автора, и для глубины, и для имени файла)
         _parts_cache: dict = {}
 
+        def _path_parts(file_path: str) -> tuple:
+            path_parts = _parts_cache.get(file_path)
+            if path_parts is None:
+                raw = _file_parts(file_path)
+                path_parts = tuple(
+                    p for i, p in enumerate(raw)
+                    if i == len(raw) - 1 or p.lower() not in FILE_EXTENSION_FOLDER_NAMES
+                )
+                _parts_cache[file_path] = path_parts
+            return path_parts
+
+        # Кэш _extract_series_from_filename по (имя файла, metadata_series):
+        # одинаковые имена встречаются в разных папках и форматах (fb2/epub)
+        _fn_series_cache: dict = {}
+
         def _is_strong_match(author: str, folder: str) -> bool:
             a = author.lower().replace('ё', 'е')
             f = folder.lower().replace('ё', 'е')
@@ -386,9 +660,9 @@ class Pass2SeriesFilename:
                 return True
             # Handle name-order variation (metadata "Имя Фамилия" vs folder "Фамилия Имя")
             # and multi-author strings: check if all folder words match any single author
-            f_words = set(re.sub(r'[^\w]', ' ', f).split())
+            f_words = set(_NON_WORD_RE.sub(' ', f).split())
             if f_words:
-                for single_author in re.split(r'[;,]', a):
+                for single_author in _AUTHOR_SPLIT_RE.split(a):
                     sa_words = set(single_author.strip().split())
                     if sa_words and f_words == sa_words:
                         return True
@@ -400,16 +674,8 @@ class Pass2SeriesFilename:
             # proposed_author (из папки или файла) или metadata_authors (из FB2).
             # Это гарантирует соблюдение приоритета независимо от author_source.
             author_name = record.proposed_author or record.metadata_authors or None
+            path_parts = _path_parts(record.file_path)
             if author_name:
-                path_parts = _parts_cache.get(record.file_path)
-                if path_parts is None:
-                    raw = Path(record.file_path).parts
-                    path_parts = tuple(
-                        p for i, p in enumerate(raw)
-                        if i == len(raw) - 1 or p.lower() not in FILE_EXTENSION_FOLDER_NAMES
-                    )
-                    _parts_cache[record.file_path] = path_parts
-
                 author_folder_idx = None
                 for i, part in enumerate(path_parts[:-1]):
                     if _is_strong_match(author_name, part):
@@ -453,15 +719,11 @@ class Pass2SeriesFilename:
                                 # НО: если скобки содержат псевдоним/псевдоним автора
                                 # ("Гоблин (MeXXanik)") — это НЕ "Серия (Автор)", а папка автора.
                                 author_folder_series = self._extract_series_from_folder_name(part)
-                                _parens_match = re.search(r'\(([^)]+)\)\s*$', part)
+                                _parens_match = _TRAILING_PARENS_CONTENT_RE.search(part)
                                 _parens_content = _parens_match.group(1).strip() if _parens_match else ''
 
                                 # Если скобки содержат "и др" / "et al" — это многоавторный хинт,
                                 # а НЕ дизамбигуатор автора: папка является серийной, не авторской.
-                                _ET_AL_RE = re.compile(
-                                    r'(?:и\s+др\.?|и\s+другие|et\s+al\.?|and\s+others)\s*$',
-                                    re.IGNORECASE
-                                )
                                 _is_multiauthor_hint = bool(_parens_content) and bool(_ET_AL_RE.search(_parens_content))
 
                                 _parens_is_author = (
@@ -479,7 +741,7 @@ class Pass2SeriesFilename:
                                     # Б) Иерархия: {цикл}\{Подсерия}
                                     # Убираем суффикс "(Автор)", но сохраняем числовой префикс "N. "
                                     # — он становится порядковым номером подсерии в компиляции.
-                                    subfolder_display = re.sub(r'\s*\([^)]*\)\s*$', '', series_folder).strip()
+                                    subfolder_display = _TRAILING_PARENS_RE.sub('', series_folder).strip()
                                     record.proposed_series = f"{author_folder_series}\\{subfolder_display}"
 
                                     # Костыль для многоавторных папок: "Серия (Фамилия и др)" →
@@ -489,13 +751,13 @@ class Pass2SeriesFilename:
                                         hint_lower = hint_surname.lower().replace('ё', 'е')
                                         # Ищем полное нормализованное имя в proposed_author (уже "Фамилия Имя")
                                         full_name = None
-                                        for pa_part in re.split(r'\s*,\s*', record.proposed_author or ''):
+                                        for pa_part in _COMMA_SPLIT_RE.split(record.proposed_author or ''):
                                             if any(hint_lower in w.lower().replace('ё', 'е') for w in pa_part.split()):
                                                 full_name = pa_part.strip()
                                                 break
                                         # Fallback: поиск в metadata_authors
                                         if not full_name:
-                                            for meta_a in re.split(r'[;,]', record.metadata_authors or ''):
+                                            for meta_a in _AUTHOR_SPLIT_RE.split(record.metadata_authors or ''):
                                                 meta_a = meta_a.strip()
                                                 if any(hint_lower in w.lower().replace('ё', 'е') for w in meta_a.split()):
                                                     full_name = meta_a
@@ -529,8 +791,8 @@ class Pass2SeriesFilename:
                         # Серию ищем сначала по имени файла, мета только подтверждает.
                         # ИСКЛЮЧЕНИЕ: "Серия (Автор)" — фамилия в скобках является лишь дизамбигуатором,
                         # такая папка — это серия; проверяем только хвост БЕЗ скобок.
-                        _part_no_parens = re.sub(r'\s*\([^)]*\)\s*$', '', part.strip()).strip()
-                        _part_words = re.split(r'[\s.\-]+', _part_no_parens) if _part_no_parens else re.split(r'[\s.\-]+', part.strip())
+                        _part_no_parens = _TRAILING_PARENS_RE.sub('', part.strip()).strip()
+                        _part_words = _FOLDER_WORD_SPLIT_RE.split(_part_no_parens) if _part_no_parens else _FOLDER_WORD_SPLIT_RE.split(part.strip())
                         _part_last_word = _part_words[-1].lower().replace('ё', 'е') if _part_words else ''
                         _author_words = set(w.lower().replace('ё', 'е') for w in author_name.split() if len(w) > 2)
                         # Check if ANY word in the folder (>2 chars) matches an author word.
@@ -573,42 +835,27 @@ class Pass2SeriesFilename:
                                     record.proposed_series = series_name
                                     record.series_source = "folder_hierarchy"
             
-            # Special case: depth==4 without series subfolder
-            # Pass 1 wrongly sets folder_dataset for depth==4, allowing Pass 2 to override it
-            file_depth = len(Path(record.file_path).parts)
-            # Учитываём если в пути есть extension-папки (они прозрачны, не считаются как уровень)
-            raw_parts = Path(record.file_path).parts
-            file_depth = len(tuple(
-                p for i, p in enumerate(raw_parts)
-                if i == len(raw_parts) - 1 or p.lower() not in FILE_EXTENSION_FOLDER_NAMES
-            ))
-            is_depth4_without_real_series = (
-                file_depth == 4 and 
-                record.series_source == "folder_dataset"
-            )
-            
-            if record.series_source == "folder_dataset" and not is_depth4_without_real_series:
-                if record.proposed_series:
-                    continue  # Папка дала series (кроме depth==4 ошибки)
-            
-            if record.series_source == "folder_hierarchy":
-                continue  # Иерархия папок определила серию - готово!
-
-            if record.series_source == "no_series_folder":
-                continue  # Папка «Вне серий» — серии нет, дальше не ищем
+            # Серия уже определена → extraction не нужен.
+            # Special case depth==4 (Pass 1 ставит folder_dataset ошибочно) сюда не
+            # попадает отдельно: при непустой proposed_series запись всё равно
+            # пропускалась, а при пустой — всегда шла в extraction, так что глубина
+            # на решение не влияет.
+            if record.proposed_series:
+                continue  # Серия уже установлена (папка / иерархия / dataset)
+            if record.series_source in ("folder_hierarchy", "no_series_folder"):
+                continue  # Иерархия папок определила серию / папка «Вне серий»
+
+            # Имя файла без расширения (как Path.stem) — из уже разобранного пути
+            file_stem = _path_stem(path_parts[-1]) if path_parts else ''
+            # metadata_series без пробелов по краям (и в нижнем регистре, и с ё→е) —
+            # для всех сравнений ниже считается один раз на запись
+            meta_s = record.metadata_series.strip() if record.metadata_series else ''
+            meta_low = meta_s.lower()
+            meta_norm = meta_low.replace('ё', 'е')
 
-            if record.proposed_series and not is_depth4_without_real_series:
-                continue  # Серия уже установлена (кроме depth==4 ошибки)
-            
-            # ОБЯЗАТЕЛЬНО пробуемы паттерны (глубина НЕ влияет!)
-            # Если series уже установлена из папок → пропускаем extraction
-            # Но если folder_dataset дал пустую серию — продолжаем extraction из filename
-            if record.series_source == "folder_dataset" and record.proposed_series:
-                continue  # Folder extraction already set hierarchical series
-            
             # Если папка НЕ дала series → пробуем extraction из filename
-            series_candidate = self._extract_series_from_filename(
-                record.file_path, validate=False, metadata_series=record.metadata_series
+            series_candidate = self._extract_series_from_filename_cached(
+                record.file_path, path_parts, record.metadata_series, _fn_series_cache
             )
 
             if series_candidate:
@@ -620,8 +867,7 @@ class Pass2SeriesFilename:
                     # запятая является частью настоящего названия серии ("Мы, Мигель Мартинес")
                     _meta_confirms_comma = (
                         record.metadata_series and
-                        series_candidate.lower().replace('ё', 'е') ==
-                        record.metadata_series.strip().lower().replace('ё', 'е')
+                        series_candidate.lower().replace('ё', 'е') == meta_norm
                     )
                     if not _meta_confirms_comma:
                         # Считаем это списком авторов только если после каждой запятой
@@ -642,12 +888,12 @@ class Pass2SeriesFilename:
                     # это ложный матч (например "Книга" в service_words увела нас не туда).
                     # Очищаем file_title от мусора [litres] и сравниваем.
                     import re as _re
-                    _title_clean = _re.sub(r'\s*\[.*?\]\s*$', '', record.file_title.strip())
+                    _title_clean = _TRAILING_BRACKETS_RE.sub('', record.file_title.strip())
                     # Также убрать (ЛП), (альт. перевод) и т.п. скобочные суффиксы
-                    _title_no_parens = _re.sub(r'\s*\([^)]*\)\s*$', '', _title_clean).strip()
+                    _title_no_parens = _TRAILING_PARENS_RE.sub('', _title_clean).strip()
                     # Нормализуем кандидата: убираем ведущий пунктуационный мусор ("- Траун" → "Траун"),
                     # чтобы title-collision guard правильно сравнивал с заголовком книги.
-                    _cand_for_guard = _re.sub(r'^[\-–—\s]+', '', series_candidate).strip()
+                    _cand_for_guard = _LEADING_DASHES_RE.sub('', series_candidate).strip()
                     _cand_lower = _cand_for_guard.lower()
                     _title_lower = _title_clean.lower()
                     _title_np_lower = _title_no_parens.lower()
@@ -680,15 +926,14 @@ class Pass2SeriesFilename:
                     _is_meta_with_service_suffix = bool(
                         _meta_lower and not _is_confirmed_by_meta and not _is_meta_prefix and
                         _cand_lower_norm.startswith(_meta_lower) and
-                        _re.match(r'^[\W\s]*(|(\w+\s*)+)$',
-                                  _cand_lower_norm[len(_meta_lower):].strip())
+                        _WORDS_TAIL_RE.match(_cand_lower_norm[len(_meta_lower):].strip())
                         and all(
                             w in self.service_words or w.isdigit()
                             for w in _cand_lower_norm[len(_meta_lower):].split()
                             if w.isalpha()
                         )
                     )
-                    _fn_stem_lower = Path(record.file_path).stem.lower()
+                    _fn_stem_lower = file_stem.lower()
                     _is_in_parens = bool(_re.search(r'\(\s*' + _re.escape(_cand_lower), _fn_stem_lower))
                     # ИСКЛЮЧЕНИЕ 4: серия получена блок-матчером с score=1.0 И подтверждена metadata_series.
                     # Только с metadata-подтверждением: title совпадает с серией у omnibus или 1-й книги.
@@ -728,112 +973,69 @@ class Pass2SeriesFilename:
                     record.extracted_series_candidate = series_candidate
 
             # Если прошел базовые фильтры → валидация
-            if series_candidate:
-                clean = self._clean_series_name(
-                    series_candidate,
-                    keep_trailing_number=self._last_was_hierarchical
-                )
-
-                # ✅ НОВОЕ: Удалить слова из blacklist вместо полного отвергания
-                clean = self._remove_blacklist_words(clean)
-        
-                if clean:  # Проверяем что что-то осталось после очистки
-                    author_for_validation = record.proposed_author or None
-
-                    if self._is_valid_series(clean, extracted_author=author_for_validation):
-                        # Мета используется ТОЛЬКО для подтверждения серии из имени файла,
-                        # но НЕ для её расширения. Если из файла извлечено "Чингисхан",
-                        # а мета говорит "Чингисхан. Хроники завоевателя" — оставляем "Чингисхан".
-                        # Исправляем грамматику русского языка (добавляем запятую перед "что")
-                        clean = self._fix_russian_grammar(clean)
-                        record.proposed_series = clean
-                        record.series_source = "filename"
-                        if (record.metadata_series and
-                                record.metadata_series.strip().lower() == clean.lower()):
-                            record.series_source = "filename+meta_confirmed"
-                        # Если иерархический root содержит trailing number, а metadata_series
-                        # совпадает с root БЕЗ числа — число является позицией книги, не частью
-                        # названия серии. Пример: «Север и Юг 01\Великая сага» + meta «Север и Юг»
-                        # → proposed_series = «Север и Юг» (иначе каждая книга в отдельной группе).
-                        if record.metadata_series and '\\' in (record.proposed_series or ''):
-                            _root_h, _sub_h = record.proposed_series.split('\\', 1)
-                            _root_h = _root_h.strip()
-                            _root_no_num = re.sub(r'\s+\d+\s*$', '', _root_h).strip()
-                            _meta_s = record.metadata_series.strip()
-                            if (_root_no_num and _root_no_num != _root_h and
-                                    _root_no_num.lower().replace('ё', 'е') ==
-                                    _meta_s.lower().replace('ё', 'е')):
-                                _sub_stripped = _sub_h.strip()
-                                _sub_is_num_only = bool(re.match(r'^\d+$', _sub_stripped))
-                                _sub_is_meta_dup = (_sub_stripped.lower().replace('ё', 'е') ==
-                                                    _meta_s.lower().replace('ё', 'е'))
-                                if _sub_is_num_only or _sub_is_meta_dup:
-                                    # Подсерия — чисто цифровая или дублирует metadata:
-                                    # «Север и Юг 01\12» или «Серия 1\Серия» → стираем до metadata
-                                    record.proposed_series = _meta_s
-                                    record.series_source = "filename+meta_confirmed"
-                                # else: подсерия — реальное название («Аспект-Император»);
-                                # оставляем proposed_series без изменений (с числом в root)
-                        continue
+            # Мета используется ТОЛЬКО для подтверждения серии из имени файла,
+            # но НЕ для её расширения. Если из файла извлечено "Чингисхан",
+            # а мета говорит "Чингисхан. Хроники завоевателя" — оставляем "Чингисхан".
+            if series_candidate and self._accept_filename_series(record, series_candidate, meta_low, meta_norm):
+                continue
 
             # Fallback: metadata ТОЛЬКО если паттерны не дали
             if not series_candidate:
-                file_name = Path(record.file_path).stem  # Имя без расширения
+                file_name = file_stem  # Имя без расширения
                 
                 # ✅ ВАЖНО: Удалить метатеги из конца чтобы fallback правила работали!
                 # "(СИ)" - Самиздат/Интернет
                 # "(ЛП)" - Лицензионное произведение
-                file_name_for_fallback = re.sub(r'\s*\([СЛ]И\)\s*$', '', file_name).strip()
+                file_name_for_fallback = _SI_LP_TAIL_RE.sub('', file_name).strip()
                 
                 # Перед fallback к metadata попробуем простое правило: Author. Series RomanNumeral
                 # "Яманов Александр. Бесноватый Цесаревич I.fb2" → "Бесноватый Цесаревич"
                 if '. ' in file_name_for_fallback:
-                    parts = file_name_for_fallback.split('. ', 1)
-                    if len(parts) == 2:
-                        first_part = parts[0].strip()
-                        second_part = parts[1].strip()
-                        
-                        # Проверяем что первая часть это автор (< 50 символов, без цифр)
-                        looks_like_author = (
-                            len(first_part) < 50 and
-                            not any(digit in first_part for digit in '0123456789')
-                        )
-                        
-                        if looks_like_author:
-                            # Убрать аннотацию в скобках с конца перед матчингом диапазона:
-                            # "Маршал 1-9 (без иллюстраций)" → "Маршал 1-9"
-                            second_part_bare = re.sub(r'\s*\([^)]*\)\s*$', '', second_part).strip()
-                            # Убрать год-суффикс (1900–2099) — не должен трактоваться как номер тома:
-                            # "Том Ⅰ - 2022" → "Том Ⅰ"  /  "Серия 1 2023" → "Серия 1"
-                            second_part_bare = re.sub(r'(?:\s*[-–—])?\s*(?:19|20)\d{2}\s*$', '', second_part_bare).strip()
-                            # Диапазон N-M: "Совок 1-5", "Попаданец в Дракона 1-8"
-                            match = re.search(r'^(.+?)\s+\d+[-\u2013\u2014]\d+\s*$', second_part_bare)
-                            is_range_match = bool(match)
-                            if not match:
-                                # Одиночное арабское число: "Охотник 1"
-                                match = re.search(r'^(.+?)\s+\d+\s*$', second_part_bare)
-                            if not match:
-                                # Римские цифры: "Бесноватый Цесаревич I"
-                                match = re.search(r'^(.+?)\s+[IVX]+\s*$', second_part_bare)
-                            if match:
-                                simple_series = match.group(1).strip()
-                                _ftitle = (record.file_title or '').lower()
-                                # Диапазон N-M в имени файла — однозначный признак серии,
-                                # даже если название совпадает с заголовком книги.
-                                # Пример: "Хакер 1-2.fb2", file_title="Хакер" → серия "Хакер" корректна.
-                                _in_title = (not is_range_match and
-                                             bool(_ftitle and simple_series.lower() in _ftitle))
-                                if not _in_title and self._is_valid_series(simple_series, extracted_author=record.proposed_author):
-                                    series_candidate = simple_series
+                    first_part, _, second_part = file_name_for_fallback.partition('. ')
+                    first_part = first_part.strip()
+                    second_part = second_part.strip()
+                    
+                    # Проверяем что первая часть это автор (< 50 символов, без цифр)
+                    looks_like_author = (
+                        len(first_part) < 50 and
+                        not any(digit in first_part for digit in '0123456789')
+                    )
+                    
+                    if looks_like_author:
+                        # Убрать аннотацию в скобках с конца перед матчингом диапазона:
+                        # "Маршал 1-9 (без иллюстраций)" → "Маршал 1-9"
+                        second_part_bare = _TRAILING_PARENS_RE.sub('', second_part).strip()
+                        # Убрать год-суффикс (1900–2099) — не должен трактоваться как номер тома:
+                        # "Том Ⅰ - 2022" → "Том Ⅰ"  /  "Серия 1 2023" → "Серия 1"
+                        second_part_bare = _YEAR_SUFFIX_RE.sub('', second_part_bare).strip()
+                        # Диапазон N-M: "Совок 1-5", "Попаданец в Дракона 1-8"
+                        match = _RANGE_TAIL_RE.search(second_part_bare)
+                        is_range_match = bool(match)
+                        if not match:
+                            # Одиночное арабское число: "Охотник 1"
+                            match = _NUMBER_TAIL_RE.search(second_part_bare)
+                        if not match:
+                            # Римские цифры: "Бесноватый Цесаревич I"
+                            match = _ROMAN_TAIL_RE.search(second_part_bare)
+                        if match:
+                            simple_series = match.group(1).strip()
+                            _ftitle = (record.file_title or '').lower()
+                            # Диапазон N-M в имени файла — однозначный признак серии,
+                            # даже если название совпадает с заголовком книги.
+                            # Пример: "Хакер 1-2.fb2", file_title="Хакер" → серия "Хакер" корректна.
+                            _in_title = (not is_range_match and
+                                         bool(_ftitle and simple_series.lower() in _ftitle))
+                            if not _in_title and self._is_valid_series(simple_series, extracted_author=record.proposed_author):
+                                series_candidate = simple_series
                 
                 # ✅ НОВОЕ: Попробуем "Author - Series NUM или N-M" паттерн
                 # "Шалашов Евгений - Господин следователь 2" → "Господин следователь"
                 # Также: "Author - Series N. Title" (число не в конце, за ним ". Title")
                 if not series_candidate and ' - ' in file_name_for_fallback:
-                    match = re.match(r'^(.+?)\s*-\s*(.+?)\s+(?:\d+[-\u2013\u2014]\d+|\d+|[IVX]+)\s*$', file_name_for_fallback)
+                    match = _DASH_SERIES_NUM_RE.match(file_name_for_fallback)
                     if not match:
                         # Попытка: "Author - Series N. Title"
-                        match = re.match(r'^(.+?)\s*-\s*(.+?)\s+\d{1,2}\.\s+.+$', file_name_for_fallback)
+                        match = _DASH_SERIES_NUM_TITLE_RE.match(file_name_for_fallback)
                     if match:
                         first_part = match.group(1).strip()
                         series_part = match.group(2).strip()
@@ -850,7 +1052,7 @@ class Pass2SeriesFilename:
                             # ИСКЛЮЧЕНИЕ: если кандидат стоит перед номером тома в имени файла
                             # ("Королевство Костей и Терний 1. Терновый Король") →
                             # это явная серия, даже если _in_title=False по другим причинам.
-                            _fn_stem_fb = Path(record.file_path).stem.lower().replace('ё', 'е')
+                            _fn_stem_fb = file_stem.lower().replace('ё', 'е')
                             _sp_norm = series_part.lower().replace('ё', 'е')
                             _is_numbered_in_fn = bool(re.search(
                                 re.escape(_sp_norm) + r'[\s.]+\d+[\s.]',
@@ -862,116 +1064,45 @@ class Pass2SeriesFilename:
             if series_candidate:
                 # Из filename extraction найдена серия
                 record.extracted_series_candidate = series_candidate
-                clean = self._clean_series_name(
-                    series_candidate, 
-                    keep_trailing_number=self._last_was_hierarchical
-                )
-                # ✅ НОВОЕ: Удалить слова из blacklist вместо полного отвергания
-                clean = self._remove_blacklist_words(clean)
-                
-                if clean:  # Проверяем что что-то осталось после очистки
-                    author_for_validation = record.proposed_author or None
-                    
-                    if self._is_valid_series(clean, extracted_author=author_for_validation):
-                        # Исправляем грамматику русского языка (добавляем запятую перед "что")
-                        clean = self._fix_russian_grammar(clean)
-                        record.proposed_series = clean
-                        record.series_source = "filename"
-                        if (record.metadata_series and
-                                record.metadata_series.strip().lower() == clean.lower()):
-                            record.series_source = "filename+meta_confirmed"
-                        # Если иерархический root содержит trailing number, а metadata_series
-                        # совпадает с root БЕЗ числа — число является позицией книги, не частью
-                        # названия серии. Пример: «Север и Юг 01\Великая сага» + meta «Север и Юг»
-                        # → proposed_series = «Север и Юг» (иначе каждая книга в отдельной группе).
-                        if record.metadata_series and '\\' in (record.proposed_series or ''):
-                            _root_h, _sub_h = record.proposed_series.split('\\', 1)
-                            _root_h = _root_h.strip()
-                            _root_no_num = re.sub(r'\s+\d+\s*$', '', _root_h).strip()
-                            _meta_s = record.metadata_series.strip()
-                            if (_root_no_num and _root_no_num != _root_h and
-                                    _root_no_num.lower().replace('ё', 'е') ==
-                                    _meta_s.lower().replace('ё', 'е')):
-                                _sub_stripped = _sub_h.strip()
-                                _sub_is_num_only = bool(re.match(r'^\d+$', _sub_stripped))
-                                _sub_is_meta_dup = (_sub_stripped.lower().replace('ё', 'е') ==
-                                                    _meta_s.lower().replace('ё', 'е'))
-                                if _sub_is_num_only or _sub_is_meta_dup:
-                                    # Подсерия — чисто цифровая или дублирует metadata:
-                                    # «Север и Юг 01\12» или «Серия 1\Серия» → стираем до metadata
-                                    record.proposed_series = _meta_s
-                                    record.series_source = "filename+meta_confirmed"
-                                # else: подсерия — реальное название («Аспект-Император»);
-                                # оставляем proposed_series без изменений (с числом в root)
+                self._accept_filename_series(record, series_candidate, meta_low, meta_norm)
             elif record.metadata_series:
-                # ✅ ЗАЩИТА: Перед использованием metadata - проверяем наличие слов из blacklist
-                # ТРЕБОВАНИЕ: "если мета содержит слово или слова из BL, полностью ее игнорируем в качестве значения"
-                # Пример: "Шедевры фантастики (продолжатели)" содержит "фантастики" → отклоняем целиком
-                # ВАЖНО: word-boundary matching, не substring — "попаданец" не должен блокировать
-                # легитимное "Попаданец в Дракона" является реальной серией
-                meta_lower = record.metadata_series.lower()
-                has_blacklist_word = False
-                for bl in self.filename_blacklist:
-                    bl_lower = bl.lower().strip()
-                    if not bl_lower:
-                        continue
-                    # Для коротких слов (≤3 символа) — word-boundary; для длинных — word-boundary тоже
-                    pat = r'(?<![а-яёa-z])' + re.escape(bl_lower) + r'(?![а-яёa-z])'
-                    if re.search(pat, meta_lower):
-                        has_blacklist_word = True
-                        break
+                # ✅ Проверяем целиком ли metadata в blacklist
+                # Пример: "Современный фантастический боевик (АСТ)" → без "(АСТ)" = "Современный фантастический боевик"
+                metadata_base = record.metadata_series.replace(' (АСТ)', '').replace('(АСТ)', '').strip()
+                is_pure_blacklist = any(
+                    metadata_base.lower() == bl.lower() 
+                    for bl in self.filename_blacklist
+                )
                 
-                if has_blacklist_word:
-                    # metadata содержит слова из blacklist → игнорируем целиком, не используем как series
-                    pass
-                else:
-                    # ✅ ДОПОЛНИТЕЛЬНО: Проверяем целиком ли она в blacklist
-                    # Пример: "Современный фантастический боевик (АСТ)" → без "(АСТ)" = "Современный фантастический боевик"
-                    metadata_base = record.metadata_series.replace(' (АСТ)', '').replace('(АСТ)', '').strip()
-                    is_pure_blacklist = any(
-                        metadata_base.lower() == bl.lower() 
-                        for bl in self.filename_blacklist
-                    )
-                    
-                    if is_pure_blacklist:
-                        # Весь metadata это blacklist → пропускаем (series остаётся пустой)
-                        pass
-                    else:
-                        # Fallback к metadata - только если из filename ничего не нашли
-                        series = self._extract_series_from_metadata(record.metadata_series.strip())
-                        # Очищаем от скобочных суффиксов (автор в скобках, номера томов и т.п.)
-                        # Пример: "Путь (Михаил Игнатов)" → "Путь"
-                        series = self._clean_series_name(series)
-
-                        # ✅ Удалить слова из blacklist также из metadata серии
-                        series = self._remove_blacklist_words(series)
-                        
-                        author_for_validation = record.proposed_author or None
-                        if series and self._is_valid_series(series, extracted_author=author_for_validation):
-                            # Исправляем грамматику русского языка (добавляем запятую перед "что")
-                            series = self._fix_russian_grammar(series)
-                            record.proposed_series = series
-                            
-                            # 🔑 Папка уже была проверена выше. Если мы здесь → это просто metadata series (не совпадает с папкой)
-                            record.series_source = "metadata"
+                if not is_pure_blacklist:
+                    # Fallback к metadata - только если из filename ничего не нашли.
+                    # ✅ ЗАЩИТА (внутри): мета со словом из blacklist игнорируется целиком
+                    # ("Шедевры фантастики (продолжатели)" содержит "фантастики"), word-boundary —
+                    # "попаданец" не блокирует легитимное "Попаданец в Дракона".
+                    # Очищаем от скобочных суффиксов: "Путь (Михаил Игнатов)" → "Путь"
+                    # 🔑 Папка уже была проверена выше. Если мы здесь → это просто metadata series (не совпадает с папкой)
+                    self._apply_metadata_series(record, meta_s, meta_low, clean=True)
         
         # 🔑 НОВОЕ: Папочный консенсус
         # Если папка содержит файлы с series_source = "folder_dataset",
         # то ВСЕ файлы в этой папке должны получить одинаковую серию из папки
-        self._apply_folder_consensus(records)
+        # Группировка по папке (parent directory) — одна на все папочные проходы ниже:
+        # file_path в них не меняется, меняются только серия/автор записей
+        folder_groups = self._group_by_folder(records)
+        self._apply_folder_consensus(records, folder_groups)
 
         # 🔑 УНИФИКАЦИЯ АВТОРА внутри папки
         # Если в папке есть файлы с folder_dataset — их автор применяется ко всем
         # файлам в папке с source='metadata_folder_confirmed' (исправляет файлы
         # с испорченными метаданными, которые не смогли пройти валидацию propagate).
-        self._unify_folder_author_source(records)
+        self._unify_folder_author_source(records, folder_groups)
 
         # 🔑 УНИФИКАЦИЯ источника серии внутри папки
         # Если хотя бы один файл в папке получил folder_hierarchy — значит папка
         # является авторитетом для всей папки. Все metadata_folder_confirmed файлы
         # в той же папке должны получить folder_hierarchy с той же серией.
-        self._unify_folder_series_source(records)
-        self._split_umbrella_folder_series(records)
+        self._unify_folder_series_source(records, folder_groups)
+        self._split_umbrella_folder_series(records, folder_groups)
 
         # (автор из папки уже распространён в начале execute(), до основного цикла)
 
@@ -986,31 +1117,9 @@ class Pass2SeriesFilename:
             # Пропускаем если значение совпадает с именем автора
             if record.proposed_author and meta.lower() == record.proposed_author.lower():
                 continue
-            # Word-boundary blacklist check (как в основном блоке)
-            meta_lower = meta.lower()
-            _has_bl = False
-            for bl in self.filename_blacklist:
-                bl_lower = bl.lower().strip()
-                if not bl_lower:
-                    continue
-                pat = r'(?<![а-яёa-z])' + re.escape(bl_lower) + r'(?![а-яёa-z])'
-                if re.search(pat, meta_lower):
-                    _has_bl = True
-                    break
-            if _has_bl:
-                continue
-            # Применяем те же серийные паттерны и валидацию что и в основном блоке
-            series = self._extract_series_from_metadata(meta)
-            series = self._remove_blacklist_words(series)
-            if not series:
-                continue
-            author_for_validation = record.proposed_author or None
-            if not self._is_valid_series(series, extracted_author=author_for_validation):
-                continue
-            series = self._fix_russian_grammar(series)
-            # Используем как серию с источником "metadata"
-            record.proposed_series = series
-            record.series_source = "metadata"
+            # Те же blacklist-проверка, серийные паттерны и валидация что и в основном
+            # блоке, но без _clean_series_name
+            self._apply_metadata_series(record, meta, meta.lower(), clean=False)
 
         # ✅ ФИНАЛЬНОЕ: Восстановить парные кавычки во всех series
         # Если в series_кандидате есть открывающиеся кавычки без закрывающихся,
@@ -1022,7 +1131,9 @@ class Pass2SeriesFilename:
                 # ✅ ФИНАЛЬНОЕ: Удалить завершающий backslash
                 # Некоторые значения могут заканчиваться на "\", это ошибка обработки иерархий
                 # Пример: "Мир Алекса Королева\" должно быть "Мир Алекса Королева"
-                record.proposed_series = record.proposed_series.rstrip('\\')
+                # Одна и та же серия повторяется у многих записей — интернируем,
+                # чтобы группировки пост-проходов сравнивали строки по ссылке
+                record.proposed_series = sys.intern(record.proposed_series.rstrip('\\'))
         
         # ✅ ФИНАЛЬНОЕ: если файл имеет плоскую серию «Брия», а другие файлы того же
         # автора уже имеют подсерии «Брия 1\...», «Брия 3\...» — значит «Брия» является
@@ -1040,7 +1151,7 @@ class Pass2SeriesFilename:
                 continue
             root = rec.proposed_series.split('\\')[0].strip()
             # Убираем число из корня, чтобы сравнивать «Брия» == «Брия» (без "1" или "3")
-            root_base = re.sub(r'\s+\d+\s*$', '', root).strip()
+            root_base = _TRAILING_NUMBER_RE.sub('', root).strip()
             ak = _norm(rec.proposed_author or '')
             _author_roots.setdefault(ak, {})[_norm(root_base)] = root_base
 
@@ -1054,7 +1165,8 @@ class Pass2SeriesFilename:
             # Только если этот же автор имеет подсерии с тем же корнем
             if ak not in _author_roots or series_norm not in _author_roots[ak]:
                 continue
-            stem = Path(record.file_path).stem
+            path_parts = _path_parts(record.file_path)
+            stem = _path_stem(path_parts[-1]) if path_parts else ''
             stem_norm = _norm(stem)
             _escaped = re.escape(series_norm)
             _pat = re.compile(_escaped + r'\s+(\d{1,4})\s*[.\-–—]', re.UNICODE)
@@ -1102,7 +1214,7 @@ class Pass2SeriesFilename:
         for record in records:
             if not record.file_path:
                 continue
-            stem = Path(record.file_path).stem
+            stem = _file_stem(record.file_path)
             m = _PREFIX_RE.match(stem)
             if not m:
                 continue
@@ -1123,7 +1235,7 @@ class Pass2SeriesFilename:
         имя подсерии непосредственно перед номером («Приквелы 2.»).
         """
         import unicodedata as _ud
-        _norm = lambda s: re.sub(r'\s+', ' ', _ud.normalize('NFC', s).lower()
+        _norm = lambda s: _WS_RUN_RE.sub(' ', _ud.normalize('NFC', s).lower()
                                  .replace('ё', 'е')).strip()
 
         # 1. Собираем иерархические записи: (author_norm, root_base_norm) → [(root_display, sub_display, rec)]
@@ -1137,7 +1249,7 @@ class Pass2SeriesFilename:
             sub = sub.strip()
             if not sub:
                 continue
-            root_base = re.sub(r'\s+\d+\s*$', '', root).strip()
+            root_base = _TRAILING_NUMBER_RE.sub('', root).strip()
             key = (_norm(rec.proposed_author or ''), _norm(root_base))
             hier_map[key].append((root_base, sub, rec))
 
@@ -1168,7 +1280,7 @@ class Pass2SeriesFilename:
                     continue
                 if _norm(rec.proposed_series or '') != root_k:
                     continue
-                stem_norm = _norm(Path(rec.file_path).stem)
+                stem_norm = _norm(_file_stem(rec.file_path))
                 if _sub_re.search(stem_norm):
                     rec.proposed_series = flat_series_display
 
@@ -1207,7 +1319,7 @@ class Pass2SeriesFilename:
             r'(?:том|книга|часть|выпуск|арка|book|vol\.?|part)\s+(\d{1,4})\b',
             re.IGNORECASE | re.UNICODE,
         )
-        _norm = lambda s: re.sub(r'\s+', ' ', re.sub(r'[.,:;!?]+', ' ', unicodedata.normalize('NFC', s).lower().replace('ё', 'е'))).strip()
+        _norm = lambda s: _WS_RUN_RE.sub(' ', _SENTENCE_PUNCT_RE.sub(' ', unicodedata.normalize('NFC', s).lower().replace('ё', 'е'))).strip()
 
         # Regex для извлечения числа из стема файла когда series_number пуст.
         # Ищем паттерн «СЛОВО N.» или «СЛОВО N » в имени файла.
@@ -1219,10 +1331,10 @@ class Pass2SeriesFilename:
         def _sn_from_stem(rec) -> str:
             """Вернуть series_number из метаданных или из стема файла."""
             sn = (rec.series_number or '').strip()
-            if sn and re.match(r'^\d+$', sn):
+            if sn and _DIGITS_ONLY_RE.match(sn):
                 return sn
             # Пробуем извлечь из имени файла: последнее вхождение «СЛОВО N.»
-            stem = Path(rec.file_path).stem
+            stem = _file_stem(rec.file_path)
             matches = _STEM_SN_RE.findall(stem)
             return matches[-1] if matches else ''
 
@@ -1263,7 +1375,7 @@ class Pass2SeriesFilename:
                     continue
                 tom_values = []
                 for r in recs:
-                    m = _TOM_RE.search(Path(r.file_path).stem)
+                    m = _TOM_RE.search(_file_stem(r.file_path))
                     if m:
                         tom_values.append(int(m.group(1)))
                 # ≥2 файлов с Том-keyword И все их числа различны
@@ -1285,7 +1397,7 @@ class Pass2SeriesFilename:
                     )
                     _quals: set = set()
                     for r in recs:
-                        _qm = _qual_re.search(Path(r.file_path).stem)
+                        _qm = _qual_re.search(_file_stem(r.file_path))
                         if _qm:
                             _quals.add(_norm(_qm.group(1)))
                     if len(_quals) >= 2:
@@ -1304,7 +1416,7 @@ class Pass2SeriesFilename:
                     for rec in recs:
                         rec.proposed_series = f'{rec.proposed_series.strip()} {sn}'
                         # Для файлов с Том-keyword: series_number ← M из «Том M»
-                        tm = _TOM_RE.search(Path(rec.file_path).stem)
+                        tm = _TOM_RE.search(_file_stem(rec.file_path))
                         if tm:
                             rec.series_number = tm.group(1)
             else:
@@ -1316,7 +1428,7 @@ class Pass2SeriesFilename:
                         re.UNICODE,
                     )
                     for rec in recs:
-                        _qm = _qual_re.search(Path(rec.file_path).stem)
+                        _qm = _qual_re.search(_file_stem(rec.file_path))
                         if _qm:
                             rec.proposed_series = f'{rec.proposed_series.strip()} {_qm.group(1)}'
 
@@ -1344,7 +1456,7 @@ class Pass2SeriesFilename:
         # folder_prefix → hint_surname (lower)
         hint_map: Dict[str, str] = {}  # folder_prefix_str → hint_surname_lower
         for record in records:
-            parts = Path(record.file_path).parts[:-1]
+            parts = _file_parts(record.file_path)[:-1]
             for i, part in enumerate(parts):
                 m = _PARENS_ET_AL_RE.search(part)
                 if m:
@@ -1364,11 +1476,11 @@ class Pass2SeriesFilename:
             canonical = None
             # Ищем среди всех records что лежат под этим prefix
             for record in records:
-                record_prefix = str(Path(*Path(record.file_path).parts[:-1]))
+                record_prefix = _file_parent(record.file_path)
                 if not (record_prefix == prefix or record_prefix.startswith(prefix + '\\')):
                     continue
                 # Ищем hint в proposed_author (приоритет — уже нормализовано)
-                for pa_part in re.split(r'\s*,\s*', record.proposed_author or ''):
+                for pa_part in _COMMA_SPLIT_RE.split(record.proposed_author or ''):
                     pa_part = pa_part.strip()
                     pa_clean = _ET_AL_RE.sub('', pa_part).strip()
                     pa_words = pa_clean.split()
@@ -1381,7 +1493,7 @@ class Pass2SeriesFilename:
                 if canonical and len(canonical.split()) == 2:
                     break
                 # Fallback: ищем в metadata_authors (могут содержать полное имя)
-                for meta_part in re.split(r'[;,]', record.metadata_authors or ''):
+                for meta_part in _AUTHOR_SPLIT_RE.split(record.metadata_authors or ''):
                     meta_part = meta_part.strip()
                     meta_clean = _ET_AL_RE.sub('', meta_part).strip()
                     meta_words = meta_clean.split()
@@ -1405,7 +1517,7 @@ class Pass2SeriesFilename:
         # Вычислить series_name для каждого prefix ("Отрок_Сотник (Красницкий и др)" → "Отрок_Сотник")
         prefix_series: Dict[str, str] = {}
         for prefix in canonical_map:
-            folder_name = Path(prefix).name if Path(prefix).name else prefix
+            folder_name = _file_name(prefix) or prefix
             series_name = self._extract_series_from_folder_name(folder_name)
             prefix_series[prefix] = series_name or folder_name
 
@@ -1413,8 +1525,8 @@ class Pass2SeriesFilename:
         fixed_author = 0
         fixed_series = 0
         for record in records:
-            record_parts = Path(record.file_path).parts
-            record_prefix = str(Path(*record_parts[:-1]))
+            record_parts = _file_parts(record.file_path)
+            record_prefix = _file_parent(record.file_path)
             for prefix, canonical in canonical_map.items():
                 if not (record_prefix == prefix or record_prefix.startswith(prefix + '\\')):
                     continue
@@ -1429,7 +1541,7 @@ class Pass2SeriesFilename:
 
                 # Серия: определяем подпапку сразу под prefix
                 root_series = prefix_series[prefix]
-                prefix_parts = Path(prefix).parts
+                prefix_parts = _file_parts(prefix)
                 # Индекс папки-хинта в record_parts
                 hint_depth = len(prefix_parts)  # сколько частей составляет prefix
                 # Следующий элемент после prefix — подпапка серии (если есть)
@@ -1467,20 +1579,13 @@ class Pass2SeriesFilename:
         В таких случаях серия наследуется от родительской папки.
         """
         folder_lower = folder_name.lower().replace('ё', 'е')
-        for kw in self.variant_folder_keywords:
-            kw_lower = kw.lower()
-            # Для коротких ключевых слов (≤3 символа, напр. "ЛП", "СИ", "alt")
-            # используем word-boundary, чтобы не срабатывать на подстроки
-            # ("си" в "псионик" не должно давать True).
-            # Для длинных — простое вхождение достаточно.
-            if len(kw_lower) <= 3:
-                if re.search(r'(?<![а-яёa-z])' + re.escape(kw_lower) + r'(?![а-яёa-z])',
-                             folder_lower):
-                    return True
-            else:
-                if kw_lower in folder_lower:
-                    return True
-        return False
+        # Для коротких ключевых слов (≤3 символа, напр. "ЛП", "СИ", "alt")
+        # используем word-boundary, чтобы не срабатывать на подстроки
+        # ("си" в "псионик" не должно давать True).
+        # Для длинных — простое вхождение достаточно.
+        if any(kw_re.search(folder_lower) for kw_re in self._variant_short_kw_res):
+            return True
+        return any(kw_lower in folder_lower for kw_lower in self._variant_long_kws)
 
     def _propagate_ancestor_folder_authors(self, records: List[BookRecord]) -> None:
         """
@@ -1512,11 +1617,8 @@ class Pass2SeriesFilename:
             # Используем word-boundary matching чтобы короткие записи ("СИ", "ЛП" и т.п.)
             # не давали ложных срабатываний внутри слов (напр. "СИ" в "макСИм").
             folder_lower = folder_name.lower()
-            for bl in self.filename_blacklist:
-                bl_lower = bl.lower()
-                if re.search(r'(?<![а-яёa-z])' + re.escape(bl_lower) + r'(?![а-яёa-z])',
-                             folder_lower):
-                    return ''
+            if any(bl_re.search(folder_lower) for bl_re in self._bl_folder_res):
+                return ''
             author = parse_author_from_folder_name(
                 folder_name,
                 male_names=self.male_names,
@@ -1538,7 +1640,7 @@ class Pass2SeriesFilename:
                     break
             # 2. Паттерн инициала: "А.Фамилия" — инициал не должен быть частью слова (МИ<Ф>)
             if not author_valid:
-                if re.search(r'(?<![а-яёА-Я])[А-Я]\.*\s*[А-Я][а-яё]+', author):
+                if _INITIAL_SURNAME_RE.search(author):
                     author_valid = True
             if not author_valid:
                 return ''
@@ -1551,7 +1653,7 @@ class Pass2SeriesFilename:
             if record.author_source == "folder_dataset":
                 continue  # Уже точно определён — не трогаем
 
-            path_parts = Path(record.file_path).parts[:-1]  # все папки без самого файла
+            path_parts = _file_parts(record.file_path)[:-1]  # все папки без самого файла
             # Прозрачно исключаем технические папки (fb2, epub и т.п.)
             path_parts = tuple(
                 p for p in path_parts
@@ -1580,7 +1682,7 @@ class Pass2SeriesFilename:
                     )
                     if record.metadata_authors and not _meta_is_collective and not _proposed_is_collective:
                         author_words = set(parsed_author.lower().split())
-                        meta_words = set(re.sub(r'[;,]', ' ', record.metadata_authors.lower()).split())
+                        meta_words = set(_AUTHOR_SPLIT_RE.sub(' ', record.metadata_authors.lower()).split())
                         if author_words and meta_words and not (author_words & meta_words):
                             break  # Папка не подтверждена метой — не перезаписываем
                     if parsed_author != record.proposed_author or record.author_source != "folder_dataset":
@@ -1592,7 +1694,17 @@ class Pass2SeriesFilename:
         if propagated:
             self.logger.log(f"[PASS 2 Series] Propagated ancestor folder author to {propagated} records")
 
-    def _unify_folder_author_source(self, records: List[BookRecord]) -> None:
+    @staticmethod
+    def _group_by_folder(records: List[BookRecord]) -> Dict[str, List[BookRecord]]:
+        """Сгруппировать записи по родительской папке (порядок записей сохраняется)."""
+        from collections import defaultdict
+
+        folder_groups = defaultdict(list)
+        for record in records:
+            folder_groups[_file_parent(record.file_path)].append(record)
+        return folder_groups
+
+    def _unify_folder_author_source(self, records: List[BookRecord], folder_groups: dict = None) -> None:
         """
         Унификация автора внутри одной папки по аналогии с _unify_folder_series_source.
 
@@ -1601,11 +1713,8 @@ class Pass2SeriesFilename:
         author_source='metadata' (но ещё не подтверждён папкой), получают того же автора
         с source='metadata_folder_confirmed'.
         """
-        from collections import defaultdict
-
-        folder_groups = defaultdict(list)
-        for record in records:
-            folder_groups[str(Path(record.file_path).parent)].append(record)
+        if folder_groups is None:
+            folder_groups = self._group_by_folder(records)
 
         for folder, group in folder_groups.items():
             # Ищем файлы, подтверждённые папкой
@@ -1648,7 +1757,7 @@ class Pass2SeriesFilename:
                     record.proposed_author = canonical_author
                     record.author_source = "metadata_folder_confirmed"
 
-    def _unify_folder_series_source(self, records: List[BookRecord]) -> None:
+    def _unify_folder_series_source(self, records: List[BookRecord], folder_groups: dict = None) -> None:
         """
         Унификация series_source внутри одной папки.
 
@@ -1661,11 +1770,8 @@ class Pass2SeriesFilename:
         ИСКЛЮЧЕНИЕ: если в папке файлы от НЕСКОЛЬКИХ авторов — это коллекция,
         унификация не применяется (иначе имя коллекции становится «серией»).
         """
-        from collections import defaultdict
-
-        folder_groups = defaultdict(list)
-        for record in records:
-            folder_groups[str(Path(record.file_path).parent)].append(record)
+        if folder_groups is None:
+            folder_groups = self._group_by_folder(records)
 
         for folder, group in folder_groups.items():
             # Если в папке файлы от нескольких авторов → коллекция, пропускаем
@@ -1698,7 +1804,7 @@ class Pass2SeriesFilename:
     # Паттерн для извлечения имени серии из стема "Автор. Серия-N. Заголовок"
     _UMBRELLA_SERIES_RE = re.compile(r'^.+?\.\s+(.+?)-\d+\b', re.UNICODE)
 
-    def _split_umbrella_folder_series(self, records: List[BookRecord]) -> None:
+    def _split_umbrella_folder_series(self, records: List[BookRecord], folder_groups: dict = None) -> None:
         """
         Обнаруживает umbrella-папки: одна папка содержит 2+ самостоятельных подсерии.
 
@@ -1716,9 +1822,8 @@ class Pass2SeriesFilename:
         """
         from collections import defaultdict
 
-        folder_groups: dict = defaultdict(list)
-        for record in records:
-            folder_groups[str(Path(record.file_path).parent)].append(record)
+        if folder_groups is None:
+            folder_groups = self._group_by_folder(records)
 
         for folder, group in folder_groups.items():
             # Только если все записи из одной папки получили folder_hierarchy
@@ -1732,7 +1837,7 @@ class Pass2SeriesFilename:
             # Извлекаем серию из стема каждого файла
             stem_series: dict = {}  # id(record) → extracted series
             for record in group:
-                stem = Path(record.file_path).stem
+                stem = _file_stem(record.file_path)
                 m = self._UMBRELLA_SERIES_RE.match(stem)
                 if m:
                     stem_series[id(record)] = m.group(1).strip()
@@ -1758,7 +1863,7 @@ class Pass2SeriesFilename:
                 if extracted and extracted in qualified:
                     record.proposed_series = extracted
 
-    def _apply_folder_consensus(self, records: List[BookRecord]) -> None:
+    def _apply_folder_consensus(self, records: List[BookRecord], folder_groups: dict = None) -> None:
         """
         Папочный консенсус: если папка содержит файлы с series_source = "folder_dataset",
         то ВСЕ файлы в этой папке должны получить одинаковую серию.
@@ -1786,13 +1891,8 @@ class Pass2SeriesFilename:
         - 3. Взор Тьмы (АВТОР: Авраменко)
         → Consensus applied
         """
-        from collections import defaultdict
-        
         # Группируем файлы по папке
-        folder_files = defaultdict(list)
-        for record in records:
-            folder_path = str(Path(record.file_path).parent)
-            folder_files[folder_path].append(record)
+        folder_files = folder_groups if folder_groups is not None else self._group_by_folder(records)
         
         # Для каждой папки применяем консенсус
         for folder_path, files_in_folder in folder_files.items():
@@ -1924,17 +2024,14 @@ class Pass2SeriesFilename:
         folder_author_files = defaultdict(lambda: defaultdict(list))
         
         for record in records:
-            file_path_parts = Path(record.file_path).parts
+            file_path_parts = _file_parts(record.file_path)
             
             # Проверяем является ли это series folder структурой
             if len(file_path_parts) >= 2:
                 parent_folder = file_path_parts[0]
                 
-                # Проверяем что это series folder
-                is_series_folder = (
-                    parent_folder.startswith('Серия') or
-                    'Серия' in parent_folder
-                )
+                # Проверяем что это series folder (startswith('Серия') покрывается вхождением)
+                is_series_folder = 'Серия' in parent_folder
                 
                 if is_series_folder and record.proposed_author:
                     # Это файл в series folder - сохраняем в группировку
@@ -1951,32 +2048,31 @@ class Pass2SeriesFilename:
                 file_patterns = {}  # { first_word_after_author: [records] }
                 
                 for record in author_files:
-                    filename = Path(record.file_path).name
+                    filename = _file_name(record.file_path)
                     name_without_ext = filename.rsplit('.', 1)[0]
                     
                     # Проверяем 2-part структуру "Author. Name"
                     if '. ' in name_without_ext:
-                        parts = name_without_ext.split('. ', 1)  # Split на первую точку
-                        if len(parts) == 2:
-                            first_part = parts[0].strip()
-                            second_part = parts[1].strip()
+                        first_part, _, second_part = name_without_ext.partition('. ')  # Split на первую точку
+                        first_part = first_part.strip()
+                        second_part = second_part.strip()
+                        
+                        # Проверяем что первая часть это single word (likely author surname)
+                        if ' ' not in first_part:
+                            # Извлекаем первое слово из второй части
+                            first_word = second_part.split()[0] if second_part else ""
                             
-                            # Проверяем что первая часть это single word (likely author surname)
-                            if ' ' not in first_part:
-                                # Извлекаем первое слово из второй части
-                                first_word = second_part.split()[0] if second_part else ""
+                            if first_word:
+                                # Нормализуем для сравнения
+                                first_word_norm = first_word.lower()
+                                
+                                if first_word_norm not in file_patterns:
+                                    file_patterns[first_word_norm] = {
+                                        'first_word': first_word,
+                                        'records': []
+                                    }
                                 
-                                if first_word:
-                                    # Нормализуем для сравнения
-                                    first_word_norm = first_word.lower()
-                                    
-                                    if first_word_norm not in file_patterns:
-                                        file_patterns[first_word_norm] = {
-                                            'first_word': first_word,
-                                            'records': []
-                                        }
-                                    
-                                    file_patterns[first_word_norm]['records'].append(record)
+                                file_patterns[first_word_norm]['records'].append(record)
                 
                 # Для каждой группы файлов с одинаковым first_word прим ем consensus
                 for first_word_norm, pattern_info in file_patterns.items():
@@ -2100,7 +2196,7 @@ class Pass2SeriesFilename:
                     continue
                 
                 # Нормализуем серию для группировки (нижний регистр, без пунктуации)
-                series_normalized = re.sub(r'[^\w\s]', '', record.proposed_series).lower().strip()
+                series_normalized = _normalize_for_compare(record.proposed_series)
                 
                 if series_normalized not in series_groups:
                     series_groups[series_normalized] = {
@@ -2160,7 +2256,7 @@ class Pass2SeriesFilename:
         original_to_normalized = {}  # Маппинг нормализованного на оригинальный
         
         for s in all_series_strings:
-            norm = re.sub(r'[^\w\s]', '', s).lower().strip()
+            norm = _normalize_for_compare(s)
             normalized_strings.append(norm)
             if norm not in original_to_normalized:
                 original_to_normalized[norm] = s
@@ -2212,7 +2308,7 @@ class Pass2SeriesFilename:
         # Примеры:
         # "Авраменко Александр - Солдат удачи (Солдат удачи. Тетралогия).fb2" → скобки в конце ✓
         # "Посняков Андрей - Вещий князь (Вещий князь 1-4) Др. издание.fb2" → скобки в середине ✓
-        bracket_match = re.search(r'\(([^)]+)\)', filename)
+        bracket_match = _PARENS_FIRST_RE.search(filename)
         if bracket_match:
             structure['has_brackets'] = True
             structure['bracket_content'] = bracket_match.group(1)
@@ -2272,7 +2368,7 @@ class Pass2SeriesFilename:
         if '(' in pattern_str and ')' in pattern_str:
             structure['has_brackets'] = True
             # Извлекаем содержимое скобок
-            bracket_match = re.search(r'\(([^)]+)\)', pattern_str)
+            bracket_match = _PARENS_FIRST_RE.search(pattern_str)
             if bracket_match:
                 bracket_content = bracket_match.group(1)
                 # Считаем части внутри скобок (разделены на '. ')
@@ -2291,7 +2387,7 @@ class Pass2SeriesFilename:
         
         # Считаем основные части (блоки вне скобок)
         # Удаляем содеримое скобок и считаем оставшиеся части
-        pattern_without_brackets = re.sub(r'\([^)]*\)', '', pattern_str)
+        pattern_without_brackets = _PARENS_BLOCK_RE.sub('', pattern_str)
         if ' - ' in pattern_without_brackets:
             structure['main_parts'] = pattern_without_brackets.count(' - ') + 1
         else:
@@ -2348,6 +2444,138 @@ class Pass2SeriesFilename:
         
         return True
     
+    def _has_blacklist_word(self, text_lower: str) -> bool:
+        """Есть ли в text_lower (уже в нижнем регистре) blacklist-слово как целое слово."""
+        return any(bl_re.search(text_lower) for bl_re in self._bl_word_res)
+
+    def _apply_metadata_series(self, record: BookRecord, meta: str, meta_lower: str,
+                               clean: bool) -> bool:
+        """
+        Взять серию из metadata_series (fallback, когда имя файла серию не дало).
+
+        Мета, содержащая blacklist-слово (целым словом), игнорируется целиком.
+        Иначе — паттерны series_patterns_in_metadata, при clean=True ещё и
+        _clean_series_name, удаление blacklist-слов и валидация.
+
+        Args:
+            record: Запись книги
+            meta: metadata_series без пробелов по краям
+            meta_lower: meta в нижнем регистре
+            clean: Очищать ли серию через _clean_series_name
+
+        Returns:
+            True если proposed_series установлена (series_source="metadata")
+        """
+        if self._has_blacklist_word(meta_lower):
+            return False
+
+        series = self._extract_series_from_metadata(meta)
+        if clean:
+            series = self._clean_series_name(series)
+        # ✅ Удалить слова из blacklist также из metadata серии
+        series = self._remove_blacklist_words(series)
+        if not series:
+            return False
+
+        author_for_validation = record.proposed_author or None
+        if not self._is_valid_series(series, extracted_author=author_for_validation):
+            return False
+
+        # Исправляем грамматику русского языка (добавляем запятую перед "что")
+        record.proposed_series = self._fix_russian_grammar(series)
+        record.series_source = "metadata"
+        return True
+
+    def _accept_filename_series(self, record: BookRecord, series_candidate: str,
+                                meta_low: str, meta_norm: str) -> bool:
+        """
+        Очистить и провалидировать серию из имени файла; если прошла — записать в record.
+
+        Args:
+            record: Запись книги
+            series_candidate: Кандидат серии из имени файла
+            meta_low: metadata_series.strip().lower()
+            meta_norm: meta_low с ё→е
+
+        Returns:
+            True если proposed_series установлена
+        """
+        clean = self._clean_series_name(
+            series_candidate,
+            keep_trailing_number=self._last_was_hierarchical
+        )
+        # ✅ НОВОЕ: Удалить слова из blacklist вместо полного отвергания
+        clean = self._remove_blacklist_words(clean)
+        if not clean:  # Ничего не осталось после очистки
+            return False
+
+        author_for_validation = record.proposed_author or None
+        if not self._is_valid_series(clean, extracted_author=author_for_validation):
+            return False
+
+        # Исправляем грамматику русского языка (добавляем запятую перед "что")
+        clean = self._fix_russian_grammar(clean)
+        record.proposed_series = clean
+        record.series_source = "filename"
+        if record.metadata_series and meta_low == clean.lower():
+            record.series_source = "filename+meta_confirmed"
+        # Если иерархический root содержит trailing number, а metadata_series
+        # совпадает с root БЕЗ числа — число является позицией книги, не частью
+        # названия серии. Пример: «Север и Юг 01\Великая сага» + meta «Север и Юг»
+        # → proposed_series = «Север и Юг» (иначе каждая книга в отдельной группе).
+        if record.metadata_series and '\\' in clean:
+            _root_h, _sub_h = clean.split('\\', 1)
+            _root_h = _root_h.strip()
+            _root_no_num = _TRAILING_NUMBER_RE.sub('', _root_h).strip()
+            if (_root_no_num and _root_no_num != _root_h and
+                    _root_no_num.lower().replace('ё', 'е') == meta_norm):
+                _sub_stripped = _sub_h.strip()
+                _sub_is_num_only = bool(_DIGITS_ONLY_RE.match(_sub_stripped))
+                _sub_is_meta_dup = _sub_stripped.lower().replace('ё', 'е') == meta_norm
+                if _sub_is_num_only or _sub_is_meta_dup:
+                    # Подсерия — чисто цифровая или дублирует metadata:
+                    # «Север и Юг 01\12» или «Серия 1\Серия» → стираем до metadata
+                    record.proposed_series = record.metadata_series.strip()
+                    record.series_source = "filename+meta_confirmed"
+                # else: подсерия — реальное название («Аспект-Император»);
+                # оставляем proposed_series без изменений (с числом в root)
+        return True
+
+    def _extract_series_from_filename_cached(self, file_path: str, path_parts: tuple,
+                                             metadata_series: str, cache: dict) -> str:
+        """
+        _extract_series_from_filename(validate=False) с кэшем по имени файла.
+
+        Результат зависит только от имени файла и metadata_series, но вызов
+        выставляет флаги _last_from_block_matcher / _last_was_hierarchical,
+        которые читаются после него — они сохраняются в кэше и
+        восстанавливаются при попадании. _last_was_hierarchical меняется
+        только если дело дошло до _extract_series_from_brackets, иначе
+        остаётся прежним (None в кэше = «не трогали»).
+        """
+        if not path_parts:
+            return self._extract_series_from_filename(
+                file_path, validate=False, metadata_series=metadata_series
+            )
+        key = (path_parts[-1], metadata_series)
+        cached = cache.get(key)
+        if cached is None:
+            prev_hierarchical = self._last_was_hierarchical
+            self._last_was_hierarchical = None
+            result = self._extract_series_from_filename(
+                file_path, validate=False, metadata_series=metadata_series
+            )
+            hierarchical = self._last_was_hierarchical
+            if hierarchical is None:
+                self._last_was_hierarchical = prev_hierarchical
+            cached = (result, self._last_from_block_matcher, hierarchical)
+            cache[key] = cached
+            return result
+        result, self._last_from_block_matcher, hierarchical = cached
+        if hierarchical is not None:
+            self._last_was_hierarchical = hierarchical
+        return result
+
     def _extract_series_from_filename(self, file_path: str, validate: bool = True, metadata_series: str = "") -> str:
         """
         Извлечь серию из имени файла, используя паттерны из конфига.
@@ -2367,7 +2595,7 @@ class Pass2SeriesFilename:
             validate: Если True - проверять валидность; если False - возвращать raw candidate
             metadata_series: Метаинформация о серии из FB2 (для подтверждения результата BlockLevelPatternMatcher)
         """
-        filename = Path(file_path).name
+        filename = _file_name(file_path)
         name_without_ext = filename.rsplit('.', 1)[0]
 
         # ВАЖНО: Удалить метатеги из конца filename ПЕРЕД парсингом
@@ -2375,12 +2603,12 @@ class Pass2SeriesFilename:
         # "(ЛП)" - Лицензионное произведение
         # "(др. изд.)" / "(другое издание)" - ссылки на другое издание
         # Эти метатеги не должны влиять на извлечение series
-        name_for_parsing = re.sub(r'\s*\([СЛ]И\)\s*$', '', name_without_ext).strip()
-        name_for_parsing = re.sub(r'\s*\([^)]*(?:издание|изд\.)[^)]*\)\s*$', '', name_for_parsing, flags=re.IGNORECASE).strip()
+        name_for_parsing = _SI_LP_TAIL_RE.sub('', name_without_ext).strip()
+        name_for_parsing = _EDITION_TAIL_RE.sub('', name_for_parsing).strip()
         # Убрать год-суффикс (1900–2099) в конце — год не является номером тома.
         # "Тысяча и одна ночь. Том Ⅰ - 2022" → "Тысяча и одна ночь. Том Ⅰ"
         # "Серия. Название - 2019" → "Серия. Название"
-        name_for_parsing = re.sub(r'(?:\s*[-–—])?\s*(?:19|20)\d{2}\s*$', '', name_for_parsing).strip()
+        name_for_parsing = _YEAR_SUFFIX_RE.sub('', name_for_parsing).strip()
 
 
         
@@ -2400,15 +2628,7 @@ class Pass2SeriesFilename:
         # Подтверждение: metadata_series совпадает с root или subseries.
         # ══════════════════════════════════════════════════════════════════
         # Вариант А: «Серия N. Подсерия M. Название»
-        _TWO_LEVEL_RE = re.compile(
-            r'^(.+?)\s+(\d{1,4})\.\s+([А-ЯЁA-Z][^.]{2,}?)\s+(\d{1,4})\.\s+(.+)$',
-            re.UNICODE,
-        )
         # Вариант Б: «Серия N. Подсерия. Том/Книга M» — подсерия без своего номера
-        _TWO_LEVEL_TOM_RE = re.compile(
-            r'^(.+?)\s+(\d{1,4})\.\s+([А-ЯЁA-Z][^.]{2,}?)\.\s+(?:Том|Книга|Часть|кн\.|Book|Vol\.?)\s+\d',
-            re.IGNORECASE | re.UNICODE,
-        )
         # Применяем только к части после " - " чтобы не захватывать автора
         _name_after_dash = name_for_parsing
         if ' - ' in name_for_parsing:
@@ -2441,10 +2661,6 @@ class Pass2SeriesFilename:
         #   → proposed_series = «Брия 1\Книга Длинного Солнца»
         # Условие безопасности: metadata_series обязательно подтверждает
         # либо root_name, либо sub_name (точно или по пересечению ≥2 слов длиной ≥4).
-        _TWO_LEVEL_RANGE_RE = re.compile(
-            r'^(.+?)\s+(\d{1,4})\.\s+([А-ЯЁA-Z][^.]{2,}?)\s+\d{1,4}\s*[-–—]\s*\d{1,4}\.\s+.+$',
-            re.UNICODE,
-        )
         _tlr = _TWO_LEVEL_RANGE_RE.match(_name_after_dash)
         if _tlr and metadata_series:
             _root_name = _tlr.group(1).strip()
@@ -2463,10 +2679,6 @@ class Pass2SeriesFilename:
         # Вариант Г: «Серия N. Подсерия (ServiceWord)» — скомпилированный файл.
         # Пример: «Брия 1. Книга Длинного Солнца (Тетралогия)»
         #   → proposed_series = «Брия 1\Книга Длинного Солнца»
-        _SERVICE_SUFFIX_RE = re.compile(
-            r'^(.+?)\s+(\d{1,4})\.\s+([А-ЯЁA-Z][^(]{2,}?)\s*\((?:Тетралогия|Трилогия|Дилогия|Пенталогия|Сага|Цикл|[Сс]борник|[Аа]нтология)\)\s*$',
-            re.UNICODE,
-        )
         _tlg = _SERVICE_SUFFIX_RE.match(_name_after_dash)
         if _tlg and metadata_series:
             _root_name = _tlg.group(1).strip()
@@ -2515,7 +2727,7 @@ class Pass2SeriesFilename:
                     _effective_metadata_series = metadata_series.replace('\u2026', '...') if metadata_series else metadata_series
                     if _effective_metadata_series and self.filename_blacklist:
                         _ms_lower = _effective_metadata_series.lower()
-                        if any(bl.lower() in _ms_lower for bl in self.filename_blacklist):
+                        if any(bl in _ms_lower for bl in self._blacklist_lower):
                             _effective_metadata_series = None
                     if _effective_metadata_series:
                         # Очищаем оба значения для сравнения
@@ -2583,12 +2795,10 @@ class Pass2SeriesFilename:
                             # Исключение 2: series_from_block — многоуровневый контент скобок
                             # с сервисным словом в конце: «Серия N. Подсерия. Тетралогия»
                             # → подсерия значимая (это подцикл), не стираем.
-                            _raw_parts = series_from_block.split('. ')
-                            _last_raw_lc = _raw_parts[-1].strip().lower() if _raw_parts else ''
+                            _last_raw_lc = series_from_block.rpartition('. ')[2].strip().lower()
                             _raw_has_service_end = (
-                                len(_raw_parts) >= 3 and
-                                any(_last_raw_lc.startswith(sw.lower())
-                                    for sw in self.service_words if sw)
+                                series_from_block.count('. ') >= 2 and
+                                _last_raw_lc.startswith(self._service_prefixes)
                             )
                             if '\\' in processed_series and not pattern_has_subseries and not _raw_has_service_end:
                                 root = processed_series.split('\\')[0].strip()
@@ -2607,14 +2817,14 @@ class Pass2SeriesFilename:
         # ШАГ 2 (OLD): Резервный метод - старые паттерны
         # ══════════════════════════════════════════════════════════════════
         
-        # Анализируем структуру файла один раз
-        file_blocks = self.block_selector.analyze_filename_blocks(name_for_parsing)
-        
         best_series = None
         best_score = -999
         best_pattern = None
         
-        if self.compiled_file_patterns:
+        if self._file_patterns_union_re and self._file_patterns_union_re.match(name_for_parsing):
+            # Анализируем структуру файла один раз
+            file_blocks = self.block_selector.analyze_filename_blocks(name_for_parsing)
+
             for idx, (pattern_str, compiled_regex, group_names) in enumerate(self.compiled_file_patterns, 1):
                 # Проверяем regex совпадение
                 match = compiled_regex.match(name_for_parsing)
@@ -2654,10 +2864,7 @@ class Pass2SeriesFilename:
                     try:
                         sw_value = match.group('service_words').strip().rstrip('.').strip()
                         sw_value_lower = sw_value.lower()
-                        is_real_service_word = any(
-                            sw_value_lower == sw.lower() or sw_value_lower.startswith(sw.lower())
-                            for sw in self.service_words
-                        )
+                        is_real_service_word = sw_value_lower.startswith(self._service_words_lower)
                         if not is_real_service_word:
                             continue  # "Легенда о" — не служебное, пропустить этот паттерн
                     except IndexError:
@@ -2702,14 +2909,12 @@ class Pass2SeriesFilename:
                     continue
                 
                 # БЛОЧНОЕ СРАВНЕНИЕ: Оцениваем соответствие структур
-                pattern_blocks = self.block_selector.analyze_pattern_blocks(pattern_str)
-                block_score = self.block_selector.score_blocks(file_blocks, pattern_blocks)
-                
-                # Валидируем series
-                is_valid = not validate or self._is_valid_series(series_candidate, skip_author_check=True)
+                block_score = self.block_selector.score_blocks(file_blocks, self._file_pattern_blocks[pattern_str])
                 
-                # Выбираем лучший паттерн
-                if is_valid and block_score > best_score:
+                # Выбираем лучший паттерн; валидируем series только если он может победить
+                if block_score > best_score and (
+                    not validate or self._is_valid_series(series_candidate, skip_author_check=True)
+                ):
                     best_series = series_candidate
                     best_score = block_score
                     best_pattern = pattern_str
@@ -2721,8 +2926,7 @@ class Pass2SeriesFilename:
             # ВАЖНО: сравниваем целое слово, не префикс!
             best_series_lower = best_series.lower().strip()
             is_service_word = False
-            for sw in self.service_words:
-                sw_lower = sw.lower()
+            for sw_lower in self._service_words_lower:
                 if best_series_lower == sw_lower or best_series_lower.startswith(sw_lower + ' '):
                     is_service_word = True
                     break
@@ -2768,8 +2972,8 @@ class Pass2SeriesFilename:
         # Числовой суффикс: в конце строки ИЛИ в середине перед ". Title"
         # "Серия 2. Заголовок" → тоже признак серийности
         _has_numeric_suffix = bool(
-            re.search(r'\s+\d+(?:[-–—]\d+)?\s*$', name_for_parsing) or
-            re.search(r'\s+\d+\.\s+\S', name_for_parsing)
+            _NUM_OR_RANGE_TAIL_RE.search(name_for_parsing) or
+            _NUM_DOT_TITLE_RE.search(name_for_parsing)
         )
         if pattern_found_without_series and not _has_numeric_suffix:
             # Паттерн явно БЕЗ серии и нет числового суффикса — возвращаем пусто или metadata
@@ -2779,7 +2983,7 @@ class Pass2SeriesFilename:
         
         # Правило 1: [Серия] в квадратных скобках в начале
         # Из паттернов конфига ищем примеры с [...]
-        match = re.search(r'^\[([^\[\]]+)\]', name_for_parsing)
+        match = _LEADING_SQUARE_RE.match(name_for_parsing) if name_for_parsing[:1] == '[' else None
         if match:
             series = match.group(1).strip()
             if not validate or self._is_valid_series(series):
@@ -2791,7 +2995,7 @@ class Pass2SeriesFilename:
         if '(' in name_for_parsing and ')' in name_for_parsing:
             # Ищем ПЕРВУЮ пару скобок (не последнюю!) - используем lookahead
             # При двойных скобках (Series) (Year) нужно взять (Series), не (Year)
-            match = re.search(r'\(([^)]+)\)(?:\s*\(|\s*$)', name_for_parsing)
+            match = _PARENS_GROUP_RE.search(name_for_parsing)
             if match:
                 content_in_brackets = match.group(1).strip()
                 
@@ -2808,11 +3012,9 @@ class Pass2SeriesFilename:
                 else:
                     # Hard check: if all words in brackets are SW or qualifiers → pure annotation,
                     # not a series name. E.g. "(весь цикл)", "(вся трилогия)", "(Дилогия)"
-                    SW_QUALIFIERS = {'весь', 'вся', 'все', 'полный', 'полная', 'полное',
-                                     'целый', 'целая', 'целое', 'complete', 'omnibus'}
                     bracket_words = content_in_brackets.lower().split()
                     is_pure_annotation = all(
-                        w in self.service_words or w in SW_QUALIFIERS or w.isdigit()
+                        w in self.service_words or w in _SW_QUALIFIERS or w.isdigit()
                         for w in bracket_words
                     )
                     if is_pure_annotation:
@@ -2840,8 +3042,10 @@ class Pass2SeriesFilename:
         # "Белoус. Последний шанс" - "Белоус" это фамилия, не серия!
         # И не захватываем "Author - Series" паттерны - они обработаны config pattern
         # "Борисов Олег - Туман 1. Золото" должен дать "Туман", не "Борисов Олег - Туман"
-        if '. ' in name_for_parsing:
-            potential_series = name_for_parsing.split('. ')[0].strip()
+        # Разбиение по первой '. ' общее для правил 3 и 3B
+        first_part, dot_sep, second_part = name_for_parsing.partition('. ')
+        if dot_sep:
+            potential_series = first_part.strip()
             
             # Если содержит " - ", это скорее всего "Author - Series" паттерн
             if ' - ' in potential_series:
@@ -2855,7 +3059,7 @@ class Pass2SeriesFilename:
                 _is_author_pattern = (
                     len(_ps_words) <= 1 or
                     (len(_ps_words[-1]) == 1 and _ps_words[-1][0].isupper()) or
-                    bool(re.search(r'[А-ЯA-Z]\.[А-Яа-яA-Za-z]', potential_series))
+                    bool(_INITIAL_DOT_RE.search(potential_series))
                 )
                 if _is_author_pattern:
                     pass  # Likely author name format, not a series
@@ -2868,43 +3072,41 @@ class Pass2SeriesFilename:
         # "Курилкин. Охотник 1" → "Охотник"
         # "Яманов. Бесноватый Цесаревич I" → "Бесноватый Цесаревич"
         # Структура: OneWord. MultipleWords NUM где NUM это арабские или римские цифры
-        if '. ' in name_for_parsing:
-            parts = name_for_parsing.split('. ', 1)
-            if len(parts) == 2:
-                first_part = parts[0].strip()
-                second_part = parts[1].strip()
-                
-                # Проверяем что первая часть это вероятный автор
-                # Убираем скобочные части (псевдоним/реальное имя) перед проверкой цифр:
-                # "Leach23 (Михалек Дмитрий)" → "Leach23" → содержит цифры → всё равно автор
-                # Нам важно чтобы СУТЬ части была авторской, а не чтобы не было цифр вообще.
-                # Критерий: длина < 60 и НЕ начинается с цифры (т.е. не год/том).
-                first_part_no_parens = re.sub(r'\s*\([^)]*\)', '', first_part).strip()
-                looks_like_author = (
-                    len(first_part) < 60 and
-                    not first_part_no_parens[:1].isdigit()  # Не начинается с цифры
-                )
+        if dot_sep:
+            first_part = first_part.strip()
+            second_part = second_part.strip()
+            
+            # Проверяем что первая часть это вероятный автор
+            # Убираем скобочные части (псевдоним/реальное имя) перед проверкой цифр:
+            # "Leach23 (Михалек Дмитрий)" → "Leach23" → содержит цифры → всё равно автор
+            # Нам важно чтобы СУТЬ части была авторской, а не чтобы не было цифр вообще.
+            # Критерий: длина < 60 и НЕ начинается с цифры (т.е. не год/том).
+            first_part_no_parens = _PARENS_ANY_RE.sub('', first_part).strip()
+            looks_like_author = (
+                len(first_part) < 60 and
+                not first_part_no_parens[:1].isdigit()  # Не начинается с цифры
+            )
+            
+            if looks_like_author:
+                # Проверяем диапазоны: "Совок 1-5", "Попаданец в Дракона 1-8" → True
+                series_match = _RANGE_TAIL_RE.match(second_part)
+                # Проверяем арабские цифры: "Охотник 1" → True
+                if not series_match:
+                    series_match = _NUMBER_TAIL_RE.match(second_part)
+                # Если нет арабских, проверяем римские цифры: "Бесноватый Цесаревич I" → True
+                if not series_match:
+                    series_match = _ROMAN_TAIL_RE.match(second_part)
                 
-                if looks_like_author:
-                    # Проверяем диапазоны: "Совок 1-5", "Попаданец в Дракона 1-8" → True
-                    series_match = re.match(r'^(.+?)\s+\d+[-–—]\d+\s*$', second_part)
-                    # Проверяем арабские цифры: "Охотник 1" → True
-                    if not series_match:
-                        series_match = re.match(r'^(.+?)\s+\d+\s*$', second_part)
-                    # Если нет арабских, проверяем римские цифры: "Бесноватый Цесаревич I" → True
-                    if not series_match:
-                        series_match = re.match(r'^(.+?)\s+[IVX]+\s*$', second_part)
-                    
-                    if series_match:
-                        potential_series = series_match.group(1).strip()
-                        if not validate or self._is_valid_series(potential_series):
-                            return potential_series
+                if series_match:
+                    potential_series = series_match.group(1).strip()
+                    if not validate or self._is_valid_series(potential_series):
+                        return potential_series
         
         # Правило 4: Author - Series N или Author - Series N-M (без точки после номера)
         # "Атаманов Михаил - Задача выжить 1" → "Задача выжить"
         # "Земляной Андрей - Один на миллион 1-3" → "Один на миллион"
         if ' - ' in name_for_parsing:
-            match = re.match(r'^(.+?)\s*-\s*(.+?)\s+(?:\d+[-–—]\d+|\d{1,2})\s*$', name_for_parsing)
+            match = _AUTHOR_SERIES_NUM_RE.match(name_for_parsing)
             if match:
                 potential_series = match.group(2).strip()
                 # Убедимся что это не автор (не похоже на имя)
@@ -2915,10 +3117,7 @@ class Pass2SeriesFilename:
         # "Тидхар Леви - Центральная станция 2. Неом" → "Центральная станция"
         # Отличие от Правила 4: здесь после номера идёт '. Title', а не конец строки
         if ' - ' in name_for_parsing:
-            match = re.match(
-                r'^(.+?)\s*-\s*(.+?)\s+(\d{1,2})\.\s+.+$',
-                name_for_parsing,
-            )
+            match = _AUTHOR_SERIES_NUM_TITLE_RE.match(name_for_parsing)
             if match:
                 potential_series = match.group(2).strip()
                 if not validate or self._is_valid_series(potential_series):
@@ -2928,7 +3127,7 @@ class Pass2SeriesFilename:
         # "Земляной Андрей - Отморозки. Другим путем" → "Отморозки"
         # Попытаемся извлечь часть после " - " и до первой точки как Title (которая может быть Series)
         if ' - ' in name_without_ext and '. ' in name_without_ext:
-            match = re.match(r'^(.+?)\s*-\s*([^.]+)\.\s+(.+)$', name_without_ext)
+            match = _AUTHOR_SERIES_DOT_TITLE_RE.match(name_without_ext)
             if match:
                 title_before_dot = match.group(2).strip()
                 # Это Title (потенциальная Series) если он:
@@ -2963,151 +3162,147 @@ class Pass2SeriesFilename:
         Returns:
             Извлеченное имя серии или пустая строка
         """
-        # Основные шаблоны
-        if pattern == "Author - Series (service_words)":
-            # "Садов Сергей - Горе победителям (Дилогия)"
-            # "Валериев Игорь - 2. Ермак. Поход (Ермак 4-6)"
-            # "Авраменко Александр - Солдат удачи 3. Взор Тьмы (Наследник)"
-            # ВАЖНО: проверяем содержимое скобок чтобы различить:
-            # 1) "Author - Series (service_words)" ← скобки содержат ТОЛЬКОслужебные слова/числа
-            # 2) "Author - Title (Series info)" ← скобки содержат РЕАЛЬНУЮ серию
-            # 
-            # Проблема: "Горъ Василий - Чужая кровь (Пророчество 5-7)"
-            #   Group 2 = "Чужая кровь" (title, не серия!)
-            #   Скобки = "Пророчество 5-7" (реальная серия!)
-            #   → НЕ должен совпадать с "Author - Series (service_words)"
-            match = re.match(r'^(.+?)\s*-\s*([^()]+?)\s*\(([^)]*)\)', filename)
-            if match:
-                series_candidate = match.group(2).strip()
-                brackets_content = match.group(3).strip()
-                
-                # Анализируем что в скобках
-                service_words_lower = [sw.lower() for sw in self.service_words]
-                brackets_lower = brackets_content.lower()
-                is_skip_keyword = any(kw.lower() in brackets_lower for kw in self.collection_keywords)
-                
-                is_pure_service_word = any(
-                    brackets_lower.startswith(sw) or brackets_lower == sw
-                    for sw in service_words_lower
-                )
-                
-                is_numeric_range = bool(re.match(r'^\d+[-–—]\d+$', brackets_content))
-                
-                # НОВОЕ: проверяем если в скобках есть текст + числа (смешанный формат)
-                # например "Пророчество 5-7" или "Ермак 4-6"
-                # Это означает что скобки содержат РЕАЛЬНУЮ СЕРИЮ, а не служебные слова!
-                # В этом случае паттерн "Author - Series (service_words)" НЕ СОВПАДАЕТ
-                # - скорее всего это "Author - Title (Series)" паттерн
-                has_text_and_numbers = bool(re.search(r'[а-яё\w]+\s+\d', brackets_lower)) or \
-                                       bool(re.search(r'\d+\s+[а-яё\w]+', brackets_lower))
-                
-                # Если скобки содержат реальную серию (текст + числа), НЕ совпадаем
-                if has_text_and_numbers:
-                    # это не паттерн "Series (service_words)", это "Title (Series info)"
-                    # Пусть обработает другой паттерн
-                    return ""
-                
-                # Если скобки содержат ТОЛЬКОслужебное слово, число или skip-keyword → это не серия!
-                if is_pure_service_word or is_numeric_range or is_skip_keyword:
-                    # "Эпоха перемен (Трилогия)" → нет информации о серии в файле
-                    # Нужно вернуть пусто и дать возможность fallback на metadata
-                    return ""
-                
-                # Иначе это реальная серия в скобках (случай вроде "Авраменко - Солдат удачи (Наследник)")
-                series = series_candidate
-                # Удаляем префикс книги: "1. ", "2. ", "3. " и т.д.
-                series = re.sub(r'^\s*\d+\s*[.,]\s*', '', series).strip()
-                # Также удаляем том номер и название внутри серии: "Солдат удачи 3. Взор Тьмы" → "Солдат удачи"
-                # НЕ трогать версии вида "2.0": (?!\.\d) защищает десятичные числа
-                series = re.sub(r'\s+\d+(?!\.\d)[\s\.\:].+$', '', series).strip()
-                # Если результат содержит '. ' — берём только часть до точки
-                if '. ' in series:
-                    before_dot = series.split('. ')[0].strip()
-                    series = before_dot
-                return series
-        
-        elif pattern == "Author - Title (Series. service_words)":
-            # "Авраменко Александр - Солдат удачи (Солдат удачи. Тетралогия)"
-            # Нужно извлечь Series из скобок
-            match = re.match(r'^(.+?)\s*-\s*(.+?)\s*\(\s*([^)]+)\)', filename)
-            if match:
-                content_in_brackets = match.group(3).strip()
-                # From "(Солдат удачи. Тетралогия)" extract "Солдат удачи"
-                return self._extract_series_from_brackets(content_in_brackets)
-        
-        elif pattern == "Author - Series.Title":
-            # "Авраменко Александр - Солдат удачи 1. Солдат удачи"
-            # Извлекаем часть после " - " и до нумерованного тома (N.)
-            # Улучшено: теперь захватывает несколько слов перед номером
-            match = re.match(r'^(.+?)\s*-\s*(.+?)\s+\d+[\s\.\:]', filename)
-            if match:
-                series = match.group(2).strip()
-                return series
-        
-        elif pattern == "Author. Series. Title":
-            # "Анисимов. Вариант «Бис» 2. Год мертвой змеи"
-            # Формат: Author. Series. Title
-            # ВАЖНО: Не применяем если в filename есть скобки - это дело pattern "Author. Title (Series)"
-            # "Кумин. Битва за звёзды (Исход. Тетралогия)" не должен обрабатываться так!
-            # Наличие скобок означает что реюлярная серия в скобках, а не "Author. Series. Title"
-            if '(' in filename:
-                # Есть скобки - скорее всего "Author. Title (Series)" паттерн, пропускаем
+        handler = self._config_pattern_handlers.get(pattern)
+        return handler(filename) if handler else ""
+    
+    def _config_series_with_service_brackets(self, filename: str) -> str:
+        """Паттерн "Author - Series (service_words)": серия перед скобками со служебными словами."""
+        # "Садов Сергей - Горе победителям (Дилогия)"
+        # "Валериев Игорь - 2. Ермак. Поход (Ермак 4-6)"
+        # "Авраменко Александр - Солдат удачи 3. Взор Тьмы (Наследник)"
+        # ВАЖНО: проверяем содержимое скобок чтобы различить:
+        # 1) "Author - Series (service_words)" ← скобки содержат ТОЛЬКОслужебные слова/числа
+        # 2) "Author - Title (Series info)" ← скобки содержат РЕАЛЬНУЮ серию
+        # 
+        # Проблема: "Горъ Василий - Чужая кровь (Пророчество 5-7)"
+        #   Group 2 = "Чужая кровь" (title, не серия!)
+        #   Скобки = "Пророчество 5-7" (реальная серия!)
+        #   → НЕ должен совпадать с "Author - Series (service_words)"
+        match = _AUTHOR_TITLE_PARENS_RE.match(filename)
+        if match:
+            series_candidate = match.group(2).strip()
+            brackets_content = match.group(3).strip()
+
+            # Анализируем что в скобках
+            service_words_lower = self._service_words_lower
+            brackets_lower = brackets_content.lower()
+            is_skip_keyword = bool(
+                self._collection_keywords_re is not None
+                and self._collection_keywords_re.search(brackets_lower)
+            )
+
+            is_pure_service_word = any(
+                brackets_lower.startswith(sw) or brackets_lower == sw
+                for sw in service_words_lower
+            )
+
+            is_numeric_range = bool(_NUMERIC_RANGE_RE.match(brackets_content))
+
+            # НОВОЕ: проверяем если в скобках есть текст + числа (смешанный формат)
+            # например "Пророчество 5-7" или "Ермак 4-6"
+            # Это означает что скобки содержат РЕАЛЬНУЮ СЕРИЮ, а не служебные слова!
+            # В этом случае паттерн "Author - Series (service_words)" НЕ СОВПАДАЕТ
+            # - скорее всего это "Author - Title (Series)" паттерн
+            has_text_and_numbers = bool(_WORD_THEN_NUM_RE.search(brackets_lower)) or \
+                                   bool(_NUM_THEN_WORD_RE.search(brackets_lower))
+
+            # Если скобки содержат реальную серию (текст + числа), НЕ совпадаем
+            if has_text_and_numbers:
+                # это не паттерн "Series (service_words)", это "Title (Series info)"
+                # Пусть обработает другой паттерн
                 return ""
-            
-            parts = filename.split('. ')
-            if len(parts) >= 3:
-                # parts[1] должна быть Series
-                series = parts[1].strip()
-                # Удаляем trailing число (том/выпуск) из серии
-                # "Негоциант 2" -> "Негоциант"
-                series = re.sub(r'\s+\d+\s*$', '', series).strip()
-                return series
-        
-        elif pattern == "Author, Author - Title (Series. service_words)":
-            # "Земляной Андрей, Орлов Борис - Академик (Странник 4-5)"
-            # Извлекаем Series из скобок
-            match = re.search(r'\(\s*([^)]+)\)', filename)
-            if match:
-                content_in_brackets = match.group(1).strip()
-                return self._extract_series_from_brackets(content_in_brackets)
-        
-        elif pattern == "Author. Title (Series. service_words)":
-            # "Демченко. Хольмградские истории (Хольмградские истории. Трилогия)"
-            # Извлекаем Series из скобок
-            match = re.search(r'\(\s*([^)]+)\)', filename)
-            if match:
-                content_in_brackets = match.group(1).strip()
-                return self._extract_series_from_brackets(content_in_brackets)
-        
-        elif pattern == "Author - Title (Series service_words)":
-            # "Валериев Игорь - 2. Ермак. Поход (Ермак 4-6)"
-            # Similar to "Author - Title (Series. service_words)" but without dot
-            # Content in brackets: "Ермак 4-6" (space before number)
-            match = re.match(r'^(.+?)\s*-\s*(.+?)\s*\(\s*([^)]+)\)', filename)
-            if match:
-                content_in_brackets = match.group(3).strip()
-                return self._extract_series_from_brackets(content_in_brackets)
-        
-        elif pattern == "Author, Author. Title (Series)":
-            # "Зурков, Черепнев. Бешеный прапорщик (Бешеный прапорщик 1-3)"
-            # Извлекаем Series из скобок
-            match = re.search(r'\(\s*([^)]+)\)', filename)
-            if match:
-                content_in_brackets = match.group(1).strip()
-                return self._extract_series_from_brackets(content_in_brackets)
-        
-        elif pattern == "Author - Series service_words. Title":
-            # "Игнатов Михаил - Путь 10. Защитник. Второй пояс (СИ)"
-            # Извлекаем Series между " - " и номером
-            # Паттерн: Author - Series Number. Title
-            # ВАЖНО: Требуем пробелы ДО дефиса чтобы не совпасть с дефисом в серии
-            # "Сердитый, Бирюков. Человек-саламандра 1" не должен совпасть
-            # (здесь дефис без пробела перед ним)
-            match = re.match(r'^(.+?)\s+-\s+(.+?)\s+\d+\.\s+', filename)
-            if match:
-                series = match.group(2).strip()
-                return series
-        
+
+            # Если скобки содержат ТОЛЬКОслужебное слово, число или skip-keyword → это не серия!
+            if is_pure_service_word or is_numeric_range or is_skip_keyword:
+                # "Эпоха перемен (Трилогия)" → нет информации о серии в файле
+                # Нужно вернуть пусто и дать возможность fallback на metadata
+                return ""
+
+            # Иначе это реальная серия в скобках (случай вроде "Авраменко - Солдат удачи (Наследник)")
+            series = series_candidate
+            # Удаляем префикс книги: "1. ", "2. ", "3. " и т.д.
+            series = _BOOK_NUM_PREFIX_RE.sub('', series).strip()
+            # Также удаляем том номер и название внутри серии: "Солдат удачи 3. Взор Тьмы" → "Солдат удачи"
+            # НЕ трогать версии вида "2.0": (?!\.\d) защищает десятичные числа
+            series = _NUM_TITLE_TAIL_RE.sub('', series).strip()
+            # Если результат содержит '. ' — берём только часть до точки
+            if '. ' in series:
+                before_dot = series.partition('. ')[0].strip()
+                series = before_dot
+            return series
+        return ""
+    
+    def _config_series_from_dash_brackets(self, filename: str) -> str:
+        """Паттерны "Author - Title (Series[.] service_words)": серия в скобках после " - "."""
+        # "Авраменко Александр - Солдат удачи (Солдат удачи. Тетралогия)"
+        # Нужно извлечь Series из скобок
+        # "Валериев Игорь - 2. Ермак. Поход (Ермак 4-6)"
+        # Similar to "Author - Title (Series. service_words)" but without dot
+        # Content in brackets: "Ермак 4-6" (space before number)
+        match = _AUTHOR_SERIES_PARENS_RE.match(filename)
+        if match:
+            content_in_brackets = match.group(3).strip()
+            # From "(Солдат удачи. Тетралогия)" extract "Солдат удачи"
+            return self._extract_series_from_brackets(content_in_brackets)
+        return ""
+    
+    def _config_series_before_number(self, filename: str) -> str:
+        """Паттерн "Author - Series.Title": серия между " - " и номером тома."""
+        # "Авраменко Александр - Солдат удачи 1. Солдат удачи"
+        # Извлекаем часть после " - " и до нумерованного тома (N.)
+        # Улучшено: теперь захватывает несколько слов перед номером
+        match = _AUTHOR_SERIES_NUM_PREFIX_RE.match(filename)
+        if match:
+            series = match.group(2).strip()
+            return series
+        return ""
+    
+    def _config_series_second_dot_part(self, filename: str) -> str:
+        """Паттерн "Author. Series. Title": серия — вторая часть через ". "."""
+        # "Анисимов. Вариант «Бис» 2. Год мертвой змеи"
+        # Формат: Author. Series. Title
+        # ВАЖНО: Не применяем если в filename есть скобки - это дело pattern "Author. Title (Series)"
+        # "Кумин. Битва за звёзды (Исход. Тетралогия)" не должен обрабатываться так!
+        # Наличие скобок означает что реюлярная серия в скобках, а не "Author. Series. Title"
+        if '(' in filename:
+            # Есть скобки - скорее всего "Author. Title (Series)" паттерн, пропускаем
+            return ""
+
+        _, _, rest = filename.partition('. ')
+        series, sep, _ = rest.partition('. ')
+        if sep:
+            # Вторая часть должна быть Series
+            series = series.strip()
+            # Удаляем trailing число (том/выпуск) из серии
+            # "Негоциант 2" -> "Негоциант"
+            series = _TRAILING_NUMBER_RE.sub('', series).strip()
+            return series
+        return ""
+    
+    def _config_series_from_brackets(self, filename: str) -> str:
+        """Паттерны с серией в первых скобках имени файла."""
+        # "Земляной Андрей, Орлов Борис - Академик (Странник 4-5)"
+        # "Демченко. Хольмградские истории (Хольмградские истории. Трилогия)"
+        # "Зурков, Черепнев. Бешеный прапорщик (Бешеный прапорщик 1-3)"
+        # Извлекаем Series из скобок
+        match = _PARENS_CONTENT_RE.search(filename)
+        if match:
+            content_in_brackets = match.group(1).strip()
+            return self._extract_series_from_brackets(content_in_brackets)
+        return ""
+    
+    def _config_series_before_numbered_title(self, filename: str) -> str:
+        """Паттерн "Author - Series service_words. Title": серия перед "N. Title"."""
+        # "Игнатов Михаил - Путь 10. Защитник. Второй пояс (СИ)"
+        # Извлекаем Series между " - " и номером
+        # Паттерн: Author - Series Number. Title
+        # ВАЖНО: Требуем пробелы ДО дефиса чтобы не совпасть с дефисом в серии
+        # "Сердитый, Бирюков. Человек-саламандра 1" не должен совпасть
+        # (здесь дефис без пробела перед ним)
+        match = _AUTHOR_SERIES_NUM_DOT_RE.match(filename)
+        if match:
+            series = match.group(2).strip()
+            return series
         return ""
     
     def _extract_main_series_from_multi_level(self, content: str) -> str:
@@ -3131,10 +3326,6 @@ class Pass2SeriesFilename:
         if not content:
             return ""
         
-        # Служебные слова, которые обозначают конец иерархии серий
-        # Используем \b для границ слов, чтобы не путать "Серия Альфа" со служебным "Серия"
-        service_words_pattern = r'\b(?:Дилогия|Трилогия|Тетралогия|Пентагония|внецикл|дополнение|прелюдия|эпилог)\b'
-        
         # Если контент уже содержит '\' (результат BlockLevelPatternMatcher с SubSeries),
         # разбиваем по '\', а каждый компонент дополнительно чистим от номеров через '. '.
         # Иначе разбиваем по '. ' как обычно.
@@ -3142,7 +3333,7 @@ class Pass2SeriesFilename:
             raw_parts = []
             for chunk in content.split('\\'):
                 # Внутри компонента может быть ". " — берём только первую часть (до точки)
-                sub = chunk.split('. ')[0].strip()
+                sub = chunk.partition('. ')[0].strip()
                 if sub:
                     raw_parts.append(sub)
             parts = raw_parts
@@ -3165,7 +3356,7 @@ class Pass2SeriesFilename:
             
             # Проверяем, содержит ли эта часть служебные слова
             # Если содержит - это КОНЕЦ иерархии, не добавляем дальше
-            if re.search(service_words_pattern, part, flags=re.IGNORECASE):
+            if _HIERARCHY_END_WORDS_RE.search(part):
                 # Может быть, это последняя часть с номерами и служебными словами
                 # Попытаемся извлечь имя серии перед служебным словом
                 # "Дилогия + внецикл" - не содержит имена серии, пропускаем
@@ -3174,14 +3365,10 @@ class Pass2SeriesFilename:
             
             # Ищем только последовательность чисел/диапазонов в конце
             # Удаляем числа, но НЕ служебные слова (они должны остановить процесс)
-            series_name = re.sub(
-                r'\s*[\d\-\,\–]+\s*$',  # Только числа/диапазоны в конце
-                '',
-                part
-            ).strip()
+            series_name = _NUM_LIST_TAIL_RE.sub('', part).strip()  # Только числа/диапазоны в конце
             
             # Дополнительно удаляем "№ N" или одиночный "№" в конце
-            series_name = re.sub(r'\s*№\s*\d*\s*$', '', series_name).strip()
+            series_name = _NUMERO_TAIL_RE.sub('', series_name).strip()
             
             # Однобуквенные компоненты — это части аббревиатуры (напр. «О. Р. З.»), а не уровни серии.
             # Сбрасываем всю иерархию, чтобы не собирать мусор вида «Р\или Сказ...»
@@ -3218,59 +3405,54 @@ class Pass2SeriesFilename:
         
         # Сначала попробуем паттерн "из цикла" или "из серии"
         # "Романы из цикла «Отрок»" → "Отрок"
-        cycle_match = re.search(r'из\s+(?:цикла|серии)\s+(.+)', content, re.IGNORECASE)
+        cycle_match = _FROM_CYCLE_RE.search(content)
         if cycle_match:
             series_candidate = cycle_match.group(1).strip()
-            # Удаляем внешние кавычки
-            open_count = series_candidate.count('«')
-            close_count = series_candidate.count('»')
-            
-            if (open_count > 0 and open_count == close_count and 
-                series_candidate.startswith('«') and series_candidate.endswith('»')):
-                series_candidate = series_candidate[1:-1]
-            elif open_count > close_count and series_candidate.startswith('«'):
-                series_candidate = series_candidate[1:]
+            # Удаляем внешние кавычки (считать « » нужно только если строка с них начинается)
+            if series_candidate.startswith('«'):
+                open_count = series_candidate.count('«')
+                close_count = series_candidate.count('»')
+
+                if open_count == close_count and series_candidate.endswith('»'):
+                    series_candidate = series_candidate[1:-1]
+                elif open_count > close_count:
+                    series_candidate = series_candidate[1:]
                 
             return series_candidate.strip()
         
         # Если есть точка - берем до неё (это Series. service_words)
         if '. ' in content:
-            parts = content.split('. ')
-            after_dot = parts[1].strip() if len(parts) > 1 else ''
+            part0, _, rest = content.partition('. ')
+            after_dot, sep, last_part = rest.partition('. ')
+            after_dot = after_dot.strip()
             after_dot_lower = after_dot.lower()
             
             # Проверка служебных слов + blacklist + collection_keywords
             # "Мир Алекса Королёва. Сборник" → after_dot="сборник" → берём "Мир Алекса Королёва"
-            all_check_words = self.service_words + self.filename_blacklist + self.collection_keywords
-            is_service_word = any(
-                after_dot_lower.startswith(sw.lower()) 
-                for sw in all_check_words
-            )
+            is_service_word = after_dot_lower.startswith(self._check_words_lower)
             
             if is_service_word:
-                return parts[0].strip()
+                return part0.strip()
             
             # ИЕРАРХИЧЕСКАЯ СЕРИЯ: "Отрок 2. Сотник 1-3"
             # Признаки: parts[0] = "Слова Число", parts[1] = "Слова Число/Диапазон"
             # → это главная серия + подсерия → возвращаем parts[0] КАК ЕСТЬ (с номером тома!)
             # Отличие от обычного случая: after_dot начинается с заглавной буквы (имя подсерии)
             # и содержит число или диапазон
-            part0 = parts[0].strip()
-            # parts[0] заканчивается числом: "Отрок 2", "Серия 5"
-            part0_has_trailing_num = bool(re.search(r'\s+\d+\s*$', part0))
-            # parts[1] начинается с заглавной буквы и содержит число: "Сотник 1-3", "Книга 2"
+            part0 = part0.strip()
+            # part0 заканчивается числом: "Отрок 2", "Серия 5"
+            part0_has_trailing_num = bool(_TRAILING_NUMBER_RE.search(part0))
+            # after_dot начинается с заглавной буквы и содержит число: "Сотник 1-3", "Книга 2"
             after_dot_is_subseries = (
                 after_dot and
                 after_dot[0].isupper() and
-                bool(re.search(r'\d', after_dot))
+                bool(_DIGIT_RE.search(after_dot))
             )
             
             # Доп. признак: последняя часть — служебное слово (Тетралогия, Трилогия…)
-            # «Мир Вечного 2. Вечный. Тетралогия» → parts[-1]="Тетралогия" → service word
-            all_check_words_lower = [w.lower() for w in self.service_words + self.filename_blacklist + self.collection_keywords]
-            last_part_is_service = (
-                len(parts) > 2 and
-                any(parts[-1].strip().lower().startswith(w) for w in all_check_words_lower)
+            # «Мир Вечного 2. Вечный. Тетралогия» → последняя часть "Тетралогия" → service word
+            last_part_is_service = bool(sep) and (
+                last_part.rpartition('. ')[2].strip().lower().startswith(self._check_words_lower)
             )
 
             if part0_has_trailing_num and (after_dot_is_subseries or last_part_is_service):
@@ -3284,8 +3466,6 @@ class Pass2SeriesFilename:
         # НОВОЕ: Если есть service word в конце БЕЗ точки
         # "Я иду искать! Тетралогия" -> "Я иду искать!"
         # "Демон 1-3" -> "Демон"
-        # service_markers используются для проверки последнего слова
-        service_markers = self.service_words
         
         # Ищём service words в конце контента (отделённые пробелом или в начале слова)
         # "Я иду искать! Тетралогия" -> parts = ["Я иду искать!", "Тетралогия"]
@@ -3295,14 +3475,10 @@ class Pass2SeriesFilename:
             last_word_lower = words[-1].lower()
             
             # Проверяем, является ли последнее слово service word
-            is_last_service_word = any(
-                last_word_lower.startswith(sw.lower()) or 
-                last_word_lower == sw.lower()
-                for sw in self.service_words
-            )
+            is_last_service_word = last_word_lower.startswith(self._service_words_lower)
             
             # Или это диапазон номеров
-            is_numeric_range = bool(re.match(r'^\d+[-–—]\d+$', words[-1]))
+            is_numeric_range = bool(_NUMERIC_RANGE_RE.match(words[-1]))
             
             if is_last_service_word or is_numeric_range:
                 # Возьмём все слова кроме последнего
@@ -3311,7 +3487,7 @@ class Pass2SeriesFilename:
                     return series_candidate
         
         # Если есть числовой диапазон (1-3, 4-6), берем до него
-        series_candidate = re.sub(r'\s*[\d\-]+\s*$', '', content).strip()
+        series_candidate = _NUM_DASH_TAIL_RE.sub('', content).strip()
         
         return series_candidate if series_candidate else ""
     
@@ -3337,27 +3513,19 @@ class Pass2SeriesFilename:
 
         # Если текст начинается с collection_keyword (например "Сборник авторов"),
         # весь блок — маркер коллекции, не название серии — отвергаем целиком.
-        for kw in (self.collection_keywords or []):
-            if text_lower.startswith(kw.lower()):
-                return ""
+        if text_lower.startswith(self._collection_keywords_lower):
+            return ""
 
         original_text = text
 
         # Проходим по каждому слову в blacklist
-        for bl_word in self.filename_blacklist:
-            bl_word_lower = bl_word.lower().strip()
-            if not bl_word_lower:
-                continue
-            
-            # Ищем это слово как целое слово (не substring)
-            # Паттерн: слово с границами (пробелы, скобки, пунктуация)
-            import re
-            pattern = r'(?:^|\s|\(|-)' + re.escape(bl_word_lower) + r'(?:\s|\)|$|[,.\-\!?])'
-
+        # Ищем это слово как целое слово (не substring) —
+        # регулярки с границами (пробелы, скобки, пунктуация) собраны в __init__
+        for bl_re in self._bl_remove_res:
             # Перед удалением: если blacklist-слово стоит перед именами собственными
             # (все слова после него с заглавной буквы), это профессиональный префикс —
             # не удаляем. Пример: «Детектив Джейкоб Лев» — не трогаем.
-            _m = re.search(pattern, original_text, flags=re.IGNORECASE)
+            _m = bl_re.search(original_text)
             if _m:
                 _after = original_text[_m.end():].strip()
                 _alpha_after = [w for w in _after.split() if w and w[0].isalpha()]
@@ -3365,21 +3533,16 @@ class Pass2SeriesFilename:
                     continue  # Не удаляем: профессиональный префикс перед именами
 
             # Заменяем найденные вхождения на пробел (или пусто)
-            original_text = re.sub(
-                pattern,
-                ' ',
-                original_text,
-                flags=re.IGNORECASE
-            )
+            original_text = bl_re.sub(' ', original_text)
         
         # Очищаем множественные пробелы и пустые скобки
-        cleaned = re.sub(r'\s+', ' ', original_text).strip()
-        cleaned = re.sub(r'\(\s*\)', '', cleaned).strip()
+        cleaned = _WS_RUN_RE.sub(' ', original_text).strip()
+        cleaned = _EMPTY_PARENS_RE.sub('', cleaned).strip()
         # Убираем висячие (несбалансированные) скобки в конце строки.
         # Пример: "Серия (СИ" → "Серия" (открытая скобка без закрытой)
         # НЕ трогаем: "Серия (Крылов)" — скобки сбалансированы
         if cleaned.count('(') != cleaned.count(')'):
-            cleaned = re.sub(r'\s*[\(\)]\s*$', '', cleaned).strip()
+            cleaned = _DANGLING_PAREN_RE.sub('', cleaned).strip()
         
         return cleaned if cleaned else ""
 
@@ -3417,7 +3580,25 @@ class Pass2SeriesFilename:
         
         return False
     
+    def _author_name_info(self, text: str) -> tuple:
+        """(is_valid, normalized or raw_name) для AuthorName(text) с кэшем по тексту."""
+        info = self._author_name_info_cache.get(text)
+        if info is None:
+            author = AuthorName(text)
+            info = (author.is_valid, author.normalized or author.raw_name)
+            self._author_name_info_cache[text] = info
+        return info
+
     def _is_valid_series(self, text: str, extracted_author: str = None, skip_author_check: bool = False) -> bool:
+        """_is_valid_series_uncached() с кэшем по аргументам."""
+        key = (text, extracted_author, skip_author_check)
+        result = self._valid_series_cache.get(key)
+        if result is None:
+            result = self._is_valid_series_uncached(text, extracted_author, skip_author_check)
+            self._valid_series_cache[key] = result
+        return result
+
+    def _is_valid_series_uncached(self, text: str, extracted_author: str = None, skip_author_check: bool = False) -> bool:
         """
         Проверить что text выглядит как название серии, не как другое.
         Проверяет против:
@@ -3447,8 +3628,7 @@ class Pass2SeriesFilename:
         # Год со знаком тире в конце (после снятия кавычек) — тоже признак номинации/премии
         # ИСКЛЮЧЕНИЕ: дефис БЕЗ пробела как часть составного слова (СССР-2023 — не премия).
         # Отвергаем только: пробел перед любым тире, или длинное тире (– —) без пробела.
-        if re.search(r'\s[–—\-]\s*\d{4}\s*[»"\']*\s*$', text) or \
-           re.search(r'[–—]\s*\d{4}\s*[»"\']*\s*$', text):
+        if _SPACED_DASH_YEAR_TAIL_RE.search(text) or _LONG_DASH_YEAR_TAIL_RE.search(text):
             return False
 
         # ПРОВЕРКА -0.5: Исключить иерархические серии где любой сегмент — одна буква.
@@ -3464,19 +3644,19 @@ class Pass2SeriesFilename:
         # Или: это только цифры + буквы без полноценного названия (< 3 букв)
         
         # Случай 1: ".NN" или ",NN" (калибр оружия)
-        if re.match(r'^[.,]\d+$', text_lower):
+        if _CALIBER_RE.match(text_lower):
             return False
         
         # Случай 2: чистые цифры с единицами вроде "9mm", "45acp"
         # (более 2 букв после цифр - это "real words", менее 2 букв это техника)
-        if re.match(r'^\d+[a-z]{1,2}$', text_lower):
+        if _DIGITS_UNIT_RE.match(text_lower):
             return False
         
         # Случай 3: только цифры и 1-3 символа (вроде ".45" → "45", ".357" → "357")
         # Это вероятный калибр оружия, а не серия
         # Но берем осторожно - "99" может быть реальная серия
         # Поэтому отвергаем ТОЛЬКО если это 1-2 символа (как "45", "9", "357" = 3 цифры-это OK на грани)
-        if re.match(r'^\d{1,2}$', text_lower):
+        if _ONE_TWO_DIGITS_RE.match(text_lower):
             return False
         
         # ПРОВЕРКА 1: filename_blacklist - запрещенные слова
@@ -3493,15 +3673,13 @@ class Pass2SeriesFilename:
             _comma_parts = [p.strip() for p in text_lower.split(',')]
             # Применяем только когда каждая часть — ≤2 слова (перечень, не «X, или Y»)
             if _comma_parts and all(len(p.split()) <= 2 for p in _comma_parts if p):
-                _bl_lower_set = {bl.lower() for bl in self.filename_blacklist}
-                if any(p in _bl_lower_set for p in _comma_parts if p):
+                if any(p in self._blacklist_lower_set for p in _comma_parts if p):
                     return False
 
-        for bl_word in self.filename_blacklist:
-            bl_word_lower = bl_word.lower()
+        bl_found = self._bl_boundary_any_re is not None and self._bl_boundary_any_re.search(text_lower)
+        for bl_word_lower, bl_re in (self._bl_boundary_res if bl_found else ()):
             # Match bl_word as a whole word or at word boundary
-            pattern = r'(?:^|\s|\(|-)' + re.escape(bl_word_lower) + r'(?:\s|\)|$)'
-            if re.search(pattern, text_lower):
+            if bl_re.search(text_lower):
                 # Если это ТОЛЬКО blacklist word (например "СССР" или "СССР по категориям"),
                 # отвергаем. Но если есть реальные слова ПЕРЕД ним, это series.
                 # Пример: "Последний солдат СССР" ← реальная series даже если СССР в blacklist
@@ -3547,9 +3725,8 @@ class Pass2SeriesFilename:
         # ПРОВЕРКА 2: Исключить очевидные сборники/антологии
         # Эти фразы обычно многословные (сборник, антология, коллекция)
         # поэтому substring check более безопасен
-        for keyword in self.collection_keywords:
-            if keyword.lower() in text_lower:
-                return False
+        if self._collection_keywords_re is not None and self._collection_keywords_re.search(text_lower):
+            return False
         
         # ПРОВЕРКА 3: Исключить сервис-слова (том, книга, выпуск)
         # ВАЖНО: Отвергаем ТОЛЬКО если это просто service_word или service_word + число!
@@ -3557,36 +3734,30 @@ class Pass2SeriesFilename:
         # 
         # Примеры что отвергаем ("том 1", "выпуск", "книга 3", "цикл")
         # Примеры что СОХРАНЯЕМ ("Цикл Скорпиона", "Том Риддл", "Серия Огня")
-        for service_word in self.service_words:
-            service_word_lower = service_word.lower()
-            words = text_lower.split()
-            
-            if not words:
-                continue
-            
+        words = text_lower.split()
+        if words:
             first_word = words[0]
             
-            # 1. Отвергаем если текст это РОВНО service_word ("том", "выпуск")
-            if first_word == service_word_lower and len(words) == 1:
-                return False
-            
-            # 2. Отвергаем если это service_word + число ("том 1", "выпуск 5", "книга 2")
-            if first_word == service_word_lower and len(words) >= 2:
+            if first_word in self._service_words_set:
+                # 1. Отвергаем если текст это РОВНО service_word ("том", "выпуск")
+                if len(words) == 1:
+                    return False
+                
+                # 2. Отвергаем если это service_word + число ("том 1", "выпуск 5", "книга 2")
                 second_word = words[1]
                 # Проверяем что второе слово это число, римская цифра или "и" (для "и т.д.")
-                if re.match(r'^\d+$', second_word) or \
-                   re.match(r'^[IVX]+$', second_word, re.IGNORECASE) or \
+                if _DIGITS_ONLY_RE.match(second_word) or \
+                   _ROMAN_NUMERAL_RE.match(second_word) or \
                    second_word in ['и', '-']:
                     return False
             
             # 3. Специальная проверка для однобуквенных сокращений типа "т."
             # Отвергаем "т. 1" или "т. " но не "т.сервис-слово-другое"
-            if len(service_word_lower) == 1:
-                if text_lower.startswith(service_word_lower + '.'):
-                    # Это может быть "т. 1" или просто "т."
-                    remainder = text_lower[2:].strip()
-                    if not remainder or re.match(r'^\d+', remainder):
-                        return False
+            if self._service_abbrevs and text_lower.startswith(self._service_abbrevs):
+                # Это может быть "т. 1" или просто "т."
+                remainder = text_lower[2:].strip()
+                if not remainder or _LEADING_DIGITS_RE.match(remainder):
+                    return False
         
         # ПРОВЕРКА 4: Убедиться что это НЕ похоже на автора!
         # Если skip_author_check=True - пропускаем эту проверку
@@ -3597,20 +3768,16 @@ class Pass2SeriesFilename:
             # и у нас есть информация об авторе - нет смысла отвергать series
             # только потому что она выглядит как фамилия (может быть совпадение)
             try:
-                author = AuthorName(text)
-                if author.is_valid:
+                is_author, text_as_author_normalized = self._author_name_info(text)
+                if is_author:
                     # Это похоже на валийного автора... но есть ли контекст?
                     if extracted_author:
                         # У нас есть информация об извлечённом авторе
                         # Пропускаем проверку на автора если text отличается от автора
                         # "Охотник" != "Янковский Дмитрий" → это не автор, это серия
                         try:
-                            extracted_author_obj = AuthorName(extracted_author)
-                            extracted_author_normalized = extracted_author_obj.normalized or extracted_author_obj.raw_name
-                            
-                            # Нормализуем text как если бы это был автор
-                            text_as_author_obj = AuthorName(text)
-                            text_as_author_normalized = text_as_author_obj.normalized or text_as_author_obj.raw_name
+                            # text как автор уже нормализован выше
+                            extracted_author_normalized = self._author_name_info(extracted_author)[1]
                             
                             # Если normalized версии совпадают - это один и тот же автор
                             if extracted_author_normalized != text_as_author_normalized:
@@ -3654,13 +3821,22 @@ class Pass2SeriesFilename:
                 # "Серия. Название" → "Серия"
                 # Извлекаем всё перед первой точкой + пробелом
                 if '. ' in text:
-                    series = text.split('. ')[0].strip()
+                    series = text.partition('. ')[0].strip()
                     if series:
                         return series
         
         return text
     
     def _clean_series_name(self, text: str, keep_trailing_number: bool = False) -> str:
+        """_clean_series_name_uncached() с кэшем по аргументам."""
+        key = (text, keep_trailing_number)
+        result = self._clean_series_cache.get(key)
+        if result is None:
+            result = self._clean_series_name_uncached(text, keep_trailing_number)
+            self._clean_series_cache[key] = result
+        return result
+
+    def _clean_series_name_uncached(self, text: str, keep_trailing_number: bool = False) -> str:
         """
         Очистить название серии от паразитных символов и информации:
         - Номера томов: "Солдат удачи 1", "Солдат удачи 2. Название"
@@ -3686,25 +3862,25 @@ class Pass2SeriesFilename:
         
         # Правило -2: Удалить обрамляющие кавычки-ёлочки «» — они обозначают серию в имени файла,
         # но не должны быть частью итогового названия: «СССР-2023» → СССР-2023
-        text = re.sub(r'^«\s*', '', text).strip()
-        text = re.sub(r'\s*»$', '', text).strip()
+        text = _LEADING_GUILLEMET_RE.sub('', text).strip()
+        text = _TRAILING_GUILLEMET_RE.sub('', text).strip()
         if not text:
             return original
         
         # Правило -1: Удалить ведущий дефис/тире (артефакт разбиения по ". " в паттернах "Author - Series")
         # Пример: "- Сказания Тремейна" → "Сказания Тремейна"
-        text = re.sub(r'^[-–—]\s*', '', text).strip()
+        text = _LEADING_DASH_RE.sub('', text).strip()
         if not text:
             return ""
         
         # Правило 0: Удалить скобки с информацией в конце
         # "(к-во, год, описание)" → убрать
-        text = re.sub(r'\s*\([^)]*\)\s*$', '', text).strip()
+        text = _TRAILING_PARENS_RE.sub('', text).strip()
         
         # Правило 1: Удалить всё после "номер. слова" (объективное)
         # Паттерн: "слова цифра. слова" → берем только "слова"
         # НЕ трогать: "Цивилизация 2.0 1. Выбор пути" — "2" здесь часть версии "2.0"
-        match = re.match(r'^(.+?)\s+\d+(?!\.\d)[\.\:]\s+.+$', text)
+        match = _SERIES_NUM_TITLE_RE.match(text)
         if match:
             text = match.group(1).strip()
 
@@ -3713,36 +3889,36 @@ class Pass2SeriesFilename:
             # Паттерны: "Серия 1", "Серия 2", "Серия (том) 3", и т.д.
             # Удаляем: пробел + одна или две цифры + конец
             # НЕ трогать: "Цивилизация 2.0" — "0" идёт после ".", не отдельное число
-            text = re.sub(r'(?<!\.)\s+\d{1,2}\s*$', '', text).strip()
+            text = _SHORT_NUM_TAIL_RE.sub('', text).strip()
             
             # Правило 2B: Удалить "№ N" или просто "№" в конце
             # "Смертельный аромат № 5" → "Смертельный аромат"
             # "Смертельный аромат №5" → "Смертельный аромат"
             # "Смертельный аромат №" → "Смертельный аромат"
-            text = re.sub(r'\s*№\s*\d*\s*$', '', text).strip()
+            text = _NUMERO_TAIL_RE.sub('', text).strip()
             
             # Правило 3: Удалить всё после "номер " (менее строгое)
             # Паттерн: "слова цифра слова" → берем только "слова"
-            match = re.match(r'^(.+?)\s+\d+\s+.+$', text)
+            match = _SERIES_NUM_WORDS_RE.match(text)
             if match:
                 text = match.group(1).strip()
         
         # Правило 4: Удалить служебные слова в скобках
         # "Серия (Трилогия)" → "Серия"
-        text = re.sub(r'\s*\([^)]+\)\s*$', '', text).strip()
+        text = _TRAILING_PARENS_NONEMPTY_RE.sub('', text).strip()
         
         # Правило 5: Удалить служебные слова в конце (простые, без скобок)
         # После серии часто идут: "- Трилогия", "- Цикл", и т.д.
-        for service_word in self.service_words:
-            # ВАЖНО: Используем \b для word boundary чтобы не удалять буквы из конца слова
-            # Пример: НЕ удаляем "т" из "Адъютант" даже если "т" в service_words
-            pattern = r'\s*[\-–—]?\s*\b' + re.escape(service_word) + r'\b\s*$'
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE).strip()
+        # ВАЖНО: \b (word boundary) чтобы не удалять буквы из конца слова
+        # Пример: НЕ удаляем "т" из "Адъютант" даже если "т" в service_words
+        if self._service_tail_any_re is not None and self._service_tail_any_re.search(text):
+            for service_tail_re in self._service_tail_res:
+                text = service_tail_re.sub('', text).strip()
         
         # Правило 6: Повторно удалить обрамляющие кавычки-ёлочки после всех остальных правил
         # Случай: «СССР-2023» 2 → strip « → СССР-2023» 2 → strip number → СССР-2023» → strip »
-        text = re.sub(r'^«\s*', '', text).strip()
-        text = re.sub(r'\s*»$', '', text).strip()
+        text = _LEADING_GUILLEMET_RE.sub('', text).strip()
+        text = _TRAILING_GUILLEMET_RE.sub('', text).strip()
 
         # Правило 7: Удалить завершающую одиночную точку
         # "Араб." → "Араб"  (метатег в FB2 может содержать точку в конце)
@@ -3766,8 +3942,8 @@ class Pass2SeriesFilename:
             True если тексты совпадают с достаточной точностью
         """
         # Очистить от пунктуации и привести к нижнему регистру
-        clean1 = re.sub(r'[^\w\s]', '', text1).lower().strip()
-        clean2 = re.sub(r'[^\w\s]', '', text2).lower().strip()
+        clean1 = _normalize_for_compare(text1)
+        clean2 = _normalize_for_compare(text2)
         
         if not clean1 or not clean2:
             return False
@@ -3780,17 +3956,15 @@ class Pass2SeriesFilename:
         if clean1 in clean2 or clean2 in clean1:
             return True
         
-        # Проверить используя Levenshtein distance (приблизительное совпадение)
-        # Если совпадает > tolerance % символов
-        max_len = max(len(clean1), len(clean2))
-        if max_len == 0:
-            return False
-        
-        # Простой подсчет: совпадающие символы / длина более длинной строки
-        matches = sum(1 for a, b in zip(clean1, clean2) if a == b)
-        similarity = matches / max_len
-        
-        return similarity >= tolerance
+        # Приблизительное совпадение: доля общих символов с учётом вставок/пропусков
+        # (SequenceMatcher.ratio). Дешёвые верхние оценки отсекают заведомо
+        # далёкие строки без полного сравнения.
+        matcher = SequenceMatcher(None, clean1, clean2)
+        return (
+            matcher.real_quick_ratio() >= tolerance
+            and matcher.quick_ratio() >= tolerance
+            and matcher.ratio() >= tolerance
+        )
     
     def _is_hierarchical_series(self, text: str) -> bool:
         """
@@ -3812,9 +3986,18 @@ class Pass2SeriesFilename:
         """
         # Этот метод — заглушка, реальная логика в _extract_series_from_brackets
         # который возвращает результат с флагом через специальный маркер
-        return bool(re.match(r'^.+\s+\d+$', text.strip()))
+        return bool(_SPACE_NUMBER_END_RE.match(text.strip()))
 
     def _is_author_surname(self, series_candidate: str, author: str) -> bool:
+        """_is_author_surname_uncached() с кэшем по аргументам."""
+        key = (series_candidate, author)
+        result = self._author_surname_cache.get(key)
+        if result is None:
+            result = self._is_author_surname_uncached(series_candidate, author)
+            self._author_surname_cache[key] = result
+        return result
+
+    def _is_author_surname_uncached(self, series_candidate: str, author: str) -> bool:
         """
         Проверить что extracted series это не просто фамилия автора.
         
@@ -3839,7 +4022,7 @@ class Pass2SeriesFilename:
             return False
         
         series_lower = series_candidate.lower()
-        series_normalized = re.sub(r'[^\w]', '', series_lower)
+        series_normalized = _NON_WORD_RE.sub('', series_lower)
         
         # Проверяем полное совпадение: серия == полное имя автора
         # Пример: "Александрова Наталья" == "Александрова Наталья" → True
@@ -3849,7 +4032,7 @@ class Pass2SeriesFilename:
         # Проверяем КАЖДУЮ часть автора (может быть "Фамилия Имя" или "Имя Фамилия")
         for part in author_parts:
             part_lower = part.lower()
-            part_normalized = re.sub(r'[^\w]', '', part_lower)
+            part_normalized = _NON_WORD_RE.sub('', part_lower)
             
             # Точное совпадение целой части (например: "Белоус" = "Белоус")
             if part_normalized == series_normalized:
@@ -3860,10 +4043,10 @@ class Pass2SeriesFilename:
             if '.' in series_lower:
                 # Извлекаем последний слог после крайней точки  (А. → А, В.К. → К, Белоус → Белоус)
                 # Разбиваем по точке и берем последнюю часть, которая содержит кириллицу
-                match = re.search(r'([А-Яа-яЁё]+)\.?$', series_lower)
+                match = _CYR_WORD_TAIL_RE.search(series_lower)
                 if match:
-                    surname_part = match.group(1).lower()
-                    surname_part_normalized = re.sub(r'[^\w]', '', surname_part)
+                    # Группа — только кириллические буквы из series_lower: уже нормализована
+                    surname_part_normalized = match.group(1)
                     
                     # Проверяем, совпадает ли эта часть с частью автора
                     if part_normalized == surname_part_normalized:
@@ -4047,7 +4230,7 @@ class Pass2SeriesFilename:
         has_brackets = '(' in filename and ')' in filename
         if pattern == 'Author - Series (service_words)' and has_brackets:
             # Проверяем что находится в скобках - берем ПЕРВУЮ пару скобок, не последнюю
-            bracket_match = re.search(r'\(([^)]+)\)(?:\s*\(|\s*$)', filename)
+            bracket_match = _PARENS_GROUP_RE.search(filename)
             if bracket_match:
                 bracket_content = bracket_match.group(1).strip().lower()
                 
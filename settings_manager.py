@@ -35,6 +35,8 @@ class SettingsManager:
                 'enable_caching': True,  # Enable metadata caching
                 'max_cache_age_days': 30,  # Cache validity period
                 'use_sax_parser': True,  # Use SAX parser by default (faster)
+                'debug_logging': False,  # Per-record diagnostic logs in PASS stages
+                'parallel_match_threshold': 2000,  # PASS 2: min distinct filenames for process pool (0 = off)
             }
         }
         self._loaded_settings = None  # Для отслеживания оригинальных значений